@@ -0,0 +1,96 @@
+"""Producer/consumer throughput of `ConcurrentDeque` against `queue.Queue` and a
+polled `collections.deque`.
+
+    python -m benchmarks.concurrent_deque [items] [threads]
+"""
+from __future__ import annotations
+
+import collections
+import queue
+import sys
+import threading
+import time
+import typing
+
+from data_structures.concurrent_deque import ConcurrentDeque
+
+_DONE = None
+
+
+def _measure(
+    put: typing.Callable[[typing.Any], None],
+    consume: typing.Callable[[], None],
+    items: int,
+    threads: int,
+) -> float:
+    def produce() -> None:
+        for value in range(items // threads):
+            put(value)
+
+    producers = [threading.Thread(target=produce) for _ in range(threads)]
+    consumers = [threading.Thread(target=consume) for _ in range(threads)]
+
+    started = time.perf_counter()
+    for thread in producers + consumers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        put(_DONE)
+    for thread in consumers:
+        thread.join()
+    return items / (time.perf_counter() - started)
+
+
+def _concurrent_deque(items: int, threads: int, batch: typing.Optional[int]) -> float:
+    work: ConcurrentDeque[typing.Any] = ConcurrentDeque()
+
+    def consume() -> None:
+        while True:
+            values = [work.pop()] if batch is None else work.drain(batch, block=True)
+            if _DONE in values:
+                # Hand back anything taken after our sentinel.
+                for value in values[values.index(_DONE) + 1 :]:
+                    work.push(value)
+                return
+
+    return _measure(work.append, consume, items, threads)
+
+
+def _queue(items: int, threads: int) -> float:
+    work: queue.Queue[typing.Any] = queue.Queue()
+
+    def consume() -> None:
+        while work.get() is not _DONE:
+            pass
+
+    return _measure(work.put, consume, items, threads)
+
+
+def _deque(items: int, threads: int) -> float:
+    work: collections.deque[typing.Any] = collections.deque()
+
+    def consume() -> None:
+        while True:
+            try:
+                if work.popleft() is _DONE:
+                    return
+            except IndexError:
+                time.sleep(0)
+
+    return _measure(work.append, consume, items, threads)
+
+
+def main(items: int = 200_000, threads: int = 4) -> None:
+    cases: list[tuple[str, typing.Callable[[], float]]] = [
+        ("ConcurrentDeque.pop", lambda: _concurrent_deque(items, threads, None)),
+        ("ConcurrentDeque.drain(64)", lambda: _concurrent_deque(items, threads, 64)),
+        ("queue.Queue", lambda: _queue(items, threads)),
+        ("collections.deque (polled)", lambda: _deque(items, threads)),
+    ]
+    for name, run in cases:
+        print(f"{name:>28}: {run():>10,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,72 @@
+"""Bytes per edge of `AdjacencyList`, against the previous one-object-per-edge layout.
+
+    python -m benchmarks.graph_memory [vertices] [edges]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import tracemalloc
+import typing
+
+from data_structures.graph import AdjacencyList
+
+
+class _LegacyEdge(tuple):
+    """The edge layout used before the columnar storage: a tuple that also keeps
+    its items in an instance `__dict__`."""
+
+    def __new__(cls, source: typing.Any, destination: typing.Any, weight: float):
+        return tuple.__new__(cls, (source, destination, weight))
+
+    def __init__(self, source: typing.Any, destination: typing.Any, weight: float):
+        self.source = source
+        self.destination = destination
+        self.weight = weight
+
+
+def _legacy(edges: list[tuple[int, int, float]]) -> dict[int, list[_LegacyEdge]]:
+    adjacency: dict[int, list[_LegacyEdge]] = {}
+    for source, destination, weight in edges:
+        adjacency.setdefault(destination, [])
+        adjacency.setdefault(source, []).append(
+            _LegacyEdge(source, destination, weight)
+        )
+    return adjacency
+
+
+def _columnar(edges: list[tuple[int, int, float]]) -> AdjacencyList[int]:
+    graph: AdjacencyList[int] = AdjacencyList(directed=True)
+    graph.add_edges(edges)
+    return graph
+
+
+def _measure(build: typing.Callable[[], typing.Any]) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        graph = build()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del graph
+    return size
+
+
+def main(vertices: int = 10_000, edge_count: int = 200_000) -> None:
+    rng = random.Random(0)
+    edges = [
+        (rng.randrange(vertices), rng.randrange(vertices), float(rng.randint(1, 100)))
+        for _ in range(edge_count)
+    ]
+
+    for name, build in (
+        ("per-edge objects", lambda: _legacy(edges)),
+        ("columnar arrays", lambda: _columnar(edges)),
+    ):
+        size = _measure(build)
+        print(f"{name:>18}: {size / 2**20:8.1f} MiB, {size / edge_count:6.1f} B/edge")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
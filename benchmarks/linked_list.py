@@ -0,0 +1,35 @@
+"""Reverse iteration, in-place reversal and draining from the tail of a
+`SinglyLinkedList`.
+
+    python -m benchmarks.linked_list
+"""
+from __future__ import annotations
+
+import time
+import typing
+
+from data_structures.linked_lists import SinglyLinkedList
+
+
+def _time(operation: typing.Callable[[], typing.Any]) -> float:
+    started = time.perf_counter()
+    operation()
+    return time.perf_counter() - started
+
+
+def _drain(items: SinglyLinkedList[int]) -> None:
+    while items:
+        items.remove_last()
+
+
+def main(sizes: typing.Iterable[int] = (10**5, 10**6)) -> None:
+    for size in sizes:
+        items = SinglyLinkedList(range(size))
+        print(f"n={size:>9,}")
+        print(f"  reversed():    {_time(lambda: list(reversed(items))):7.3f}s")
+        print(f"  reverse():     {_time(items.reverse):7.3f}s")
+        print(f"  remove_last(): {_time(lambda: _drain(items)):7.3f}s (all n)")
+
+
+if __name__ == "__main__":
+    main()
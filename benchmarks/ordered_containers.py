@@ -0,0 +1,89 @@
+"""Mixed read/write throughput of `SkipList`, `AVL` and `BinarySearchTree` with
+threads: one writer inserting and removing random values, several readers doing
+membership tests. The trees are guarded by one lock shared by readers and the
+writer. `SkipList(concurrent=True)` only locks the writer.
+
+    python -m benchmarks.ordered_containers [readers] [seconds]
+"""
+from __future__ import annotations
+
+import contextlib
+import random
+import sys
+import threading
+import time
+import typing
+
+from data_structures.adelson_velsky_landis import AVL
+from data_structures.binary_search_tree import BinarySearchTree
+from data_structures.skip_list import SkipList
+
+
+def _run(
+    container: typing.Any,
+    reader_lock: typing.ContextManager[typing.Any],
+    writer_lock: typing.ContextManager[typing.Any],
+    readers: int,
+    seconds: float,
+    size: int,
+) -> tuple[int, int]:
+    done = threading.Event()
+    counts = [0] * (readers + 1)
+
+    def read(slot: int) -> None:
+        rng = random.Random(slot)
+        while not done.is_set():
+            value = rng.randrange(size)
+            with reader_lock:
+                value in container
+            counts[slot] += 1
+
+    def write() -> None:
+        rng = random.Random(-1)
+        while not done.is_set():
+            value = rng.randrange(size)
+            with writer_lock:
+                if rng.random() < 0.5:
+                    container.insert(value)
+                else:
+                    container.remove(value)
+            counts[readers] += 1
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    done.set()
+    for thread in threads:
+        thread.join()
+
+    return sum(counts[:readers]), counts[readers]
+
+
+def main(readers: int = 4, seconds: float = 2.0, size: int = 100_000) -> None:
+    rng = random.Random(0)
+    initial = [rng.randrange(size) for _ in range(size // 2)]
+
+    shared = threading.Lock()
+    cases: list[tuple[str, typing.Any, typing.Any, typing.Any]] = [
+        ("SkipList (lock-free reads)", None, contextlib.nullcontext(), None),
+        ("AVL (shared lock)", AVL(initial), shared, shared),
+        ("BinarySearchTree (shared lock)", BinarySearchTree(initial), shared, shared),
+    ]
+    for name, container, reader_lock, writer_lock in cases:
+        if container is None:
+            container = SkipList(initial, concurrent=True)
+            # The writer lock lives inside the skip list.
+            writer_lock = contextlib.nullcontext()
+        reads, writes = _run(
+            container, reader_lock, writer_lock, readers, seconds, size
+        )
+        print(
+            f"{name:>32}: {reads / seconds:>10,.0f} reads/s, "
+            f"{writes / seconds:>9,.0f} writes/s"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]), *(float(arg) for arg in sys.argv[2:3]))
@@ -0,0 +1,50 @@
+"""Append-then-scan workload on the linked lists: build time, scan time and memory.
+
+    python -m benchmarks.unrolled_linked_list [size]
+"""
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+import typing
+
+from data_structures.linked_lists import (
+    DoublyLinkedList,
+    SinglyLinkedList,
+    UnrolledLinkedList,
+)
+
+
+def _scan(items: typing.Iterable[typing.Any]) -> int:
+    count = 0
+    for _ in items:
+        count += 1
+    return count
+
+
+def main(size: int = 10**6, scans: int = 5) -> None:
+    for kind in (SinglyLinkedList, DoublyLinkedList, UnrolledLinkedList):
+        tracemalloc.start()
+        kind(range(size))
+        memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        started = time.perf_counter()
+        items = kind(range(size))
+        built = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(scans):
+            _scan(items)
+        scanned = (time.perf_counter() - started) / scans
+
+        print(
+            f"{kind.__name__:>20}: build {built:6.3f}s, scan {scanned:6.3f}s, "
+            f"{memory / size:6.1f} B/value"
+        )
+        del items
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -1,8 +1,9 @@
 from .adelson_velsky_landis import AVL
 from .binary_search_tree import BinarySearchTree
 from .heap import Heap
-from .linked_lists import DoublyLinkedList, SinglyLinkedList
+from .linked_lists import DoublyLinkedList, SinglyLinkedList, UnrolledLinkedList
 from .priority_queue import PriorityQueue
+from .skip_list import IndexableSkipList, SkipList
 
 __all__ = [
     "BinarySearchTree",
@@ -11,4 +12,7 @@ __all__ = [
     "PriorityQueue",
     "SinglyLinkedList",
     "DoublyLinkedList",
+    "UnrolledLinkedList",
+    "IndexableSkipList",
+    "SkipList",
 ]
@@ -0,0 +1,22 @@
+"""Optional NumPy support.
+
+NumPy is not a dependency of this package. When it is installed, the bulk numeric
+kernels of the graph classes (`AdjacencyMatrix.all_pairs_shortest_paths`, the
+`CSRGraph` transpose, frontier BFS and centrality iterations) run on NumPy arrays.
+Without it they fall back to stdlib `array` code with identical results, which
+still costs one interpreter step per edge or per matrix cell: fine for graphs of
+up to about 10^5 edges or a few hundred dense vertices, far too slow beyond that.
+"""
+
+from __future__ import annotations
+
+import typing
+
+np: typing.Any
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+__all__ = ["np"]
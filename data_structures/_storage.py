@@ -0,0 +1,88 @@
+"""On-disk layout shared by the saved graph indexes (`Landmarks`,
+`ContractionHierarchy`): a magic string, a length-prefixed JSON header and the raw
+bytes of the index's arrays. Vertices that are plain JSON values live in the
+header; any others are pickled after the arrays, and loading those requires an
+explicit `allow_pickle=True` since a crafted pickle can run arbitrary code.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import struct
+import sys
+import typing
+from array import array
+
+# Vertex types stored as JSON. Exact types: subclasses (enums, ...) would not come
+# back as themselves.
+JSON_TYPES = (str, int, float, bool, type(None))
+
+_LENGTH = struct.Struct("<Q")
+
+
+def save_index(
+    path: str,
+    magic: bytes,
+    header: dict[str, typing.Any],
+    vertices: list[typing.Any],
+    arrays: dict[str, array[typing.Any]],
+) -> None:
+    pickled = any(type(vertex) not in JSON_TYPES for vertex in vertices)
+    document = dict(
+        header,
+        byteorder=sys.byteorder,
+        pickled=pickled,
+        vertices=None if pickled else vertices,
+        arrays=[
+            [name, values.typecode, len(values)] for name, values in arrays.items()
+        ],
+    )
+    encoded = json.dumps(document).encode()
+
+    with open(path, "wb") as file:
+        file.write(magic)
+        file.write(_LENGTH.pack(len(encoded)))
+        file.write(encoded)
+        for values in arrays.values():
+            file.write(values)
+        if pickled:
+            pickle.dump(vertices, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_index(
+    path: str, magic: bytes, allow_pickle: bool
+) -> tuple[dict[str, typing.Any], list[typing.Any], dict[str, array[typing.Any]]]:
+    """The header, vertices and arrays of a file written by `save_index`."""
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if not data.startswith(magic):
+        raise ValueError(f"{path!r} was not written by this version of `save`")
+
+    (length,) = _LENGTH.unpack_from(data, len(magic))
+    position = len(magic) + _LENGTH.size
+    document = json.loads(data[position : position + length])
+    position += length
+
+    arrays: dict[str, array[typing.Any]] = {}
+    for name, typecode, count in document["arrays"]:
+        values = array(typecode)
+        size = values.itemsize * count
+        values.frombytes(data[position : position + size])
+        if document["byteorder"] != sys.byteorder:
+            values.byteswap()
+        arrays[name] = values
+        position += size
+
+    if not document["pickled"]:
+        return document, document["vertices"], arrays
+    if not allow_pickle:
+        raise ValueError(
+            f"{path!r} stores its vertices as a pickle; "
+            "pass allow_pickle=True if the file is trusted"
+        )
+    return document, pickle.loads(data[position:]), arrays
+
+
+__all__ = ["JSON_TYPES", "load_index", "save_index"]
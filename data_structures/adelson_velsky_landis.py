@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Callable, Generic, Iterable, Iterator, Optional
 
 from ._protocols import CT
+from .cursor import TreeCursor
 from .nodes import AVLTreeNode as Node
 
 
@@ -150,6 +151,10 @@ class AVL(Generic[CT]):
 
         return diagram(self.root)
 
+    def cursor(self) -> TreeCursor[CT]:
+        """A `TreeCursor` on the smallest value, for in-order walks and finger searches."""
+        return TreeCursor(self)
+
     def __contains__(self, value: CT) -> bool:
         def contains(root: Optional[Node[CT]], value: CT) -> bool:
             if root is None:
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import typing
+
+from .cache import LRUCache
+from .graph import AdjacencyList
+from .priority_queue import PriorityQueue
+
+_T = typing.TypeVar("_T")
+
+NeighborProvider = typing.Callable[
+    [_T], typing.Awaitable[typing.Iterable[tuple[_T, float]]]
+]
+
+
+class AsyncGraph(typing.Generic[_T]):
+    """Shortest paths and traversals over a graph whose adjacency is fetched lazily.
+
+    `provider(vertex)` is awaited for the `(destination, weight)` pairs of a vertex.
+    While a search runs, the adjacency of the `lookahead` entries at the front of its
+    queue is requested concurrently in the background (at most `concurrency` requests
+    in flight), so it rarely waits on a single round trip. Prefetches still pending
+    when the search returns are cancelled. Fetched adjacency is kept in an LRU of
+    `cache_size` vertices and shared between searches.
+    """
+
+    def __init__(
+        self,
+        provider: NeighborProvider[_T],
+        cache_size: int = 4096,
+        concurrency: int = 32,
+        lookahead: int = 8,
+    ) -> None:
+        assert cache_size > 0, "cache_size must be a positive integer"
+        assert concurrency > 0, "concurrency must be a positive integer"
+        assert lookahead >= 0, "lookahead must be a non-negative integer"
+
+        self.provider = provider
+        self.cache_size = cache_size
+        self.concurrency = concurrency
+        self.lookahead = lookahead
+        self.hits: int = 0
+        self.misses: int = 0
+        self._cache: LRUCache[_T, tuple[tuple[_T, float], ...]] = LRUCache(cache_size)
+        self._pending: dict[_T, asyncio.Task[tuple[tuple[_T, float], ...]]] = {}
+        self._loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: typing.Optional[asyncio.Semaphore] = None
+
+    # Fetching
+
+    def _bind(self) -> asyncio.Semaphore:
+        """Tasks and semaphores belong to one event loop; start afresh in a new one."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._semaphore is None:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._pending = {}
+        return self._semaphore
+
+    async def _load(self, vertex: _T) -> tuple[tuple[_T, float], ...]:
+        try:
+            async with self._bind():
+                edges = tuple(await self.provider(vertex))
+        finally:
+            if self._pending.get(vertex) is asyncio.current_task():
+                del self._pending[vertex]
+
+        self._cache.put(vertex, edges)
+        return edges
+
+    def _request(self, vertex: _T) -> asyncio.Task[tuple[tuple[_T, float], ...]]:
+        self._bind()
+        task = self._pending.get(vertex)
+        if task is None:
+            self.misses += 1
+            task = self._pending[vertex] = asyncio.ensure_future(self._load(vertex))
+            # Nobody may await a prefetch: mark its failure as seen. A later request
+            # for the vertex fetches it again and gets the error then.
+            task.add_done_callback(
+                lambda done: None if done.cancelled() else done.exception()
+            )
+        return task
+
+    def _cancel(
+        self, tasks: dict[_T, asyncio.Task[tuple[tuple[_T, float], ...]]]
+    ) -> None:
+        """Cancels the given prefetches that have not finished yet."""
+        for vertex, task in tasks.items():
+            if not task.done():
+                task.cancel()
+                if self._pending.get(vertex) is task:
+                    del self._pending[vertex]
+
+    def prefetch(self, vertices: typing.Iterable[_T]) -> None:
+        """Starts fetching the adjacency of every vertex that is neither cached nor
+        already being fetched, without waiting for the results."""
+        self._prefetch(vertices, {})
+
+    def _prefetch(
+        self,
+        vertices: typing.Iterable[_T],
+        started: dict[_T, asyncio.Task[tuple[tuple[_T, float], ...]]],
+    ) -> None:
+        """`prefetch`, recording the requests it starts in `started`."""
+        for vertex in vertices:
+            if vertex not in self._cache and vertex not in self._pending:
+                started[vertex] = self._request(vertex)
+
+    async def neighbors(self, vertex: _T) -> tuple[tuple[_T, float], ...]:
+        """The `(destination, weight)` pairs of `vertex`, from the cache if possible."""
+        edges = self._cache.get(vertex)
+        if edges is not None:
+            self.hits += 1
+            return edges
+
+        while True:
+            # Shielded, so cancelling this caller leaves the shared fetch running.
+            task = self._request(vertex)
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                # Another search cancelled its unused prefetch: request it again.
+                if not task.cancelled():
+                    raise
+
+    async def neighbors_many(
+        self, vertices: typing.Iterable[_T]
+    ) -> list[tuple[tuple[_T, float], ...]]:
+        """Batch version of `neighbors`: the missing vertices are fetched concurrently."""
+        return list(await asyncio.gather(*map(self.neighbors, vertices)))
+
+    # Searches
+
+    async def _search(
+        self,
+        start: _T,
+        end: typing.Optional[_T],
+        heuristic: typing.Callable[[_T, _T], float],
+    ) -> dict[_T, tuple[_T, float]]:
+        # The counter breaks ties, so vertex data never has to be comparable.
+        counter = itertools.count(1)
+        queue: PriorityQueue[tuple[float, float, int, _T, _T]] = PriorityQueue(
+            [(0.0, 0.0, 0, start, start)]
+        )
+        settled: set[_T] = set()
+        record: dict[_T, tuple[_T, float]] = {}
+        prefetched: dict[_T, asyncio.Task[tuple[tuple[_T, float], ...]]] = {}
+
+        try:
+            while queue:
+                _, cost, _, current, parent = queue.dequeue()
+                if current in settled:
+                    continue
+                settled.add(current)
+
+                if current != start:
+                    record[current] = (parent, cost)
+                if end is not None and current == end:
+                    break
+
+                for target, weight in await self.neighbors(current):
+                    if target not in settled:
+                        candidate = cost + weight
+                        estimate = 0.0 if end is None else heuristic(target, end)
+                        queue.enqueue(
+                            (
+                                candidate + estimate,
+                                candidate,
+                                next(counter),
+                                target,
+                                current,
+                            )
+                        )
+
+                # Iterating the queue yields its entries lazily in dequeue order: the
+                # vertices settled next, unless edges found meanwhile are cheaper.
+                front = itertools.islice(queue, self.lookahead)
+                self._prefetch(
+                    (entry[3] for entry in front if entry[3] not in settled),
+                    prefetched,
+                )
+        finally:
+            self._cancel(prefetched)
+
+        return record
+
+    @staticmethod
+    def _build_path(
+        record: dict[_T, tuple[_T, float]], start: _T, end: _T
+    ) -> list[tuple[_T, float]]:
+        # `start` is never recorded, so it has no path to itself either.
+        if end not in record:
+            raise ValueError(f"No path exists between {start} and {end}")
+
+        path: list[tuple[_T, float]] = []
+        while end != start:
+            parent, cost = record[end]
+            path.append((end, cost))
+            end = parent
+        path.append((start, 0))
+        path.reverse()
+        return path
+
+    async def dijkstra(self, start: _T, end: _T) -> list[tuple[_T, float]]:
+        """The shortest path from `start` to `end` as `(vertex, cost)` pairs, like
+        `AdjacencyList.dijkstra`. Raises `ValueError` when there is none, which
+        includes `start == end`."""
+        return self._build_path(
+            await self._search(start, end, lambda a, b: 0.0), start, end
+        )
+
+    async def a_star(
+        self,
+        start: _T,
+        end: _T,
+        __heuristic: typing.Callable[[_T, _T], float] = lambda a, b: 0.0,
+    ) -> list[tuple[_T, float]]:
+        return self._build_path(await self._search(start, end, __heuristic), start, end)
+
+    async def shortest_path_tree(self, source: _T) -> dict[_T, tuple[_T, float]]:
+        """Maps every vertex reachable from `source` to its `(predecessor, cost)` pair."""
+        return await self._search(source, None, lambda a, b: 0.0)
+
+    async def bfs_levels(
+        self, start: _T, max_depth: typing.Optional[int] = None
+    ) -> dict[_T, int]:
+        """Maps every vertex reachable from `start` to its hop distance."""
+        return {vertex: depth async for vertex, depth in self._bfs(start, max_depth)}
+
+    async def bfs(
+        self, start: _T, max_depth: typing.Optional[int] = None
+    ) -> typing.AsyncIterator[_T]:
+        """Lazily yields the vertices reachable from `start` in breadth-first order."""
+        async for vertex, _ in self._bfs(start, max_depth):
+            yield vertex
+
+    async def _bfs(
+        self, start: _T, max_depth: typing.Optional[int] = None
+    ) -> typing.AsyncIterator[tuple[_T, int]]:
+        # Level-synchronous: the adjacency of a whole level is fetched in one batch.
+        visited: set[_T] = {start}
+        frontier = [start]
+        depth = 0
+        while frontier:
+            for vertex in frontier:
+                yield vertex, depth
+            if max_depth is not None and depth >= max_depth:
+                return
+
+            following: list[_T] = []
+            for edges in await self.neighbors_many(frontier):
+                for target, _ in edges:
+                    if target not in visited:
+                        visited.add(target)
+                        following.append(target)
+            frontier = following
+            depth += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(cached={len(self._cache)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+
+class GraphProvider(typing.Generic[_T]):
+    """An in-process `NeighborProvider` over an `AdjacencyList`, with an artificial
+    `latency` (in seconds) per request. Counts the requests it serves in `calls`."""
+
+    def __init__(self, graph: AdjacencyList[_T], latency: float = 0.0) -> None:
+        self.graph = graph
+        self.latency = latency
+        self.calls: int = 0
+
+    async def __call__(self, vertex: _T) -> list[tuple[_T, float]]:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return [
+            (edge.destination._data, edge.weight)
+            for edge in self.graph.edges(vertex) or []
+        ]
+
+
+__all__ = ["AsyncGraph", "GraphProvider", "NeighborProvider"]
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
-from typing import Callable, Generic, Iterable, Optional, Union
+import random
+from typing import Callable, Generic, Iterable, Optional, Union, cast
 
 from ._protocols import CT
+from .cursor import TreeCursor
 from .nodes import BinarySearchTreeNode as Node
+from .nodes import TreapNode
+
+_BALANCE_MODES = (None, "treap")
 
 
 class BinarySearchTree(Generic[CT]):
-    def __init__(self, __items: Optional[Iterable[CT]] = None) -> None:
+    """An unbalanced binary search tree by default.
+
+    With `balance="treap"` every node gets a random priority and the tree is kept a
+    max-heap on priorities, by splitting and merging subtrees on insert and remove.
+    Its depth is then O(log n) in expectation whatever the insertion order, sorted
+    input included. `seed` makes the priorities reproducible.
+    """
+
+    def __init__(
+        self,
+        __items: Optional[Iterable[CT]] = None,
+        balance: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        assert balance in _BALANCE_MODES, f"balance must be one of {_BALANCE_MODES}"
+
         self.root: Optional[Node[CT]] = None
+        self.balance = balance
+        self._random = random.Random(seed) if balance == "treap" else None
 
         if __items is not None:
-            self.root = self.from_iter(__items).root
-            return None
+            if balance is None:
+                self.root = self.from_iter(__items).root
+            else:
+                for item in __items:
+                    self.insert(item)
 
     @staticmethod
     def from_mapped_list(items: list[Union[CT, None]]) -> BinarySearchTree[CT]:
@@ -53,6 +78,8 @@ class BinarySearchTree(Generic[CT]):
 
     def insert(self, value: CT) -> None:
         """Inserts a value into the tree"""
+        if self.balance == "treap":
+            return self._treap_insert(value)
 
         def insert_helper(root: Optional[Node[CT]], value: CT) -> Node[CT]:
             if root is None:
@@ -67,6 +94,8 @@ class BinarySearchTree(Generic[CT]):
 
     def remove(self, value: CT) -> None:
         """Removes a given value from the tree"""
+        if self.balance == "treap":
+            return self._treap_remove(value)
 
         def remove_helper(root: Optional[Node[CT]], value: CT) -> Optional[Node[CT]]:
             if root is None:
@@ -89,6 +118,75 @@ class BinarySearchTree(Generic[CT]):
 
         self.root = remove_helper(self.root, value)
 
+    # Treap mode
+
+    @staticmethod
+    def _split(
+        node: Optional[TreapNode[CT]], value: CT
+    ) -> tuple[Optional[TreapNode[CT]], Optional[TreapNode[CT]]]:
+        """Splits a treap into the values smaller than `value` and the others."""
+        if node is None:
+            return None, None
+        if node < value:
+            node.right, right = BinarySearchTree._split(node.right, value)
+            return node, right
+        left, node.left = BinarySearchTree._split(node.left, value)
+        return left, node
+
+    @staticmethod
+    def _merge(
+        left: Optional[TreapNode[CT]], right: Optional[TreapNode[CT]]
+    ) -> Optional[TreapNode[CT]]:
+        """Joins two treaps where every value of `left` precedes those of `right`."""
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = BinarySearchTree._merge(left.right, right)
+            return left
+        right.left = BinarySearchTree._merge(left, right.left)
+        return right
+
+    def _replace(
+        self, parent: Optional[TreapNode[CT]], child: Optional[TreapNode[CT]], value: CT
+    ) -> None:
+        """Hangs `child` where the search for `value` left `parent`."""
+        if parent is None:
+            self.root = child
+        elif value < parent:
+            parent.left = child
+        else:
+            parent.right = child
+
+    def _treap_insert(self, value: CT) -> None:
+        assert self._random is not None
+        node: TreapNode[CT] = TreapNode(value, self._random.random())
+
+        # Descend past the nodes of higher priority, then split the rest around `value`.
+        parent: Optional[TreapNode[CT]] = None
+        current = cast(Optional[TreapNode[CT]], self.root)
+        while current is not None and current.priority > node.priority:
+            parent = current
+            current = current.left if value < current else current.right
+
+        node.left, node.right = self._split(current, value)
+        self._replace(parent, node, value)
+
+    def _treap_remove(self, value: CT) -> None:
+        parent: Optional[TreapNode[CT]] = None
+        current = cast(Optional[TreapNode[CT]], self.root)
+        while current is not None and current.value != value:
+            parent = current
+            current = current.left if value < current else current.right
+
+        if current is not None:
+            self._replace(parent, self._merge(current.left, current.right), value)
+
+    def cursor(self) -> TreeCursor[CT]:
+        """A `TreeCursor` on the smallest value, for in-order walks and finger searches."""
+        return TreeCursor(self)
+
     def __contains__(self, item: CT) -> bool:
         def contains(root: Optional[Node[CT]], value: CT) -> bool:
             if root is None:
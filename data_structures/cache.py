@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import time
+import typing
+
+from .linked_lists import DoublyLinkedList
+from .nodes import DoublyLinkedListNode as DLLNode
+
+_K = typing.TypeVar("_K", bound=typing.Hashable)
+_V = typing.TypeVar("_V")
+
+_MISSING = object()
+
+
+class CacheStats(typing.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Entry(typing.Generic[_K, _V]):
+    __slots__ = ("key", "value", "expires", "frequency")
+
+    def __init__(self, key: _K, value: _V, expires: typing.Optional[float]) -> None:
+        self.key = key
+        self.value = value
+        self.expires = expires
+        self.frequency = 1
+
+
+class _Cache(typing.Generic[_K, _V]):
+    """Shared bookkeeping of `LRUCache` and `LFUCache`: a dict from keys to the list
+    nodes holding their entries, TTL expiry and statistics. Subclasses decide the
+    order of the nodes and which one is evicted."""
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: typing.Optional[float] = None,
+        on_evict: typing.Optional[typing.Callable[[_K, _V], None]] = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        assert maxsize > 0, "maxsize must be a positive integer"
+        assert ttl is None or ttl > 0, "ttl must be positive"
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._clock = clock
+        self._nodes: dict[_K, DLLNode[_Entry[_K, _V]]] = {}
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    # Policy hooks
+
+    def _insert(self, entry: _Entry[_K, _V]) -> DLLNode[_Entry[_K, _V]]:
+        ...
+
+    def _touch(self, node: DLLNode[_Entry[_K, _V]]) -> DLLNode[_Entry[_K, _V]]:
+        ...
+
+    def _remove(self, node: DLLNode[_Entry[_K, _V]]) -> None:
+        ...
+
+    def _victim(self) -> DLLNode[_Entry[_K, _V]]:
+        ...
+
+    # Bookkeeping
+
+    def _deadline(self) -> typing.Optional[float]:
+        return None if self.ttl is None else self._clock() + self.ttl
+
+    def _expired(self, entry: _Entry[_K, _V]) -> bool:
+        return entry.expires is not None and entry.expires <= self._clock()
+
+    def _discard(self, node: DLLNode[_Entry[_K, _V]], expired: bool) -> None:
+        entry = node.value
+        self._remove(node)
+        del self._nodes[entry.key]
+
+        if expired:
+            self._expirations += 1
+        else:
+            self._evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.value)
+
+    # Public API
+
+    def get(self, key: _K, default: typing.Any = None) -> typing.Any:
+        """The value cached for `key`, or `default`. Counts as a hit or a miss."""
+        node = self._nodes.get(key)
+        if node is not None and self._expired(node.value):
+            self._discard(node, expired=True)
+            node = None
+
+        if node is None:
+            self._misses += 1
+            return default
+
+        self._hits += 1
+        self._nodes[key] = self._touch(node)
+        return node.value.value
+
+    def put(self, key: _K, value: _V) -> None:
+        """Caches `value` for `key`, evicting an entry first when the cache is full."""
+        node = self._nodes.get(key)
+        if node is not None:
+            node.value.value = value
+            node.value.expires = self._deadline()
+            self._nodes[key] = self._touch(node)
+            return
+
+        while len(self._nodes) >= self.maxsize:
+            self._discard(self._victim(), expired=False)
+        self._nodes[key] = self._insert(_Entry(key, value, self._deadline()))
+
+    def get_or_put(self, key: _K, compute: typing.Callable[[], _V]) -> _V:
+        """The value cached for `key`, computing and caching it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def pop(self, key: _K, default: typing.Any = None) -> typing.Any:
+        """Removes `key` without calling `on_evict` and returns its value."""
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return default
+        self._remove(node)
+        return node.value.value
+
+    def expire(self) -> int:
+        """Drops every expired entry now instead of on its next lookup. Returns how many."""
+        expired = [node for node in self._nodes.values() if self._expired(node.value)]
+        for node in expired:
+            self._discard(node, expired=True)
+        return len(expired)
+
+    def resize(self, maxsize: int) -> None:
+        assert maxsize > 0, "maxsize must be a positive integer"
+        self.maxsize = maxsize
+        while len(self._nodes) > maxsize:
+            self._discard(self._victim(), expired=False)
+
+    def clear(self) -> None:
+        """Removes every entry without calling `on_evict`. Statistics are kept."""
+        for key in list(self._nodes):
+            self.pop(key)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._evictions, self._expirations)
+
+    def __contains__(self, key: _K) -> bool:
+        node = self._nodes.get(key)
+        return node is not None and not self._expired(node.value)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(maxsize={self.maxsize}, size={len(self)}, "
+            f"{self.stats})"
+        )
+
+
+class LRUCache(_Cache[_K, _V]):
+    """Evicts the least recently used entry. Every operation is O(1): entries are
+    nodes of a `DoublyLinkedList`, most recently used first, and a dict maps keys to
+    their nodes.
+
+    Entries older than `ttl` seconds (if given) expire. `on_evict(key, value)` is
+    called for every entry that is evicted or expires.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: typing.Optional[float] = None,
+        on_evict: typing.Optional[typing.Callable[[_K, _V], None]] = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(maxsize, ttl, on_evict, clock)
+        self._order: DoublyLinkedList[_Entry[_K, _V]] = DoublyLinkedList()
+
+    def _insert(self, entry: _Entry[_K, _V]) -> DLLNode[_Entry[_K, _V]]:
+        return self._order.push(entry)
+
+    def _touch(self, node: DLLNode[_Entry[_K, _V]]) -> DLLNode[_Entry[_K, _V]]:
+        self._order.move_to_front(node)
+        return node
+
+    def _remove(self, node: DLLNode[_Entry[_K, _V]]) -> None:
+        self._order.unlink(node)
+
+    def _victim(self) -> DLLNode[_Entry[_K, _V]]:
+        assert self._order._tail is not None
+        return self._order._tail
+
+    def __iter__(self) -> typing.Iterator[_K]:
+        """Keys from the most to the least recently used."""
+        for node in self._order:
+            yield node.value.key
+
+
+class LFUCache(_Cache[_K, _V]):
+    """Evicts the least frequently used entry, the least recently used one among
+    ties. Every operation is O(1): there is one `DoublyLinkedList` per use count,
+    and a hit moves the entry's node to the list of the next count.
+
+    `ttl` and `on_evict` behave as in `LRUCache`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: typing.Optional[float] = None,
+        on_evict: typing.Optional[typing.Callable[[_K, _V], None]] = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(maxsize, ttl, on_evict, clock)
+        self._buckets: dict[int, DoublyLinkedList[_Entry[_K, _V]]] = {}
+        self._min_frequency: int = 1
+
+    def _bucket(self, frequency: int) -> DoublyLinkedList[_Entry[_K, _V]]:
+        bucket = self._buckets.get(frequency)
+        if bucket is None:
+            bucket = self._buckets[frequency] = DoublyLinkedList()
+        return bucket
+
+    def _insert(self, entry: _Entry[_K, _V]) -> DLLNode[_Entry[_K, _V]]:
+        self._min_frequency = 1
+        return self._bucket(1).push(entry)
+
+    def _touch(self, node: DLLNode[_Entry[_K, _V]]) -> DLLNode[_Entry[_K, _V]]:
+        entry = node.value
+        self._remove(node)
+        if entry.frequency == self._min_frequency and entry.frequency not in (
+            self._buckets
+        ):
+            self._min_frequency += 1
+
+        entry.frequency += 1
+        return self._bucket(entry.frequency).push(entry)
+
+    def _remove(self, node: DLLNode[_Entry[_K, _V]]) -> None:
+        frequency = node.value.frequency
+        bucket = self._buckets[frequency]
+        bucket.unlink(node)
+        if not bucket:
+            del self._buckets[frequency]
+
+    def _victim(self) -> DLLNode[_Entry[_K, _V]]:
+        if self._min_frequency not in self._buckets:
+            # Only after a removal outside of `_touch` emptied the lowest bucket.
+            self._min_frequency = min(self._buckets)
+        tail = self._buckets[self._min_frequency]._tail
+        assert tail is not None
+        return tail
+
+    def frequency(self, key: _K) -> int:
+        """How many times `key` was put or hit since it was cached (0 if missing)."""
+        node = self._nodes.get(key)
+        return 0 if node is None else node.value.frequency
+
+
+__all__ = ["CacheStats", "LFUCache", "LRUCache"]
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+import typing
+
+from .linked_lists import DoublyLinkedList
+
+T = typing.TypeVar("T")
+
+
+class ConcurrentDeque(typing.Generic[T]):
+    """A thread-safe deque over a `DoublyLinkedList`, for producer/consumer queues.
+
+    One lock guards the list, with a condition for "not empty" and, when `maxsize`
+    is positive, one for "not full". Blocking operations take a `timeout` in seconds
+    and raise `queue.Empty` / `queue.Full` like `queue.Queue`. `extend` and `drain`
+    move many values per lock acquisition.
+    """
+
+    def __init__(
+        self, __items: typing.Optional[typing.Iterable[T]] = None, maxsize: int = 0
+    ) -> None:
+        self.maxsize = maxsize
+        self._list: DoublyLinkedList[T] = DoublyLinkedList()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+        if __items is not None:
+            self.extend(__items)
+
+    def _wait(
+        self,
+        condition: threading.Condition,
+        ready: typing.Callable[[], bool],
+        block: bool,
+        timeout: typing.Optional[float],
+        error: type[Exception],
+    ) -> None:
+        """Waits on `condition` (whose lock is held) until `ready()`, or raises `error`."""
+        if ready():
+            return
+        if not block:
+            raise error
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not ready():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise error
+            condition.wait(remaining)
+
+    def _has_room(self) -> bool:
+        return self.maxsize <= 0 or len(self._list) < self.maxsize
+
+    def _put(
+        self,
+        add: typing.Callable[[T], typing.Any],
+        value: T,
+        block: bool,
+        timeout: typing.Optional[float],
+    ) -> None:
+        with self._not_full:
+            self._wait(self._not_full, self._has_room, block, timeout, queue.Full)
+            add(value)
+            self._not_empty.notify()
+
+    def _take(
+        self,
+        remove: typing.Callable[[], typing.Optional[T]],
+        block: bool,
+        timeout: typing.Optional[float],
+    ) -> T:
+        with self._not_empty:
+            self._wait(
+                self._not_empty, lambda: bool(self._list), block, timeout, queue.Empty
+            )
+            value = typing.cast(T, remove())
+            self._not_full.notify()
+            return value
+
+    def push(
+        self, value: T, block: bool = True, timeout: typing.Optional[float] = None
+    ) -> None:
+        """Adds a value at the front, waiting for room when the deque is bounded."""
+        self._put(self._list.push, value, block, timeout)
+
+    def append(
+        self, value: T, block: bool = True, timeout: typing.Optional[float] = None
+    ) -> None:
+        """Adds a value at the end, waiting for room when the deque is bounded."""
+        self._put(self._list.append, value, block, timeout)
+
+    def pop(self, block: bool = True, timeout: typing.Optional[float] = None) -> T:
+        """Removes and returns the value at the front, waiting until there is one."""
+        return self._take(self._list.pop, block, timeout)
+
+    def remove_last(
+        self, block: bool = True, timeout: typing.Optional[float] = None
+    ) -> T:
+        """Removes and returns the value at the end, waiting until there is one."""
+        return self._take(self._list.remove_last, block, timeout)
+
+    def extend(self, values: typing.Iterable[T]) -> None:
+        """Appends every value under a single lock acquisition. Ignores `maxsize`."""
+        batch = DoublyLinkedList(values)
+        if not batch:
+            return
+        with self._lock:
+            self._list.extend_list(batch)
+            self._not_empty.notify(len(self._list))
+
+    def drain(
+        self,
+        n: typing.Optional[int] = None,
+        block: bool = False,
+        timeout: typing.Optional[float] = None,
+    ) -> list[T]:
+        """Removes up to `n` values (all when `None`) from the front under a single
+        lock acquisition. With `block`, first waits until at least one is available."""
+        with self._not_empty:
+            if block:
+                self._wait(
+                    self._not_empty,
+                    lambda: bool(self._list),
+                    True,
+                    timeout,
+                    queue.Empty,
+                )
+
+            count = len(self._list) if n is None else min(n, len(self._list))
+            values = [typing.cast(T, self._list.pop()) for _ in range(count)]
+            if values:
+                self._not_full.notify(len(values))
+            return values
+
+    def __len__(self) -> int:
+        return len(self._list)
+
+    def __bool__(self) -> bool:
+        return bool(self._list)
+
+    def __repr__(self) -> str:
+        with self._lock:
+            values = [node.value for node in self._list]
+        return f"{type(self).__name__}({values!r})"
+
+
+__all__ = ["ConcurrentDeque"]
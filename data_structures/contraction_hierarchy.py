@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import typing
+from array import array
+
+from ._storage import load_index, save_index
+from .graph import AdjacencyList
+from .priority_queue import PriorityQueue
+
+_T = typing.TypeVar("_T")
+
+_MAGIC = b"DSCH\x00\x00\x00\x00"
+_FORMAT_VERSION = 2
+
+
+class ContractionHierarchy(typing.Generic[_T]):
+    """Preprocessed point-to-point shortest paths for a static graph.
+
+    Vertices are contracted one at a time, least important first (edge
+    difference plus the number of already contracted neighbours). Shortcuts
+    are added wherever a contraction would break a shortest path, so a query
+    only needs a bidirectional search that climbs towards more important
+    vertices. The hierarchy is a snapshot: later changes to the graph are not
+    reflected.
+    """
+
+    def __init__(self, graph: AdjacencyList[_T], witness_limit: int = 64) -> None:
+        frozen = graph.freeze()
+        self.vertices: list[_T] = list(frozen.vertices)
+        self._index: dict[_T, int] = {
+            vertex: i for i, vertex in enumerate(self.vertices)
+        }
+
+        size = len(self.vertices)
+        out_edges: list[dict[int, float]] = [{} for _ in range(size)]
+        in_edges: list[dict[int, float]] = [{} for _ in range(size)]
+        # (source, destination) -> (weight, contracted middle vertex or -1)
+        self._edges: dict[tuple[int, int], tuple[float, int]] = {}
+
+        for u in range(size):
+            for position in range(frozen.offsets[u], frozen.offsets[u + 1]):
+                v, weight = frozen.targets[position], frozen.weights[position]
+                if u != v and weight < out_edges[u].get(v, float("inf")):
+                    out_edges[u][v] = weight
+                    in_edges[v][u] = weight
+                    self._edges[(u, v)] = (weight, -1)
+
+        self.rank: list[int] = self._contract(out_edges, in_edges, witness_limit)
+        self._build_search_graphs()
+
+    # Preprocessing
+
+    def _witness_distance(
+        self,
+        out_edges: list[dict[int, float]],
+        source: int,
+        excluded: int,
+        limit: float,
+        witness_limit: int,
+    ) -> dict[int, float]:
+        """Bounded Dijkstra from `source` in the remaining graph, avoiding `excluded`."""
+        distances: dict[int, float] = {source: 0.0}
+        settled: set[int] = set()
+        queue: PriorityQueue[tuple[float, int]] = PriorityQueue([(0.0, source)])
+
+        while queue and len(settled) < witness_limit:
+            distance, current = queue.dequeue()
+            if current in settled:
+                continue
+            if distance > limit:
+                break
+            settled.add(current)
+
+            for neighbor, weight in out_edges[current].items():
+                if neighbor == excluded:
+                    continue
+                candidate = distance + weight
+                if candidate < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = candidate
+                    queue.enqueue((candidate, neighbor))
+
+        return distances
+
+    def _shortcuts(
+        self,
+        out_edges: list[dict[int, float]],
+        in_edges: list[dict[int, float]],
+        vertex: int,
+        witness_limit: int,
+    ) -> list[tuple[int, int, float]]:
+        """The shortcuts needed to contract `vertex` without losing a shortest path."""
+        shortcuts: list[tuple[int, int, float]] = []
+        if not out_edges[vertex]:
+            return shortcuts
+
+        max_out = max(out_edges[vertex].values())
+        for u, in_weight in in_edges[vertex].items():
+            distances = self._witness_distance(
+                out_edges, u, vertex, in_weight + max_out, witness_limit
+            )
+            for w, out_weight in out_edges[vertex].items():
+                if w == u:
+                    continue
+                through = in_weight + out_weight
+                if distances.get(w, float("inf")) > through:
+                    shortcuts.append((u, w, through))
+
+        return shortcuts
+
+    def _contract(
+        self,
+        out_edges: list[dict[int, float]],
+        in_edges: list[dict[int, float]],
+        witness_limit: int,
+    ) -> list[int]:
+        contracted_neighbors = [0] * len(out_edges)
+
+        def importance(vertex: int) -> int:
+            shortcuts = self._shortcuts(out_edges, in_edges, vertex, witness_limit)
+            removed = len(out_edges[vertex]) + len(in_edges[vertex])
+            return len(shortcuts) - removed + contracted_neighbors[vertex]
+
+        queue: PriorityQueue[tuple[int, int]] = PriorityQueue(
+            [(importance(vertex), vertex) for vertex in range(len(out_edges))]
+        )
+        rank = [0] * len(out_edges)
+        order = 0
+
+        while queue:
+            _, vertex = queue.dequeue()
+
+            # Lazy update: priorities go stale as neighbours are contracted.
+            priority = importance(vertex)
+            if queue and priority > typing.cast(tuple[int, int], queue.peek)[0]:
+                queue.enqueue((priority, vertex))
+                continue
+
+            for u, w, weight in self._shortcuts(
+                out_edges, in_edges, vertex, witness_limit
+            ):
+                if weight < out_edges[u].get(w, float("inf")):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+                    self._edges[(u, w)] = (weight, vertex)
+
+            for neighbor in set(out_edges[vertex]) | set(in_edges[vertex]):
+                contracted_neighbors[neighbor] += 1
+                out_edges[neighbor].pop(vertex, None)
+                in_edges[neighbor].pop(vertex, None)
+
+            out_edges[vertex] = {}
+            in_edges[vertex] = {}
+            rank[vertex] = order
+            order += 1
+
+        return rank
+
+    def _build_search_graphs(self) -> None:
+        self._upward: list[list[tuple[int, float]]] = [[] for _ in self.vertices]
+        self._downward: list[list[tuple[int, float]]] = [[] for _ in self.vertices]
+
+        for (u, v), (weight, _) in self._edges.items():
+            if self.rank[u] < self.rank[v]:
+                self._upward[u].append((v, weight))
+            else:
+                self._downward[v].append((u, weight))
+
+    # Queries
+
+    def _search(
+        self, start: int, end: int
+    ) -> tuple[float, int, dict[int, int], dict[int, int]]:
+        """Bidirectional upward search. Returns the distance, the meeting vertex and both parent maps."""
+        graphs = (self._upward, self._downward)
+        distances: tuple[dict[int, float], dict[int, float]] = (
+            {start: 0.0},
+            {end: 0.0},
+        )
+        parents: tuple[dict[int, int], dict[int, int]] = ({}, {})
+        settled: tuple[set[int], set[int]] = (set(), set())
+        queues = (
+            PriorityQueue[tuple[float, int]]([(0.0, start)]),
+            PriorityQueue[tuple[float, int]]([(0.0, end)]),
+        )
+        best, meeting = float("inf"), -1
+
+        while True:
+            # A side is finished once its closest unsettled vertex cannot improve `best`.
+            active = [
+                side
+                for side in (0, 1)
+                if queues[side]
+                and typing.cast(tuple[float, int], queues[side].peek)[0] < best
+            ]
+            if not active:
+                break
+
+            for side in active:
+                distance, current = queues[side].dequeue()
+                if current in settled[side]:
+                    continue
+                settled[side].add(current)
+
+                other = distances[1 - side].get(current)
+                if other is not None and distance + other < best:
+                    best, meeting = distance + other, current
+
+                for neighbor, weight in graphs[side][current]:
+                    candidate = distance + weight
+                    if candidate < distances[side].get(neighbor, float("inf")):
+                        distances[side][neighbor] = candidate
+                        parents[side][neighbor] = current
+                        queues[side].enqueue((candidate, neighbor))
+
+        return best, meeting, parents[0], parents[1]
+
+    def _unpack(self, u: int, v: int) -> list[int]:
+        """Expands the (possibly shortcut) edge `u -> v` into the original vertices after `u`."""
+        path: list[int] = []
+        stack = [(u, v)]
+        while stack:
+            source, destination = stack.pop()
+            _, middle = self._edges[(source, destination)]
+            if middle == -1:
+                path.append(destination)
+            else:
+                stack.append((middle, destination))
+                stack.append((source, middle))
+        return path
+
+    def _resolve(self, start: _T, end: _T) -> tuple[int, int]:
+        if start not in self._index or end not in self._index or start == end:
+            raise ValueError(f"No path exists between {start} and {end}")
+        return self._index[start], self._index[end]
+
+    def distance(self, start: _T, end: _T) -> float:
+        """Length of the shortest path from `start` to `end`. Raises `ValueError`
+        when there is none, which includes `start == end`."""
+        source, target = self._resolve(start, end)
+        best, *_ = self._search(source, target)
+        if best == float("inf"):
+            raise ValueError(f"No path exists between {start} and {end}")
+        return best
+
+    def shortest_path(self, start: _T, end: _T) -> typing.Iterator[tuple[_T, float]]:
+        """The shortest path as `(vertex, cumulative cost)` pairs, like
+        `AdjacencyList.dijkstra`: raises `ValueError` when there is none, which
+        includes `start == end`."""
+        source, target = self._resolve(start, end)
+        best, meeting, forward, backward = self._search(source, target)
+        if best == float("inf"):
+            raise ValueError(f"No path exists between {start} and {end}")
+
+        chain = [meeting]
+        while chain[-1] != source:
+            chain.append(forward[chain[-1]])
+        chain.reverse()
+
+        while chain[-1] != target:
+            chain.append(backward[chain[-1]])
+
+        vertices = [source]
+        for u, v in zip(chain, chain[1:]):
+            vertices.extend(self._unpack(u, v))
+
+        path: list[tuple[_T, float]] = [(self.vertices[source], 0)]
+        cost = 0.0
+        for u, v in zip(vertices, vertices[1:]):
+            cost += self._edges[(u, v)][0]
+            path.append((self.vertices[v], cost))
+
+        return iter(path)
+
+    # Serialization
+
+    def save(self, path: str) -> None:
+        """Writes the preprocessed hierarchy so it can be reused with `load`: ranks and
+        edges (shortcuts included) as raw arrays, the vertices as JSON when they are
+        plain values."""
+        save_index(
+            path,
+            _MAGIC,
+            {"format": _FORMAT_VERSION},
+            self.vertices,
+            {
+                "rank": array("q", self.rank),
+                "sources": array("q", (u for u, _ in self._edges)),
+                "targets": array("q", (v for _, v in self._edges)),
+                "weights": array("d", (w for w, _ in self._edges.values())),
+                "middles": array("q", (m for _, m in self._edges.values())),
+            },
+        )
+
+    @staticmethod
+    def load(path: str, allow_pickle: bool = False) -> ContractionHierarchy[typing.Any]:
+        """Reads a file written by `save`. Vertices that are not plain JSON values are
+        stored as a pickle, which could run arbitrary code when loaded; such files
+        raise `ValueError` unless `allow_pickle=True` (only for trusted files)."""
+        header, vertices, arrays = load_index(path, _MAGIC, allow_pickle)
+        if header.get("format") != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported contraction hierarchy format {header.get('format')!r}"
+            )
+
+        hierarchy: ContractionHierarchy[typing.Any] = ContractionHierarchy.__new__(
+            ContractionHierarchy
+        )
+        hierarchy.vertices = vertices
+        hierarchy._index = {vertex: i for i, vertex in enumerate(hierarchy.vertices)}
+        hierarchy.rank = arrays["rank"].tolist()
+        hierarchy._edges = dict(
+            zip(
+                zip(arrays["sources"], arrays["targets"]),
+                zip(arrays["weights"], arrays["middles"]),
+            )
+        )
+        hierarchy._build_search_graphs()
+        return hierarchy
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(vertices={len(self.vertices)}, "
+            f"edges={len(self._edges)})"
+        )
+
+
+__all__ = ["ContractionHierarchy"]
@@ -0,0 +1,762 @@
+from __future__ import annotations
+
+import json
+import mmap as _mmap
+import pickle
+import struct
+import sys
+import typing
+from array import array
+
+from . import _numpy
+from ._storage import JSON_TYPES as _JSON_TYPES
+from .priority_queue import PriorityQueue
+
+if typing.TYPE_CHECKING:
+    from .graph import AdjacencyList
+
+_T = typing.TypeVar("_T")
+
+# magic, format version, flags, vertex count, edge count, vertex table offset
+_HEADER = struct.Struct("<8sIIQQQ")
+_MAGIC = b"DSCSR\x00\x00\x00"
+_FORMAT_VERSION = 2
+_DIRECTED = 0b001
+_BIG_ENDIAN = 0b010
+# Set when the vertex table is a pickle rather than JSON keys.
+_PICKLED_TABLE = 0b100
+
+
+def _encode(vertex: typing.Any) -> bytes:
+    return json.dumps(vertex, ensure_ascii=False).encode()
+
+
+class _VertexTable(typing.Sequence[_T]):
+    """The vertex table of a saved graph, read in place from the file buffer: the
+    JSON-encoded vertices back to back (`keys`), where each one starts
+    (`key_offsets`) and the vertex ids sorted by encoding (`order`).
+
+    Vertices are decoded one at a time and looked up by binary search over `order`,
+    so opening a graph builds no Python object per vertex and every process mapping
+    the file shares the table's pages. Lookups match vertices by their JSON encoding.
+    """
+
+    def __init__(
+        self,
+        keys: typing.Any,
+        key_offsets: typing.Sequence[int],
+        order: typing.Sequence[int],
+    ) -> None:
+        self._keys = keys
+        self._key_offsets = key_offsets
+        self._order = order
+
+    def _key(self, i: int) -> bytes:
+        return bytes(self._keys[self._key_offsets[i] : self._key_offsets[i + 1]])
+
+    def position(self, vertex: typing.Any) -> typing.Optional[int]:
+        """The id of `vertex`, or `None` when it is not in the table."""
+        if type(vertex) not in _JSON_TYPES:
+            return None
+
+        key, order = _encode(vertex), self._order
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(order[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(order) and self._key(order[low]) == key:
+            return order[low]
+        return None
+
+    @typing.overload
+    def __getitem__(self, index: int) -> _T:
+        ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> list[_T]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> _T | list[_T]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("vertex index out of range")
+        return json.loads(self._key(index))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> typing.Iterator[_T]:
+        for i in range(len(self)):
+            yield json.loads(self._key(i))
+
+
+class CSRGraph(typing.Generic[_T]):
+    """A read-only, compressed sparse row snapshot of a graph.
+
+    Vertex `i` is `vertices[i]` and its out-edges are the slice
+    `offsets[i]:offsets[i + 1]` of the parallel `targets` and `weights` arrays.
+    """
+
+    def __init__(
+        self,
+        vertices: typing.Sequence[_T],
+        offsets: typing.Sequence[int],
+        targets: typing.Sequence[int],
+        weights: typing.Sequence[float],
+        directed: bool = True,
+    ) -> None:
+        assert (
+            len(offsets) == len(vertices) + 1
+        ), "offsets must have one entry per vertex plus one"
+        assert len(targets) == len(
+            weights
+        ), "targets and weights must be parallel arrays"
+
+        self.vertices = vertices
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+        self._index: typing.Optional[dict[_T, int]] = None
+        self._transpose: typing.Optional[
+            tuple[array[int], array[int], array[float]]
+        ] = None
+
+    @staticmethod
+    def from_adjacency(
+        adjacency: typing.Iterable[tuple[_T, typing.Iterable[tuple[_T, float]]]],
+        directed: bool = True,
+    ) -> CSRGraph[_T]:
+        """Builds the arrays from `(vertex, [(destination, weight), ...])` pairs."""
+        index: dict[_T, int] = {}
+        rows: list[list[tuple[_T, float]]] = []
+        for vertex, edges in adjacency:
+            index[vertex] = len(index)
+            rows.append(list(edges))
+
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for row in rows:
+            for destination, weight in row:
+                targets.append(index.setdefault(destination, len(index)))
+                weights.append(weight)
+            offsets.append(len(targets))
+
+        for _ in range(len(rows), len(index)):
+            offsets.append(len(targets))
+
+        graph: CSRGraph[_T] = CSRGraph(list(index), offsets, targets, weights, directed)
+        graph._index = index
+        return graph
+
+    def save(self, path: str) -> None:
+        """Writes the graph in a versioned binary layout: a fixed header, the offset,
+        target and weight arrays (native 8 byte items, 8 byte aligned) and finally the
+        vertex table.
+
+        When every vertex is a `str`, `int`, `float`, `bool` or `None`, the table is
+        the key offsets and the ids sorted by key (8 byte items), followed by the
+        JSON-encoded vertices, so `load` can search it in place. Otherwise it is a
+        pickle (see `load`)."""
+        vertex_count, edge_count = len(self.vertices), len(self.targets)
+        arrays_size = 8 * ((vertex_count + 1) + 2 * edge_count)
+        vertices = list(self.vertices)
+        pickled = any(type(vertex) not in _JSON_TYPES for vertex in vertices)
+
+        flags = _DIRECTED if self.directed else 0
+        if sys.byteorder == "big":
+            flags |= _BIG_ENDIAN
+        if pickled:
+            flags |= _PICKLED_TABLE
+
+        with open(path, "wb") as file:
+            file.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _FORMAT_VERSION,
+                    flags,
+                    vertex_count,
+                    edge_count,
+                    _HEADER.size + arrays_size,
+                )
+            )
+            file.write(array("q", self.offsets))
+            file.write(array("q", self.targets))
+            file.write(array("d", self.weights))
+            if pickled:
+                pickle.dump(vertices, file, protocol=pickle.HIGHEST_PROTOCOL)
+                return
+
+            keys = [_encode(vertex) for vertex in vertices]
+            key_offsets = array("q", [0])
+            for key in keys:
+                key_offsets.append(key_offsets[-1] + len(key))
+            file.write(key_offsets)
+            file.write(array("q", sorted(range(vertex_count), key=keys.__getitem__)))
+            file.write(b"".join(keys))
+
+    @staticmethod
+    def load(
+        path: str, mmap: bool = True, allow_pickle: bool = False
+    ) -> CSRGraph[typing.Any]:
+        """Opens a graph written by `save`.
+
+        With `mmap=True` the arrays are zero-copy views over a read-only memory map, so
+        loading costs no more than reading the header, and processes mapping the same
+        file share its pages. The vertex table is searched in place as well, so vertex
+        lookups decode only the entries they compare.
+
+        A graph whose vertices are not plain JSON values is saved with a pickled
+        vertex table, and unpickling a crafted file can run arbitrary code. Such
+        files raise `ValueError` unless `allow_pickle=True`; only pass it for files
+        you trust.
+        """
+        with open(path, "rb") as file:
+            buffer: typing.Any
+            if mmap:
+                buffer = memoryview(
+                    _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+                )
+            else:
+                buffer = memoryview(file.read())
+
+        magic, version, flags, vertex_count, edge_count, table = _HEADER.unpack_from(
+            buffer
+        )
+        if magic != _MAGIC:
+            raise ValueError(f"{path!r} is not a saved graph")
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported graph format version {version}")
+
+        pickled = bool(flags & _PICKLED_TABLE)
+        if pickled and not allow_pickle:
+            raise ValueError(
+                f"{path!r} stores its vertex table as a pickle; "
+                "pass allow_pickle=True if the file is trusted"
+            )
+
+        def section(
+            start: int, count: int, typecode: str
+        ) -> typing.Sequence[typing.Any]:
+            view = buffer[start : start + 8 * count].cast(typecode)
+            if bool(flags & _BIG_ENDIAN) == (sys.byteorder == "big"):
+                return view
+
+            swapped = array(typecode, view)
+            swapped.byteswap()
+            return swapped
+
+        start = _HEADER.size
+        offsets = section(start, vertex_count + 1, "q")
+        start += 8 * (vertex_count + 1)
+        targets = section(start, edge_count, "q")
+        start += 8 * edge_count
+        weights = section(start, edge_count, "d")
+
+        vertices: typing.Sequence[typing.Any]
+        if pickled:
+            vertices = pickle.loads(buffer[table:])
+        else:
+            key_offsets = section(table, vertex_count + 1, "q")
+            order = section(table + 8 * (vertex_count + 1), vertex_count, "q")
+            vertices = _VertexTable(
+                buffer[table + 8 * (2 * vertex_count + 1) :], key_offsets, order
+            )
+
+        return CSRGraph(
+            vertices,
+            offsets,
+            targets,
+            weights,
+            directed=bool(flags & _DIRECTED),
+        )
+
+    def thaw(self) -> AdjacencyList[_T]:
+        """Rebuilds a mutable `AdjacencyList` from this snapshot."""
+        from .graph import AdjacencyList
+
+        graph: AdjacencyList[_T] = AdjacencyList(self.vertices)
+        vertices, offsets, targets, weights = (
+            self.vertices,
+            self.offsets,
+            self.targets,
+            self.weights,
+        )
+        # Every edge is stored explicitly, so the edges are added as directed ones.
+        graph.add_edges(
+            (vertices[i], vertices[targets[position]], weights[position])
+            for i in range(len(vertices))
+            for position in range(offsets[i], offsets[i + 1])
+        )
+        graph._type = self.directed
+        return graph
+
+    @property
+    def index(self) -> dict[_T, int]:
+        """Maps vertex data to its position in `vertices`. Built on first use, which
+        decodes every vertex of a loaded graph; lookups do not need it."""
+        if self._index is None:
+            self._index = {vertex: i for i, vertex in enumerate(self.vertices)}
+        return self._index
+
+    def position(self, vertex: _T) -> typing.Optional[int]:
+        """The position of `vertex` in `vertices`, or `None` if it is missing. A loaded
+        graph searches its mapped vertex table instead of building `index`."""
+        if self._index is None and isinstance(self.vertices, _VertexTable):
+            return self.vertices.position(vertex)
+        return self.index.get(vertex)
+
+    def _require(self, vertex: _T) -> int:
+        i = self.position(vertex)
+        if i is None:
+            raise ValueError(f"{vertex} is not a vertex of this graph")
+        return i
+
+    def neighbors(self, vertex: _T) -> list[_T]:
+        i = self.position(vertex)
+        if i is None:
+            raise KeyError(vertex)
+        return [
+            self.vertices[target]
+            for target in self.targets[self.offsets[i] : self.offsets[i + 1]]
+        ]
+
+    def weight(self, source: _T, destination: _T) -> typing.Optional[float]:
+        i, j = self.position(source), self.position(destination)
+        if i is None or j is None:
+            return None
+
+        for position in range(self.offsets[i], self.offsets[i + 1]):
+            if self.targets[position] == j:
+                return self.weights[position]
+        return None
+
+    def bfs_levels(
+        self, start: _T, max_depth: typing.Optional[int] = None
+    ) -> dict[_T, int]:
+        """Hop distance from `start` to every reachable vertex, one frontier per step.
+        With NumPy each frontier is expanded by a few array operations over the edge
+        slices of all its vertices; otherwise vertex by vertex."""
+        source = self._require(start)
+        np = _numpy.np
+        if np is not None:
+            vertices = self.vertices
+            offsets = np.frombuffer(self.offsets, dtype=np.int64)
+            targets = np.frombuffer(self.targets, dtype=np.int64)
+            return {
+                vertices[vertex]: depth
+                for depth, frontier in enumerate(
+                    self._frontiers(np, offsets, targets, source, max_depth)
+                )
+                for vertex in frontier.tolist()
+            }
+
+        offsets, targets = self.offsets, self.targets
+        seen = bytearray(len(self.vertices))
+        seen[source] = 1
+        levels: dict[int, int] = {source: 0}
+
+        frontier = [source]
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier: list[int] = []
+            for vertex in frontier:
+                for target in targets[offsets[vertex] : offsets[vertex + 1]]:
+                    if not seen[target]:
+                        seen[target] = 1
+                        next_frontier.append(target)
+            for vertex in next_frontier:
+                levels[vertex] = depth
+            frontier = next_frontier
+
+        return {self.vertices[vertex]: level for vertex, level in levels.items()}
+
+    def _frontiers(
+        self,
+        np: typing.Any,
+        offsets: typing.Any,
+        targets: typing.Any,
+        source: int,
+        max_depth: typing.Optional[int] = None,
+    ) -> typing.Iterator[typing.Any]:
+        """The BFS levels from the vertex id `source` as sorted NumPy arrays of vertex
+        ids."""
+        seen = np.zeros(len(self), dtype=bool)
+        seen[source] = True
+        frontier = np.array([source], dtype=np.int64)
+        depth = 0
+        while frontier.size:
+            yield frontier
+            if max_depth is not None and depth >= max_depth:
+                return
+            depth += 1
+
+            # Positions of all out-edges of the frontier: one run per vertex.
+            starts = offsets[frontier]
+            counts = offsets[frontier + 1] - starts
+            total = int(counts.sum())
+            if not total:
+                return
+            run_starts = np.cumsum(counts) - counts
+            positions = np.repeat(starts - run_starts, counts) + np.arange(total)
+
+            reached = targets[positions]
+            reached = reached[~seen[reached]]
+            if len(reached) * 16 > len(seen):
+                # Large level: deduplicate with a mask instead of sorting.
+                fresh = np.zeros(len(seen), dtype=bool)
+                fresh[reached] = True
+                frontier = np.flatnonzero(fresh)
+            else:
+                frontier = np.unique(reached)
+            seen[frontier] = True
+
+    # Centrality. Scores are computed per vertex id over the flat arrays; the public
+    # methods map them back to vertex data.
+
+    def _reversed(self) -> tuple[array[int], array[int], array[float]]:
+        """The in-edge arrays `(offsets, sources, weights)`, i.e. the CSR layout of the
+        transpose. Computed once per snapshot."""
+        if self._transpose is None:
+            np = _numpy.np
+            self._transpose = (
+                self._reversed_stdlib() if np is None else self._reversed_numpy(np)
+            )
+        return self._transpose
+
+    def _reversed_numpy(
+        self, np: typing.Any
+    ) -> tuple[array[int], array[int], array[float]]:
+        targets = np.frombuffer(self.targets, dtype=np.int64)
+        order = np.argsort(targets, kind="stable")
+        offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(targets, minlength=len(self)), out=offsets[1:])
+        return (
+            array("q", offsets.tobytes()),
+            array("q", self._edge_sources(np)[order].tobytes()),
+            array("d", np.frombuffer(self.weights, dtype=np.float64)[order].tobytes()),
+        )
+
+    def _reversed_stdlib(self) -> tuple[array[int], array[int], array[float]]:
+        size = len(self)
+        counts = [0] * (size + 1)
+        for target in self.targets:
+            counts[target + 1] += 1
+
+        offsets = array("q", counts)
+        for i in range(size):
+            offsets[i + 1] += offsets[i]
+
+        sources = array("q", bytes(8 * len(self.targets)))
+        weights = array("d", bytes(8 * len(self.targets)))
+        cursor = list(offsets[:-1])
+        for source in range(size):
+            for position in range(self.offsets[source], self.offsets[source + 1]):
+                target = self.targets[position]
+                sources[cursor[target]] = source
+                weights[cursor[target]] = self.weights[position]
+                cursor[target] += 1
+
+        return offsets, sources, weights
+
+    def _edge_sources(self, np: typing.Any) -> typing.Any:
+        """The source vertex id of every position of `targets`."""
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        return np.repeat(np.arange(len(self), dtype=np.int64), np.diff(offsets))
+
+    def _distances(
+        self,
+        source: int,
+        reverse: bool = False,
+        end: typing.Optional[int] = None,
+        parents: typing.Optional[array[int]] = None,
+    ) -> list[float]:
+        """Dijkstra from the vertex id `source` over the arrays. With `reverse` the edges
+        are followed backwards, giving the distance from every vertex to `source`.
+        Stops once `end` is settled, and records predecessors into `parents`."""
+        offsets, targets, weights = (
+            self._reversed() if reverse else (self.offsets, self.targets, self.weights)
+        )
+        distances = [float("inf")] * len(self)
+        distances[source] = 0.0
+        settled = bytearray(len(self))
+        queue: PriorityQueue[tuple[float, int]] = PriorityQueue([(0.0, source)])
+
+        while queue:
+            distance, current = queue.dequeue()
+            if settled[current]:
+                continue
+            settled[current] = 1
+            if current == end:
+                break
+
+            for position in range(offsets[current], offsets[current + 1]):
+                target = targets[position]
+                candidate = distance + weights[position]
+                if candidate < distances[target]:
+                    distances[target] = candidate
+                    if parents is not None:
+                        parents[target] = current
+                    queue.enqueue((candidate, target))
+
+        return distances
+
+    def dijkstra(self, start: _T, end: _T) -> list[tuple[_T, float]]:
+        """The shortest path from `start` to `end` as `(vertex, cost)` pairs, like
+        `AdjacencyList.dijkstra`. Raises `ValueError` when there is none, which
+        includes `start == end`."""
+        source, target = self.position(start), self.position(end)
+        if source is None or target is None or source == target:
+            raise ValueError(f"No path exists between {start} and {end}")
+
+        parents = array("q", [-1]) * len(self)
+        distances = self._distances(source, end=target, parents=parents)
+        if parents[target] == -1:
+            raise ValueError(f"No path exists between {start} and {end}")
+
+        path: list[tuple[_T, float]] = []
+        current = target
+        while current != source:
+            path.append((self.vertices[current], distances[current]))
+            current = parents[current]
+        path.append((self.vertices[source], 0))
+        path.reverse()
+        return path
+
+    def _pagerank(self, damping: float, tol: float, max_iter: int) -> list[float]:
+        size = len(self)
+        if size == 0:
+            return []
+
+        np = _numpy.np
+        if np is not None:
+            return self._pagerank_numpy(np, damping, tol, max_iter)
+
+        in_offsets, sources, _ = self._reversed()
+        out_degree = [self.offsets[i + 1] - self.offsets[i] for i in range(size)]
+        dangling = [i for i in range(size) if out_degree[i] == 0]
+        ranks = [1.0 / size] * size
+
+        for _ in range(max_iter):
+            share = [
+                rank / degree if degree else 0.0
+                for rank, degree in zip(ranks, out_degree)
+            ]
+            base = (1.0 - damping) / size + damping * sum(
+                ranks[i] for i in dangling
+            ) / size
+            pull = share.__getitem__
+            updated = [
+                base
+                + damping * sum(map(pull, sources[in_offsets[i] : in_offsets[i + 1]]))
+                for i in range(size)
+            ]
+
+            error = sum(abs(new - old) for new, old in zip(updated, ranks))
+            ranks = updated
+            if error < size * tol:
+                return ranks
+
+        raise ValueError(f"PageRank did not converge in {max_iter} iterations")
+
+    def _pagerank_numpy(
+        self, np: typing.Any, damping: float, tol: float, max_iter: int
+    ) -> list[float]:
+        size = len(self)
+        targets = np.frombuffer(self.targets, dtype=np.int64)
+        sources = self._edge_sources(np)
+        out_degree = np.diff(np.frombuffer(self.offsets, dtype=np.int64))
+        dangling = out_degree == 0
+        inverse_degree = np.divide(1.0, out_degree, out=np.zeros(size), where=~dangling)
+        ranks = np.full(size, 1.0 / size)
+
+        for _ in range(max_iter):
+            base = (1.0 - damping) / size + damping * ranks[dangling].sum() / size
+            # Every edge carries its source's share to its target.
+            pulled = np.bincount(
+                targets, weights=(ranks * inverse_degree)[sources], minlength=size
+            )
+            updated = base + damping * pulled
+
+            error = np.abs(updated - ranks).sum()
+            ranks = updated
+            if error < size * tol:
+                return ranks.tolist()
+
+        raise ValueError(f"PageRank did not converge in {max_iter} iterations")
+
+    def pagerank(
+        self, damping: float = 0.85, tol: float = 1e-6, max_iter: int = 100
+    ) -> dict[_T, float]:
+        """PageRank of every vertex (edge weights are ignored). Dangling vertices
+        spread their rank uniformly. Raises `ValueError` if the power iteration does
+        not converge to `tol` within `max_iter` rounds."""
+        return dict(zip(self.vertices, self._pagerank(damping, tol, max_iter)))
+
+    def _degree_centrality(self) -> list[float]:
+        size = len(self)
+        if size <= 1:
+            return [1.0] * size
+
+        np = _numpy.np
+        if np is not None:
+            degree = np.diff(np.frombuffer(self.offsets, dtype=np.int64))
+            if self.directed:
+                targets = np.frombuffer(self.targets, dtype=np.int64)
+                degree = degree + np.bincount(targets, minlength=size)
+            return (degree / (size - 1)).tolist()
+
+        degree = [self.offsets[i + 1] - self.offsets[i] for i in range(size)]
+        if self.directed:
+            for target in self.targets:
+                degree[target] += 1
+
+        return [value / (size - 1) for value in degree]
+
+    def degree_centrality(self) -> dict[_T, float]:
+        """Degree (in plus out for directed graphs) divided by the largest possible degree."""
+        return dict(zip(self.vertices, self._degree_centrality()))
+
+    def _closeness_centrality(self) -> list[float]:
+        size = len(self)
+        # Closeness is measured over incoming paths, hence the BFS on the transpose.
+        offsets, targets = (
+            self._reversed()[:2] if self.directed else (self.offsets, self.targets)
+        )
+        scores = [0.0] * size
+
+        np = _numpy.np
+        if np is not None:
+            offsets = np.frombuffer(offsets, dtype=np.int64)
+            targets = np.frombuffer(targets, dtype=np.int64)
+
+        for source in range(size):
+            if np is not None:
+                level_sizes = [
+                    len(frontier)
+                    for frontier in self._frontiers(np, offsets, targets, source)
+                ]
+            else:
+                level_sizes = self._level_sizes(offsets, targets, source)
+
+            reached = sum(level_sizes)
+            total = sum(depth * count for depth, count in enumerate(level_sizes))
+            if total > 0 and size > 1:
+                # Scaled by the reachable fraction (Wasserman and Faust) so that
+                # vertices of small components do not score highest.
+                scores[source] = (reached - 1) / total * (reached - 1) / (size - 1)
+
+        return scores
+
+    def _level_sizes(
+        self,
+        offsets: typing.Sequence[int],
+        targets: typing.Sequence[int],
+        source: int,
+    ) -> list[int]:
+        """How many vertices each BFS level from the vertex id `source` holds."""
+        seen = bytearray(len(self))
+        seen[source] = 1
+        frontier, sizes = [source], [1]
+        while frontier:
+            next_frontier: list[int] = []
+            for vertex in frontier:
+                for target in targets[offsets[vertex] : offsets[vertex + 1]]:
+                    if not seen[target]:
+                        seen[target] = 1
+                        next_frontier.append(target)
+            if next_frontier:
+                sizes.append(len(next_frontier))
+            frontier = next_frontier
+        return sizes
+
+    def closeness_centrality(self) -> dict[_T, float]:
+        """Reciprocal of the mean hop distance to each vertex, scaled by the fraction of
+        the graph that can reach it. Runs one BFS per vertex."""
+        return dict(zip(self.vertices, self._closeness_centrality()))
+
+    def _eigenvector_centrality(self, tol: float, max_iter: int) -> list[float]:
+        size = len(self)
+        if size == 0:
+            return []
+
+        np = _numpy.np
+        if np is not None:
+            return self._eigenvector_centrality_numpy(np, tol, max_iter)
+
+        in_offsets, sources, _ = self._reversed()
+        scores = [1.0 / size] * size
+        for _ in range(max_iter):
+            # Power iteration on (A^T + I), which has the same eigenvectors as A^T
+            # but does not oscillate on bipartite graphs.
+            pull = scores.__getitem__
+            updated = [
+                scores[i] + sum(map(pull, sources[in_offsets[i] : in_offsets[i + 1]]))
+                for i in range(size)
+            ]
+            norm = sum(value * value for value in updated) ** 0.5 or 1.0
+            updated = [value / norm for value in updated]
+
+            error = sum(abs(new - old) for new, old in zip(updated, scores))
+            scores = updated
+            if error < size * tol:
+                return scores
+
+        raise ValueError(
+            f"Eigenvector centrality did not converge in {max_iter} iterations"
+        )
+
+    def _eigenvector_centrality_numpy(
+        self, np: typing.Any, tol: float, max_iter: int
+    ) -> list[float]:
+        size = len(self)
+        targets = np.frombuffer(self.targets, dtype=np.int64)
+        sources = self._edge_sources(np)
+        scores = np.full(size, 1.0 / size)
+
+        for _ in range(max_iter):
+            updated = scores + np.bincount(
+                targets, weights=scores[sources], minlength=size
+            )
+            updated /= np.linalg.norm(updated) or 1.0
+
+            error = np.abs(updated - scores).sum()
+            scores = updated
+            if error < size * tol:
+                return scores.tolist()
+
+        raise ValueError(
+            f"Eigenvector centrality did not converge in {max_iter} iterations"
+        )
+
+    def eigenvector_centrality(
+        self, tol: float = 1e-6, max_iter: int = 100
+    ) -> dict[_T, float]:
+        """Eigenvector centrality over incoming edges, normalized to unit length."""
+        return dict(zip(self.vertices, self._eigenvector_centrality(tol, max_iter)))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> typing.Iterator[_T]:
+        yield from self.vertices
+
+    def __contains__(self, vertex: _T) -> bool:
+        return self.position(vertex) is not None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(vertices={len(self.vertices)}, "
+            f"edges={len(self.targets)}, directed={self.directed})"
+        )
+
+
+__all__ = ["CSRGraph"]
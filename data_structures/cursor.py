@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import typing
+
+from ._protocols import CT
+from .nodes import AVLTreeNode, BinarySearchTreeNode
+from .nodes import DoublyLinkedListNode as DLLNode
+
+if typing.TYPE_CHECKING:
+    from .adelson_velsky_landis import AVL
+    from .binary_search_tree import BinarySearchTree
+    from .linked_lists import DoublyLinkedList
+
+_TreeNode = typing.Union[AVLTreeNode[typing.Any], BinarySearchTreeNode[typing.Any]]
+
+
+class Cursor(typing.Generic[CT]):
+    """A finger on one element of an ordered structure. `next`/`prev` step to the
+    neighbouring element and `seek(key)` moves to the first element not smaller than
+    `key`, starting from the current position, so a sweep of nearby lookups costs
+    the distance travelled instead of a fresh search each time.
+
+    A cursor that steps past either end is no longer `valid`. Changing the structure
+    invalidates its cursors; reposition them with `first`, `last` or `seek`.
+    """
+
+    @property
+    def valid(self) -> bool:
+        ...
+
+    @property
+    def value(self) -> CT:
+        ...
+
+    def first(self) -> bool:
+        ...
+
+    def last(self) -> bool:
+        ...
+
+    def next(self) -> bool:
+        ...
+
+    def prev(self) -> bool:
+        ...
+
+    def seek(self, key: CT) -> bool:
+        ...
+
+    def _missing(self) -> IndexError:
+        return IndexError(f"{type(self).__name__} is not positioned on an element")
+
+    def __iter__(self) -> typing.Iterator[CT]:
+        """Yields the values from the current position to the end, moving the cursor."""
+        while self.valid:
+            yield self.value
+            self.next()
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+class ListCursor(Cursor[CT]):
+    """A `Cursor` over a `DoublyLinkedList`. `seek` assumes the list is sorted."""
+
+    def __init__(
+        self,
+        items: DoublyLinkedList[CT],
+        node: typing.Optional[DLLNode[CT]] = None,
+    ) -> None:
+        self.list = items
+        self.node = node if node is not None else items._head
+
+    @property
+    def valid(self) -> bool:
+        return self.node is not None
+
+    @property
+    def value(self) -> CT:
+        if self.node is None:
+            raise self._missing()
+        return self.node.value
+
+    def first(self) -> bool:
+        self.node = self.list._head
+        return self.valid
+
+    def last(self) -> bool:
+        self.node = self.list._tail
+        return self.valid
+
+    def next(self) -> bool:
+        if self.node is not None:
+            self.node = self.node.next
+        return self.valid
+
+    def prev(self) -> bool:
+        if self.node is not None:
+            self.node = self.node.previous
+        return self.valid
+
+    def seek(self, key: CT) -> bool:
+        node = self.node
+        if node is None:
+            # Past the end: come back from the tail.
+            node = self.list._tail
+            if node is None or node.value < key:
+                return False
+
+        if node.value < key:
+            while node is not None and node.value < key:
+                node = node.next
+        else:
+            while node.previous is not None and not node.previous.value < key:
+                node = node.previous
+
+        self.node = node
+        return self.valid
+
+
+class TreeCursor(Cursor[CT]):
+    """A `Cursor` over an `AVL` or a `BinarySearchTree`, in in-order.
+
+    The cursor keeps the path from the root, and every entry on it remembers the
+    ancestors that bound its subtree: the nearest one it hangs to the right of
+    (`low`) and to the left of (`high`). Stepping to a neighbour and seeking only
+    climb as far as those bounds require, so nearby moves are cheap.
+    """
+
+    def __init__(self, tree: typing.Union[AVL[CT], BinarySearchTree[CT]]) -> None:
+        self.tree = tree
+        # (node, low, high) from the root down to the current node.
+        self._path: list[
+            tuple[_TreeNode, typing.Optional[_TreeNode], typing.Optional[_TreeNode]]
+        ] = []
+        self.first()
+
+    @property
+    def valid(self) -> bool:
+        return bool(self._path)
+
+    @property
+    def value(self) -> CT:
+        if not self._path:
+            raise self._missing()
+        return self._path[-1][0].value
+
+    def _descend(self, left: bool) -> None:
+        """Follows the left (or right) spine below the current node."""
+        node, low, high = self._path[-1]
+        child = node.left if left else node.right
+        while child is not None:
+            if left:
+                low, high = low, node
+            else:
+                low, high = node, high
+            self._path.append((child, low, high))
+            node, child = child, child.left if left else child.right
+
+    def _climb_to(self, ancestor: typing.Optional[_TreeNode]) -> None:
+        """Truncates the path at `ancestor`, or empties it when `ancestor` is `None`."""
+        if ancestor is None:
+            self._path.clear()
+            return
+        while self._path[-1][0] is not ancestor:
+            self._path.pop()
+
+    def _start(self) -> bool:
+        self._path.clear()
+        if self.tree.root is None:
+            return False
+        self._path.append((self.tree.root, None, None))
+        return True
+
+    def first(self) -> bool:
+        if self._start():
+            self._descend(left=True)
+        return self.valid
+
+    def last(self) -> bool:
+        if self._start():
+            self._descend(left=False)
+        return self.valid
+
+    def next(self) -> bool:
+        if not self._path:
+            return False
+
+        node, low, high = self._path[-1]
+        if node.right is not None:
+            self._path.append((node.right, node, high))
+            self._descend(left=True)
+        else:
+            self._climb_to(high)
+        return self.valid
+
+    def prev(self) -> bool:
+        if not self._path:
+            return False
+
+        node, low, high = self._path[-1]
+        if node.left is not None:
+            self._path.append((node.left, low, node))
+            self._descend(left=False)
+        else:
+            self._climb_to(low)
+        return self.valid
+
+    def seek(self, key: CT) -> bool:
+        path = self._path
+        # Climb until the subtree (plus its `high` bound) must hold the answer.
+        while path:
+            _, low, high = path[-1]
+            if (low is None or low.value < key) and (
+                high is None or not high.value < key
+            ):
+                break
+            path.pop()
+
+        if not path and not self._start():
+            return False
+
+        # Lower bound search inside the subtree.
+        best: typing.Optional[int] = None
+        node, low, high = path[-1]
+        bound = high
+        while True:
+            if not node.value < key:
+                best = len(path)
+                child, low, high = node.left, low, node
+            else:
+                child, low, high = node.right, node, high
+            if child is None:
+                break
+            path.append((child, low, high))
+            node = child
+
+        if best is None:
+            self._climb_to(bound)
+        else:
+            del path[best:]
+        return self.valid
+
+
+__all__ = ["Cursor", "ListCursor", "TreeCursor"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import typing
+
+from .graph import AdjacencyList, _Vertex
+from .priority_queue import PriorityQueue
+
+_T = typing.TypeVar("_T")
+
+
+class DynamicShortestPaths(typing.Generic[_T]):
+    """Shortest path trees from a fixed set of sources, kept up to date while edges
+    are added to (or made cheaper in) the graph.
+
+    A new or cheaper edge can only shorten paths, so each update relaxes the edge
+    and runs a Dijkstra that is seeded with the improved vertex and stops where
+    distances stop improving. The cost is proportional to the part of the tree that
+    actually changes, not to the size of the graph. Weights must be non-negative.
+    """
+
+    def __init__(
+        self,
+        graph: AdjacencyList[_T],
+        sources: typing.Iterable[_T | _Vertex[_T]],
+    ) -> None:
+        self.graph = graph
+        self._records: dict[
+            _Vertex[_T], dict[_Vertex[_T], tuple[_Vertex[_T], float]]
+        ] = {}
+
+        for source in sources:
+            vertex = graph._resolve(source)
+            self._records[vertex] = dict(graph.shortest_path_tree(vertex))
+
+        graph.subscribe(self._on_edge)
+
+    def close(self) -> None:
+        """Stops following changes to the graph. Safe to call more than once."""
+        if self._on_edge in self.graph._listeners:
+            self.graph.unsubscribe(self._on_edge)
+
+    def _distance(
+        self,
+        source: _Vertex[_T],
+        record: dict[_Vertex[_T], tuple[_Vertex[_T], float]],
+        vertex: _Vertex[_T],
+    ) -> float:
+        if vertex is source:
+            return 0.0
+        entry = record.get(vertex)
+        return float("inf") if entry is None else entry[1]
+
+    def _on_edge(
+        self, source: _Vertex[_T], destination: _Vertex[_T], weight: float
+    ) -> None:
+        if weight < 0:
+            raise ValueError("DynamicShortestPaths requires non-negative weights")
+
+        for root, record in self._records.items():
+            candidate = self._distance(root, record, source) + weight
+            if candidate >= self._distance(root, record, destination):
+                continue
+
+            record[destination] = (source, candidate)
+            queue: PriorityQueue[tuple[float, int, _Vertex[_T]]] = PriorityQueue(
+                [(candidate, destination.index, destination)]
+            )
+            while queue:
+                distance, _, current = queue.dequeue()
+                if distance > self._distance(root, record, current):
+                    continue
+
+                for target, edge_weight in zip(
+                    self.graph._targets[current.index],
+                    self.graph._weights[current.index],
+                ):
+                    improved = distance + edge_weight
+                    neighbor = self.graph.vertex_at(target)
+                    if improved < self._distance(root, record, neighbor):
+                        record[neighbor] = (current, improved)
+                        queue.enqueue((improved, neighbor.index, neighbor))
+
+    def _record(
+        self, source: _T | _Vertex[_T]
+    ) -> tuple[_Vertex[_T], dict[_Vertex[_T], tuple[_Vertex[_T], float]]]:
+        vertex = self.graph._resolve(source)
+        if vertex not in self._records:
+            raise ValueError(f"{source} is not one of the tracked sources")
+        return vertex, self._records[vertex]
+
+    def distance(self, source: _T | _Vertex[_T], target: _T | _Vertex[_T]) -> float:
+        """Current distance from `source` to `target` (`inf` when unreachable)."""
+        root, record = self._record(source)
+        return self._distance(root, record, self.graph._resolve(target))
+
+    def path(
+        self, source: _T | _Vertex[_T], target: _T | _Vertex[_T]
+    ) -> typing.Iterator[tuple[_T, float]]:
+        """Current shortest path as `(data, cost)` pairs, like `AdjacencyList.dijkstra`."""
+        root, record = self._record(source)
+        return self.graph._build_path(record, root, self.graph._resolve(target))
+
+    def tree(
+        self, source: _T | _Vertex[_T]
+    ) -> typing.Mapping[_Vertex[_T], tuple[_Vertex[_T], float]]:
+        """Current `(predecessor, cost)` mapping, like `AdjacencyList.shortest_path_tree`."""
+        _, record = self._record(source)
+        return record.copy()
+
+
+__all__ = ["DynamicShortestPaths"]
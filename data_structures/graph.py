@@ -1,30 +1,44 @@
 from __future__ import annotations
 
 import enum
+import multiprocessing
 import operator
 import typing
-from collections import OrderedDict, defaultdict
-
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from types import MappingProxyType
+
+from . import _numpy
+from .cache import CacheStats, LRUCache
+from .csr_graph import CSRGraph
+from .landmarks import Landmarks
 from .priority_queue import PriorityQueue
 
 _T = typing.TypeVar("_T")
 
 
 class _Vertex(typing.Generic[_T]):
-    def __init__(self, data: _T) -> None:
+    __slots__ = ("_data", "_hash", "index")
+
+    def __init__(self, data: _T, index: int = -1) -> None:
         self._data = data
+        self._hash = hash(data)
+        self.index = index
 
     def __iter__(self) -> typing.Iterator[_T]:
         yield self._data
 
-    def __eq__(self, __o: _Vertex[_T]) -> bool:
-        try:
+    def __eq__(self, __o: object) -> bool:
+        if self is __o:
+            return True
+        if isinstance(__o, _Vertex):
             return self._data == __o._data
-        except:
-            return NotImplemented
+        return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self._data)
+        return self._hash
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(data={self._data!r})"
@@ -34,17 +48,28 @@ class _Vertex(typing.Generic[_T]):
 
 
 class _Edge(tuple["_Vertex[_T]", "_Vertex[_T]", float]):
+    """A `(source, destination, weight)` view of one stored edge. Graphs keep their
+    edges in flat arrays and only build these on demand, so they carry no state of
+    their own."""
+
+    __slots__ = ()
+
     def __new__(
         cls, source: _Vertex[_T], destination: _Vertex[_T], weight: float = 0
     ) -> _Edge[_T]:
         return tuple.__new__(cls, (source, destination, weight))
 
-    def __init__(
-        self, source: _Vertex[_T], destination: _Vertex[_T], weight: float = 0
-    ) -> None:
-        self.source: _Vertex[_T] = source
-        self.destination: _Vertex[_T] = destination
-        self.weight: float = weight
+    @property
+    def source(self) -> _Vertex[_T]:
+        return self[0]
+
+    @property
+    def destination(self) -> _Vertex[_T]:
+        return self[1]
+
+    @property
+    def weight(self) -> float:
+        return self[2]
 
     def __hash__(self) -> int:
         return hash((self.source, self.destination, self.weight))
@@ -59,9 +84,6 @@ class _Edge(tuple["_Vertex[_T]", "_Vertex[_T]", float]):
         except:
             return NotImplemented
 
-    def __iter__(self) -> typing.Iterator[typing.Union[_Vertex[_T], float]]:
-        yield from (self.source, self.destination, self.weight)
-
     def __repr__(self) -> str:
         return (
             f"{type(self).__name__}(source={self.source}, "
@@ -72,16 +94,103 @@ class _Edge(tuple["_Vertex[_T]", "_Vertex[_T]", float]):
         return f"{str(self.source)} -({self.weight})-> {str(self.destination)}"
 
 
+class _DisjointSet:
+    """Union-find over the integers `0..size - 1` with path compression and union by rank."""
+
+    def __init__(self, size: int) -> None:
+        self._parent: list[int] = list(range(size))
+        self._rank: list[int] = [0] * size
+
+    def find(self, item: int) -> int:
+        parent = self._parent
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """Merges the sets holding `a` and `b`. Returns `False` if they were already merged."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+
+        if self._rank[root_a] < self._rank[root_b]:
+            root_a, root_b = root_b, root_a
+
+        self._parent[root_b] = root_a
+        if self._rank[root_a] == self._rank[root_b]:
+            self._rank[root_a] += 1
+
+        return True
+
+
+# `(weights, sources, targets, labels)` of a Borůvka worker: the edge arrays, sent
+# once by the pool initializer, and the component label of every vertex, which lives
+# in memory shared with the parent process.
+_boruvka_state: tuple[typing.Any, ...] = ()
+
+
+def _init_boruvka_worker(
+    weights: array[float], sources: array[int], targets: array[int], labels: typing.Any
+) -> None:
+    global _boruvka_state
+    _boruvka_state = (weights, sources, targets, memoryview(labels).cast("B").cast("q"))
+
+
+def _cheapest_edges(
+    lo: int, hi: int, state: typing.Optional[tuple[typing.Any, ...]] = None
+) -> dict[int, tuple[float, int]]:
+    """Scans edges `lo` to `hi` and returns the cheapest `(weight, index)` leaving every component.
+    Ties are broken by edge index so that every scan agrees on a single total order."""
+    weights, sources, targets, labels = _boruvka_state if state is None else state
+
+    cheapest: dict[int, tuple[float, int]] = {}
+    for index in range(lo, hi):
+        comp_u, comp_v = labels[sources[index]], labels[targets[index]]
+        if comp_u == comp_v:
+            continue
+
+        candidate = (weights[index], index)
+        for comp in (comp_u, comp_v):
+            current = cheapest.get(comp)
+            if current is None or candidate < current:
+                cheapest[comp] = candidate
+
+    return cheapest
+
+
 class _Graphable(typing.Generic[_T]):
     def __init__(
         self,
         directed: bool = True,
     ) -> None:
         self._type = directed
+        self._vertices: dict[typing.Any, _Vertex[_T]] = {}
+        self._vertex_list: list[_Vertex[_T]] = []
 
     def create_vertex(self, data: _T) -> _Vertex[_T]:
         return _Vertex(data)
 
+    def vertex(self, data: _T | _Vertex[_T]) -> typing.Optional[_Vertex[_T]]:
+        """Returns the canonical vertex for `data`, or `None` if it is not in the graph."""
+        if isinstance(data, _Vertex):
+            data = data._data
+        return self._vertices.get(data)
+
+    def vertex_at(self, index: int) -> _Vertex[_T]:
+        """Returns the vertex with the dense integer id `index` (its creation order)."""
+        return self._vertex_list[index]
+
+    def _resolve(self, data: _T | _Vertex[_T]) -> _Vertex[_T]:
+        vertex = self.vertex(data)
+        if vertex is None:
+            raise ValueError(f"{data} is not a vertex of this graph")
+        return vertex
+
     def add(
         self,
         source: _Vertex[_T],
@@ -101,7 +210,9 @@ class _Graphable(typing.Generic[_T]):
     ) -> typing.Iterable[tuple[_Vertex[_T], float]]:
         ...
 
-    def minimum_spanning_tree(self) -> AdjacencyList[_T]:
+    def minimum_spanning_tree(
+        self, algorithm: str = "prim", processes: typing.Optional[int] = None
+    ) -> AdjacencyList[_T]:
         ...
 
     def a_star(
@@ -112,36 +223,131 @@ class _Graphable(typing.Generic[_T]):
     ) -> typing.Iterable[tuple[_T, float]]:
         ...
 
+    def _build_path(
+        self,
+        record: dict[_Vertex[_T], tuple[_Vertex[_T], float]],
+        start: _Vertex[_T],
+        end: _Vertex[_T],
+    ) -> typing.Iterator[tuple[_T, float]]:
+        path: list[tuple[_T, float]] = []
+
+        while True:
+            current, cost = record.get(end, (start, float("-inf")))
+            if cost == float("-inf"):
+                if len(path) == 0:
+                    raise ValueError(f"No path exists between {start} and {end}")
+                path.append((start._data, 0))
+                return reversed(path)
+
+            path.append((end._data, cost))
+            end = current
+
+    def __iter__(self) -> typing.Iterator[_Vertex[_T]]:
+        ...
+
+    def __str__(self) -> str:
+        msg = ["{\n"]
+        space = "  " * 2
+        inner_msg = []
+
+        def edges_to_str(items: list[_Edge[_T]]) -> typing.Iterator[str]:
+            return (f"{str(edge.destination)}, cost: {edge.weight}" for edge in items)
+
+        for key in self:
+            new_line = f"\n{space * 2}  "
+            inner_str = f"{new_line}".join(edges_to_str(self.edges(key) or []))
+            inner_str += f"\n{space*2}]" if inner_str else "]"
+            if inner_str != "]":
+                inner_str = f"{new_line}{inner_str}"
+            inner_msg.append(f"{space}{str(key)}: [{inner_str}")
+
+        msg.append("\n".join(inner_msg))
+        msg.append("\n}")
+        return "".join(msg)
+
+
+class _AdjacencyView(typing.Mapping["_Vertex[_T]", "tuple[_Edge[_T], ...]"]):
+    """Read-only `vertex -> (_Edge, ...)` mapping over the columnar edge arrays of an
+    `AdjacencyList`. The edges are collected on every lookup, into a tuple so that
+    code that used to mutate the old dict of lists fails loudly."""
+
+    def __init__(self, graph: AdjacencyList[_T]) -> None:
+        self._graph = graph
+
+    def __getitem__(self, vertex: _Vertex[_T]) -> tuple[_Edge[_T], ...]:
+        canonical = self._graph.vertex(vertex)
+        if canonical is None:
+            raise KeyError(vertex)
+        return tuple(self._graph._edge_list(canonical))
+
+    def __iter__(self) -> typing.Iterator[_Vertex[_T]]:
+        return iter(self._graph._vertex_list)
+
+    def __len__(self) -> int:
+        return len(self._graph._vertex_list)
+
 
 class AdjacencyList(_Graphable[_T]):
+    """Graph stored as adjacency lists. The edges of each vertex live in two parallel
+    arrays indexed by `vertex.index`: destination indices (`array("q")`) and weights
+    (`array("d")`), so an edge costs 16 bytes instead of a Python object."""
+
     def __init__(
         self,
         __items: typing.Optional[typing.Union[list[_T], typing.Iterable[_T]]] = None,
         directed: bool = True,
     ) -> None:
         super().__init__(directed)
-        self.adjacency_list: dict[_Vertex[_T], list[_Edge[_T]]] = OrderedDict()
+        self._targets: list[array[int]] = []
+        self._weights: list[array[float]] = []
+        self._version: int = 0
+        self._path_cache: typing.Optional[LRUCache[tuple, typing.Any]] = None
+        self._path_cache_version: int = 0
+        self._frozen: typing.Optional[tuple[int, CSRGraph[_T]]] = None
+        self._listeners: list[
+            typing.Callable[[_Vertex[_T], _Vertex[_T], float], None]
+        ] = []
 
         if __items is not None:
             for item in __items:
                 self.create_vertex(item)
 
-    def create_vertex(self, data: _T) -> _Vertex[_T]:
-        vertex = _Vertex(data=data)
-
-        if not (vertex in self.adjacency_list):
-            self.adjacency_list[vertex] = []
+    def create_vertex(self, data: _T | _Vertex[_T]) -> _Vertex[_T]:
+        """Returns the canonical vertex for `data`, creating it on first use.
+        Repeated calls with equal data return the very same object."""
+        if isinstance(data, _Vertex):
+            data = data._data
+
+        vertex = self._vertices.get(data)
+        if vertex is None:
+            vertex = _Vertex(data=data, index=len(self._vertex_list))
+            self._vertices[data] = vertex
+            self._vertex_list.append(vertex)
+            self._targets.append(array("q"))
+            self._weights.append(array("d"))
+            self._version += 1
 
         return vertex
 
     def add_directed_edge(
-        self, source: _Vertex[_T], destination: _Vertex[_T], weight: int | float = 0
+        self,
+        source: _T | _Vertex[_T],
+        destination: _T | _Vertex[_T],
+        weight: int | float = 0,
     ):
-        edge = _Edge(source=source, destination=destination, weight=weight)
-        self.adjacency_list.setdefault(source, []).append(edge)
+        source = self.create_vertex(source)
+        destination = self.create_vertex(destination)
+        self._targets[source.index].append(destination.index)
+        self._weights[source.index].append(weight)
+        self._version += 1
+
+        for listener in self._listeners:
+            listener(source, destination, weight)
 
     def add_undirected_edge(
-        self, vertices: tuple[_Vertex[_T], _Vertex[_T]], weight: float | int = 0
+        self,
+        vertices: tuple[_T | _Vertex[_T], _T | _Vertex[_T]],
+        weight: float | int = 0,
     ):
         source, destination = vertices
         self.add_directed_edge(source=source, destination=destination, weight=weight)
@@ -149,8 +355,8 @@ class AdjacencyList(_Graphable[_T]):
 
     def add(
         self,
-        source: _Vertex[_T],
-        destination: _Vertex[_T],
+        source: _T | _Vertex[_T],
+        destination: _T | _Vertex[_T],
         weight: float = 0,
     ) -> None:
         match self._type:
@@ -161,162 +367,1063 @@ class AdjacencyList(_Graphable[_T]):
             case _:
                 self.add_undirected_edge(vertices=(source, destination), weight=weight)
 
+    def add_edges(
+        self,
+        edges: typing.Iterable[
+            tuple[_T | _Vertex[_T], _T | _Vertex[_T]]
+            | tuple[_T | _Vertex[_T], _T | _Vertex[_T], float]
+        ],
+    ) -> int:
+        """Bulk version of `add` for `(source, destination[, weight])` tuples of vertices
+        or raw vertex data. Each distinct vertex is created and hashed once for the whole
+        batch. Returns the number of edges read."""
+        directed = self._type
+        interned: dict[typing.Any, tuple[_Vertex[_T], array[int], array[float]]] = {}
+
+        def intern(data: typing.Any) -> tuple[_Vertex[_T], array[int], array[float]]:
+            entry = interned.get(data)
+            if entry is None:
+                vertex = self.create_vertex(data)
+                entry = interned[data] = (
+                    vertex,
+                    self._targets[vertex.index],
+                    self._weights[vertex.index],
+                )
+            return entry
+
+        count = 0
+        for edge in edges:
+            source, source_targets, source_weights = intern(edge[0])
+            destination, destination_targets, destination_weights = intern(edge[1])
+            weight = edge[2] if len(edge) > 2 else 0  # type: ignore
+
+            source_targets.append(destination.index)
+            source_weights.append(weight)
+            if not directed:
+                destination_targets.append(source.index)
+                destination_weights.append(weight)
+            # Bump per edge, so neither listeners nor a batch that fails halfway
+            # can be served a path cached before the edge existed.
+            self._version += 1
+            count += 1
+
+            for listener in self._listeners:
+                listener(source, destination, weight)
+                if not directed:
+                    listener(destination, source, weight)
+
+        return count
+
+    def decrease_weight(
+        self,
+        source: _T | _Vertex[_T],
+        destination: _T | _Vertex[_T],
+        weight: float,
+    ) -> None:
+        """Lowers the weight of the existing edge(s) from `source` to `destination`
+        (both directions for undirected graphs)."""
+        source, destination = self._resolve(source), self._resolve(destination)
+        pairs = [(source, destination)]
+        if not self._type:
+            pairs.append((destination, source))
+
+        updates: list[tuple[array[float], list[int]]] = []
+        for src, dst in pairs:
+            weights = self._weights[src.index]
+            positions = [
+                i
+                for i, target in enumerate(self._targets[src.index])
+                if target == dst.index
+            ]
+            if not positions:
+                raise ValueError(f"No edge exists between {src} and {dst}")
+            if any(weights[i] < weight for i in positions):
+                raise ValueError(f"Cannot increase the weight of {src} -> {dst}")
+            updates.append((weights, positions))
+
+        for weights, positions in updates:
+            for i in positions:
+                weights[i] = weight
+
+        self._version += 1
+        for src, dst in pairs:
+            for listener in self._listeners:
+                listener(src, dst, weight)
+
+    def subscribe(
+        self, listener: typing.Callable[[_Vertex[_T], _Vertex[_T], float], None]
+    ) -> None:
+        """Calls `listener(source, destination, weight)` after every directed edge that
+        is added or made cheaper."""
+        self._listeners.append(listener)
+
+    def unsubscribe(
+        self, listener: typing.Callable[[_Vertex[_T], _Vertex[_T], float], None]
+    ) -> None:
+        self._listeners.remove(listener)
+
+    @staticmethod
+    def from_edge_file(
+        path: str,
+        delimiter: typing.Optional[str] = ",",
+        directed: bool = True,
+        vertex_type: typing.Callable[[str], typing.Any] = str,
+        chunk_size: int = 1 << 20,
+    ) -> AdjacencyList[typing.Any]:
+        """Streams an edge list file, one `source<delimiter>destination[<delimiter>weight]`
+        per line, into a new graph. Empty lines and lines starting with `#` are skipped.
+        A `delimiter` of `None` splits on any whitespace. The file is read `chunk_size`
+        bytes at a time, so memory use is bounded by the graph, not by the file."""
+
+        def read_edges() -> typing.Iterator[tuple[typing.Any, ...]]:
+            with open(path, "r", newline="") as file:
+                while True:
+                    lines = file.readlines(chunk_size)
+                    if not lines:
+                        return
+
+                    for line in lines:
+                        line = line.strip()
+                        if not line or line.startswith("#"):
+                            continue
+
+                        fields = line.split(delimiter)
+                        match len(fields):
+                            case 2:
+                                yield vertex_type(fields[0]), vertex_type(fields[1])
+                            case 3:
+                                yield (
+                                    vertex_type(fields[0]),
+                                    vertex_type(fields[1]),
+                                    float(fields[2]),
+                                )
+                            case _:
+                                raise ValueError(
+                                    f"Expected 2 or 3 fields per edge, instead got {line!r}"
+                                )
+
+        graph: AdjacencyList[typing.Any] = AdjacencyList(directed=directed)
+        graph.add_edges(read_edges())
+        return graph
+
     def weight(
-        self, source: _Vertex[_T], destination: _Vertex[_T]
+        self, source: _T | _Vertex[_T], destination: _T | _Vertex[_T]
     ) -> typing.Optional[int | float]:
-        if not (source in self.adjacency_list):
+        source_vertex, destination_vertex = self.vertex(source), self.vertex(
+            destination
+        )
+        if source_vertex is None or destination_vertex is None:
             return None
 
-        for edge in self.adjacency_list[source]:
-            if edge.destination == destination:
-                return edge.weight
-
-        return None
+        try:
+            position = self._targets[source_vertex.index].index(
+                destination_vertex.index
+            )
+        except ValueError:
+            return None
+        return self._weights[source_vertex.index][position]
 
-    def edges(self, source: _Vertex[_T]) -> typing.Optional[list[_Edge[_T]]]:
-        return self.adjacency_list.get(source, None)
+    def edges(self, source: _T | _Vertex[_T]) -> typing.Optional[list[_Edge[_T]]]:
+        vertex = self.vertex(source)
+        if vertex is None:
+            return None
+        return self._edge_list(vertex)
+
+    def _edge_list(self, vertex: _Vertex[_T]) -> list[_Edge[_T]]:
+        vertices = self._vertex_list
+        return [
+            _Edge(vertex, vertices[target], weight)
+            for target, weight in zip(
+                self._targets[vertex.index], self._weights[vertex.index]
+            )
+        ]
+
+    @property
+    def adjacency_list(self) -> typing.Mapping[_Vertex[_T], tuple[_Edge[_T], ...]]:
+        """Read-only `vertex -> edges` view, kept for compatibility. Prefer `edges`;
+        add edges with `add` or `add_edges`."""
+        return _AdjacencyView(self)
+
+    @property
+    def version(self) -> int:
+        """Mutation counter, bumped whenever a vertex or an edge is added."""
+        return self._version
+
+    def enable_path_cache(self, maxsize: int = 128) -> None:
+        """Memoizes up to `maxsize` shortest path results (LRU). Entries are keyed by the
+        graph version, so a result is never served after the graph has been mutated."""
+        assert maxsize > 0, "maxsize must be a positive integer"
+
+        if self._path_cache is None:
+            self._path_cache = LRUCache(maxsize)
+        else:
+            self._path_cache.resize(maxsize)
+
+    def disable_path_cache(self) -> None:
+        self._path_cache = None
+
+    @property
+    def path_cache_stats(self) -> typing.Optional[CacheStats]:
+        """Hits, misses and evictions of the path cache, `None` while it is disabled."""
+        return None if self._path_cache is None else self._path_cache.stats
+
+    def _cached(
+        self, key: tuple, compute: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        cache = self._path_cache
+        if cache is None:
+            return compute()
+
+        if self._path_cache_version != self._version:
+            cache.clear()
+            self._path_cache_version = self._version
+
+        return cache.get_or_put((*key, self._version), compute)
 
     def _visit_vertecies(
         self,
-        visited: set[_Vertex[_T]],
         start: _Vertex[_T],
-        end: _Vertex[_T],
+        end: typing.Optional[_Vertex[_T]],
         heuristic: typing.Callable[[_T, _T], float] = lambda a, b: 0.0,
     ) -> dict[_Vertex[_T], tuple[_Vertex[_T], float]]:
-        queue: PriorityQueue[_Edge[_T]] = PriorityQueue(
-            [_Edge(start, start, 0.0)],
-            key=lambda a, b: operator.lt(
-                a.weight + getattr(a, "estimate", 0.0),
-                b.weight + getattr(b, "estimate", 0.0),
-            ),
-        )
-
-        record: dict[_Vertex[_T], tuple[_Vertex[_T], float]] = defaultdict(
-            lambda: (
-                _Vertex(
-                    data=type(
-                        _T.__class__
-                    )  # trying to create an default instance of the type being used.
-                ),
-                float("-inf"),
-            )
+        """Dijkstra (or A* with `heuristic`) from `start`, stopping at `end` when given.
+        Queue entries are `(cost + estimate, cost, vertex index, predecessor index)`."""
+        vertices, targets, weights = self._vertex_list, self._targets, self._weights
+        goal = -1 if end is None else end.index
+        queue: PriorityQueue[tuple[float, float, int, int]] = PriorityQueue(
+            [(0.0, 0.0, start.index, start.index)]
         )
+        settled = bytearray(len(vertices))
+        record: dict[_Vertex[_T], tuple[_Vertex[_T], float]] = {}
 
         while queue:
-            src, dst, weight = queue.dequeue()
-            visited.add(dst)
+            _, cost, current, parent = queue.dequeue()
+            if settled[current]:
+                continue
+            settled[current] = 1
 
-            if record[dst][1] == float("-inf") and dst != start:
-                record[dst] = (src, weight)
+            if current != start.index:
+                record[vertices[current]] = (vertices[parent], cost)
 
-            if dst == end:
+            if current == goal:
                 break
 
-            for neighbor in self.adjacency_list[dst]:
-                if neighbor not in visited:
-                    e_src, e_dst, e_wgt = neighbor
-                    edge = _Edge(e_src, e_dst, e_wgt + weight)
-                    setattr(edge, "estimate", heuristic(e_dst._data, end._data))
-                    queue.enqueue(edge)
+            for target, weight in zip(targets[current], weights[current]):
+                if not settled[target]:
+                    candidate = cost + weight
+                    estimate = (
+                        0.0
+                        if end is None
+                        else heuristic(vertices[target]._data, end._data)
+                    )
+                    queue.enqueue((candidate + estimate, candidate, target, current))
 
         return record
 
-    def _build_path(
-        self,
-        record: dict[_Vertex[_T], tuple[_Vertex[_T], float]],
-        start: _Vertex[_T],
-        end: _Vertex[_T],
+    def dijkstra(
+        self, start: _T | _Vertex[_T], end: _T | _Vertex[_T]
     ) -> typing.Iterator[tuple[_T, float]]:
-        path: list[tuple[_T, float]] = []
+        """The shortest path from `start` to `end` as `(vertex, cumulative cost)`
+        pairs. Raises `ValueError` when there is none; a vertex has no path to
+        itself, so that includes `start == end`."""
+        start_vertex, end_vertex = self.vertex(start), self.vertex(end)
+        if start_vertex is None or end_vertex is None:
+            raise ValueError(f"No path exists between {start} and {end}")
+        start, end = start_vertex, end_vertex
 
-        while True:
-            current, cost = record[end]
-            if cost == float("-inf"):
-                if len(path) == 0:
-                    raise ValueError(f"No path exists between {start} and {end}")
-                path.append((start._data, 0))
-                return reversed(path)
+        def compute() -> list[tuple[_T, float]]:
+            record = self._visit_vertecies(start=start, end=end)
+            return list(self._build_path(record, start, end))
 
-            path.append((end._data, cost))
-            end = current
+        return iter(self._cached((start, end, None), compute))
 
-    def dijkstra(
-        self, start: _Vertex[_T], end: _Vertex[_T]
-    ) -> typing.Iterator[tuple[_T, float]]:
-        if start not in self.adjacency_list or end not in self.adjacency_list:
-            raise ValueError(f"No path exists between {start} and {end}")
+    def shortest_path_tree(
+        self, source: _T | _Vertex[_T]
+    ) -> typing.Mapping[_Vertex[_T], tuple[_Vertex[_T], float]]:
+        """Maps every vertex reachable from `source` to its `(predecessor, cost)` pair.
+        The mapping has the same shape as the record consumed by `_build_path`."""
+        source = self._resolve(source)
 
-        record: dict[_Vertex[_T], tuple[_Vertex[_T], float]] = self._visit_vertecies(
-            visited=set(), start=start, end=end
-        )
+        def compute() -> typing.Mapping[_Vertex[_T], tuple[_Vertex[_T], float]]:
+            return MappingProxyType(self._visit_vertecies(start=source, end=None))
 
-        return self._build_path(record, start, end)
+        return self._cached((source, None, None), compute)
+
+    def minimum_spanning_tree(
+        self, algorithm: str = "prim", processes: typing.Optional[int] = None
+    ) -> AdjacencyList[_T]:
+        """Builds a minimum spanning tree of an undirected graph.
 
-    def minimum_spanning_tree(self) -> AdjacencyList[_T]:
+        `algorithm` is one of `"prim"` (default), `"kruskal"` or `"boruvka"`.
+        Prim only spans the component of the first vertex, while Kruskal and
+        Borůvka return a spanning forest covering every vertex.
+        `processes` is only used by Borůvka, which then scans edges across a process pool.
+        """
         if self._type:
             raise ValueError(
                 "Cannot create Minimum Spanning Tree out of a directed graph"
             )
 
-        start: typing.Optional[_Vertex[_T]] = None
-        for key in self.adjacency_list:
-            start = key
-            break
+        match algorithm:
+            case "prim":
+                return self._prim()
+            case "kruskal":
+                return self._kruskal()
+            case "boruvka":
+                return self._boruvka(processes)
+            case _:
+                raise ValueError(
+                    f"Expected algorithm to be one of 'prim', 'kruskal' or 'boruvka', instead got {algorithm!r}"
+                )
 
-        assert start is not None, "No Minimum Spanning Tree for empty graph"
+    def _prim(self) -> AdjacencyList[_T]:
+        assert self._vertex_list, "No Minimum Spanning Tree for empty graph"
 
-        visited: set[_Vertex[_T]] = set([start])
+        vertices, targets, weights = self._vertex_list, self._targets, self._weights
+        visited = bytearray(len(vertices))
+        visited[0] = 1
         spanning_tree: AdjacencyList[_T] = AdjacencyList(directed=self._type)
-        pQueue: PriorityQueue[_Edge[_T]] = PriorityQueue(
-            [edge for edge in self.adjacency_list[start]],
-            key=lambda a, b: operator.lt(a.weight, b.weight),
+        pQueue: PriorityQueue[tuple[float, int, int]] = PriorityQueue(
+            [(weight, target, 0) for target, weight in zip(targets[0], weights[0])]
         )
 
         while pQueue:
-            src, dst, weight = pQueue.dequeue()
+            weight, dst, src = pQueue.dequeue()
 
-            if dst in visited:
+            if visited[dst]:
                 continue
-            visited.add(dst)
+            visited[dst] = 1
 
-            spanning_tree.add(dst, src, weight)
-            for edge in self.adjacency_list[dst]:
-                pQueue.enqueue(edge)
+            spanning_tree.add(vertices[dst], vertices[src], weight)
+            for target, target_weight in zip(targets[dst], weights[dst]):
+                pQueue.enqueue((target_weight, target, dst))
 
         return spanning_tree
 
+    def _indexed_edges(
+        self,
+    ) -> tuple[list[_Vertex[_T]], list[tuple[float, int, int]]]:
+        """Flattens the edges into `(weight, source, destination)` tuples of vertex
+        indices. An undirected edge is stored in both directions but listed once."""
+        edges: list[tuple[float, int, int]] = []
+        for u, (targets, weights) in enumerate(zip(self._targets, self._weights)):
+            for v, weight in zip(targets, weights):
+                if u < v or (self._type and u != v):
+                    edges.append((weight, u, v))
+
+        return list(self._vertex_list), edges
+
+    def _spanning_forest(
+        self,
+        vertices: list[_Vertex[_T]],
+        edges: typing.Iterable[tuple[float, int, int]],
+    ) -> AdjacencyList[_T]:
+        spanning_tree: AdjacencyList[_T] = AdjacencyList(directed=self._type)
+        for vertex in vertices:
+            spanning_tree.create_vertex(vertex)
+
+        for weight, u, v in edges:
+            spanning_tree.add(vertices[u], vertices[v], weight)
+
+        return spanning_tree
+
+    def _kruskal(self) -> AdjacencyList[_T]:
+        vertices, edges = self._indexed_edges()
+        edges.sort(key=operator.itemgetter(0))
+
+        components = _DisjointSet(len(vertices))
+        tree_edges: list[tuple[float, int, int]] = []
+        for edge in edges:
+            if components.union(edge[1], edge[2]):
+                tree_edges.append(edge)
+                if len(tree_edges) == len(vertices) - 1:
+                    break
+
+        return self._spanning_forest(vertices, tree_edges)
+
+    def _boruvka(self, processes: typing.Optional[int] = None) -> AdjacencyList[_T]:
+        vertices, edges = self._indexed_edges()
+        components = _DisjointSet(len(vertices))
+        tree_edges: list[tuple[float, int, int]] = []
+
+        weights = array("d", (edge[0] for edge in edges))
+        sources = array("q", (edge[1] for edge in edges))
+        targets = array("q", (edge[2] for edge in edges))
+
+        labels: typing.Any = array("q", range(len(vertices)))
+
+        workers = processes if processes is not None and edges else 1
+        pool: typing.Optional[ProcessPoolExecutor] = None
+        if workers > 1:
+            # Workers get the edges once and read the labels from shared memory, so
+            # a round sends them nothing but the bounds of their slice.
+            shared = multiprocessing.RawArray("q", labels)
+            labels = memoryview(shared).cast("B").cast("q")
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_boruvka_worker,
+                initargs=(weights, sources, targets, shared),
+            )
+
+        try:
+            while True:
+                scans: list[dict[int, tuple[float, int]]]
+                if pool is None:
+                    state = (weights, sources, targets, labels)
+                    scans = [_cheapest_edges(0, len(edges), state)]
+                else:
+                    step = -(-len(edges) // workers)
+                    futures = [
+                        pool.submit(_cheapest_edges, lo, min(lo + step, len(edges)))
+                        for lo in range(0, len(edges), step)
+                    ]
+                    scans = [future.result() for future in futures]
+
+                cheapest: dict[int, tuple[float, int]] = {}
+                for scan in scans:
+                    for comp, candidate in scan.items():
+                        current = cheapest.get(comp)
+                        if current is None or candidate < current:
+                            cheapest[comp] = candidate
+
+                if not cheapest:
+                    break
+
+                for _, index in cheapest.values():
+                    edge = edges[index]
+                    if components.union(edge[1], edge[2]):
+                        tree_edges.append(edge)
+
+                # Only the labels of vertices whose component merged are rewritten.
+                for i in range(len(vertices)):
+                    root = components.find(i)
+                    if labels[i] != root:
+                        labels[i] = root
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        return self._spanning_forest(vertices, tree_edges)
+
     def a_star(
         self,
-        start: _Vertex[_T],
-        end: _Vertex[_T],
+        start: _T | _Vertex[_T],
+        end: _T | _Vertex[_T],
         __heuristic: typing.Callable[[_T, _T], float] = lambda a, b: 0.0,
     ) -> typing.Iterable[tuple[_T, float]]:
+        start_vertex, end_vertex = self.vertex(start), self.vertex(end)
+        if start_vertex is None or end_vertex is None:
+            raise ValueError(f"No path exists between {start} and {end}")
+        start, end = start_vertex, end_vertex
+
+        def compute() -> list[tuple[_T, float]]:
+            record = self._visit_vertecies(start=start, end=end, heuristic=__heuristic)
+            return list(self._build_path(record, start, end))
+
+        return iter(self._cached((start, end, __heuristic), compute))
+
+    def bfs(
+        self, start: _T | _Vertex[_T], max_depth: typing.Optional[int] = None
+    ) -> typing.Iterator[_Vertex[_T]]:
+        """Lazily yields the vertices reachable from `start` in breadth-first order."""
+        for vertex, _ in self._bfs(start, max_depth):
+            yield vertex
+
+    def bfs_levels(
+        self, start: _T | _Vertex[_T], max_depth: typing.Optional[int] = None
+    ) -> dict[_Vertex[_T], int]:
+        """Maps every vertex reachable from `start` to its hop distance."""
+        return dict(self._bfs(start, max_depth))
+
+    def _bfs(
+        self, start: _T | _Vertex[_T], max_depth: typing.Optional[int] = None
+    ) -> typing.Iterator[tuple[_Vertex[_T], int]]:
+        start = self._resolve(start)
+        vertices, targets = self._vertex_list, self._targets
+
+        visited = bytearray(len(vertices))
+        visited[start.index] = 1
+        queue = deque([(start.index, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            yield vertices[current], depth
 
-        record: dict[_Vertex[_T], tuple[_Vertex[_T], float]] = self._visit_vertecies(
-            visited=set(), start=start, end=end, heuristic=__heuristic
-        )
+            if max_depth is not None and depth >= max_depth:
+                continue
 
+            for target in targets[current]:
+                if not visited[target]:
+                    visited[target] = 1
+                    queue.append((target, depth + 1))
+
+    def dfs(
+        self, start: _T | _Vertex[_T], max_depth: typing.Optional[int] = None
+    ) -> typing.Iterator[_Vertex[_T]]:
+        """Lazily yields the vertices reachable from `start` in depth-first (pre)order.
+        Uses an explicit stack, so deep graphs do not hit the recursion limit."""
+        start = self._resolve(start)
+        vertices, targets = self._vertex_list, self._targets
+
+        visited = bytearray(len(vertices))
+        stack = [(start.index, 0)]
+        while stack:
+            current, depth = stack.pop()
+            if visited[current]:
+                continue
+            visited[current] = 1
+            yield vertices[current]
+
+            if max_depth is not None and depth >= max_depth:
+                continue
+
+            for target in reversed(targets[current]):
+                if not visited[target]:
+                    stack.append((target, depth + 1))
+
+    def strongly_connected_components(self) -> typing.Iterator[list[_Vertex[_T]]]:
+        """Lazily yields the strongly connected components in reverse topological order.
+        An iterative version of Tarjan's algorithm, so it runs in O(V + E) without
+        recursion."""
+        vertices, targets = self._vertex_list, self._targets
+        order = [-1] * len(vertices)
+        low = [0] * len(vertices)
+        on_stack = bytearray(len(vertices))
+        stack: list[int] = []
+        counter = 0
+
+        for root in range(len(vertices)):
+            if order[root] != -1:
+                continue
+
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [(root, 0)]
+
+            while work:
+                current, position = work[-1]
+                edges = targets[current]
+
+                if position < len(edges):
+                    work[-1] = (current, position + 1)
+                    neighbor = edges[position]
+                    if order[neighbor] == -1:
+                        order[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        work.append((neighbor, 0))
+                    elif on_stack[neighbor]:
+                        low[current] = min(low[current], order[neighbor])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[current])
+
+                if low[current] == order[current]:
+                    component: list[_Vertex[_T]] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(vertices[member])
+                        if member == current:
+                            break
+                    yield component
+
+    def connected_components(self) -> typing.Iterator[list[_Vertex[_T]]]:
+        """Lazily yields the connected components, treating every edge as undirected.
+        For a directed graph these are its weakly connected components."""
+        vertices, targets = self._vertex_list, self._targets
+
+        reverse: list[list[int]] = [[] for _ in vertices]
+        if self._type:
+            for u, edges in enumerate(targets):
+                for v in edges:
+                    reverse[v].append(u)
+
+        seen = bytearray(len(vertices))
+        for root in range(len(vertices)):
+            if seen[root]:
+                continue
+
+            seen[root] = 1
+            component = [vertices[root]]
+            queue = deque([root])
+            while queue:
+                current = queue.popleft()
+                for neighbor in (*targets[current], *reverse[current]):
+                    if not seen[neighbor]:
+                        seen[neighbor] = 1
+                        component.append(vertices[neighbor])
+                        queue.append(neighbor)
+
+            yield component
+
+    def topological_order(self) -> list[_Vertex[_T]]:
+        """Orders the vertices so that every edge points forward (Kahn's algorithm).
+        Raises `ValueError` if the graph is undirected or has a cycle."""
+        if not self._type:
+            raise ValueError("Cannot order the vertices of an undirected graph")
+
+        vertices, targets = self._vertex_list, self._targets
+        in_degree = [0] * len(vertices)
+        for edges in targets:
+            for neighbor in edges:
+                in_degree[neighbor] += 1
+
+        queue = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        order: list[_Vertex[_T]] = []
+        while queue:
+            current = queue.popleft()
+            order.append(vertices[current])
+            for neighbor in targets[current]:
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+
+        if len(order) != len(vertices):
+            raise ValueError("Cannot order the vertices of a graph with a cycle")
+
+        return order
+
+    def dag_shortest_paths(
+        self, source: _T | _Vertex[_T], fallback: bool = True
+    ) -> typing.Mapping[_Vertex[_T], tuple[_Vertex[_T], float]]:
+        """Shortest path tree of a DAG, in the same shape as `shortest_path_tree`.
+        Relaxes the edges in topological order, so it runs in O(V + E) and allows
+        negative weights. If the graph has a cycle, it falls back to
+        `shortest_path_tree` when `fallback` is set and raises `ValueError` otherwise."""
+        source = self._resolve(source)
+        try:
+            order = self.topological_order()
+        except ValueError:
+            if not fallback:
+                raise
+            return self.shortest_path_tree(source)
+
+        distance = [float("inf")] * len(self._vertex_list)
+        distance[source.index] = 0.0
+        record: dict[_Vertex[_T], tuple[_Vertex[_T], float]] = {}
+
+        for vertex in order[order.index(source) :]:
+            cost = distance[vertex.index]
+            if cost == float("inf"):
+                continue
+            for target, weight in zip(
+                self._targets[vertex.index], self._weights[vertex.index]
+            ):
+                candidate = cost + weight
+                if candidate < distance[target]:
+                    distance[target] = candidate
+                    record[self._vertex_list[target]] = (vertex, candidate)
+
+        return MappingProxyType(record)
+
+    def dag_shortest_path(
+        self, start: _T | _Vertex[_T], end: _T | _Vertex[_T], fallback: bool = True
+    ) -> typing.Iterator[tuple[_T, float]]:
+        """The shortest path from `start` to `end` in a DAG, as `(data, cost)` pairs."""
+        start, end = self._resolve(start), self._resolve(end)
+        return self._build_path(self.dag_shortest_paths(start, fallback), start, end)
+
+    def critical_path(self) -> typing.Iterator[tuple[_T, float]]:
+        """The longest (most expensive) path of a DAG, as `(data, cost)` pairs.
+        Runs in O(V + E) and raises `ValueError` if the graph has a cycle."""
+        order = self.topological_order()
+        if not order:
+            raise ValueError("No critical path for an empty graph")
+
+        distance = [0.0] * len(self._vertex_list)
+        record: dict[_Vertex[_T], tuple[_Vertex[_T], float]] = {}
+        for vertex in order:
+            cost = distance[vertex.index]
+            for target, weight in zip(
+                self._targets[vertex.index], self._weights[vertex.index]
+            ):
+                candidate = cost + weight
+                # Every vertex may also start the path at 0, so an edge only counts
+                # when it beats that too (negative weights are allowed).
+                if candidate > distance[target]:
+                    distance[target] = candidate
+                    record[self._vertex_list[target]] = (vertex, candidate)
+
+        end = max(order, key=lambda vertex: distance[vertex.index])
+        start = end
+        while start in record:
+            start = record[start][0]
+
+        if start is end:
+            return iter([(end._data, 0)])
         return self._build_path(record, start, end)
 
+    def pagerank(
+        self, damping: float = 0.85, tol: float = 1e-6, max_iter: int = 100
+    ) -> dict[_Vertex[_T], float]:
+        """PageRank of every vertex, computed over a frozen snapshot (see `CSRGraph.pagerank`)."""
+        return dict(
+            zip(self._vertex_list, self._snapshot()._pagerank(damping, tol, max_iter))
+        )
+
+    def degree_centrality(self) -> dict[_Vertex[_T], float]:
+        return dict(zip(self._vertex_list, self._snapshot()._degree_centrality()))
+
+    def closeness_centrality(self) -> dict[_Vertex[_T], float]:
+        return dict(zip(self._vertex_list, self._snapshot()._closeness_centrality()))
+
+    def eigenvector_centrality(
+        self, tol: float = 1e-6, max_iter: int = 100
+    ) -> dict[_Vertex[_T], float]:
+        return dict(
+            zip(
+                self._vertex_list,
+                self._snapshot()._eigenvector_centrality(tol, max_iter),
+            )
+        )
+
+    def build_landmarks(self, k: int = 8) -> Landmarks[_T]:
+        """Precomputes an ALT heuristic from `k` landmarks, to be passed to `a_star`:
+
+        `graph.a_star(start, end, graph.build_landmarks(16))`
+        """
+        return Landmarks.build(self._snapshot(), k)
+
+    def freeze(self) -> CSRGraph[_T]:
+        """Returns a read-only, array backed snapshot of this graph, keyed by vertex data."""
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for vertex_targets, vertex_weights in zip(self._targets, self._weights):
+            targets.extend(vertex_targets)
+            weights.extend(vertex_weights)
+            offsets.append(len(targets))
+
+        graph: CSRGraph[_T] = CSRGraph(
+            [vertex._data for vertex in self._vertex_list],
+            offsets,
+            targets,
+            weights,
+            self._type,
+        )
+        graph._index = dict(zip(graph.vertices, range(len(self._vertex_list))))
+        return graph
+
+    def _snapshot(self) -> CSRGraph[_T]:
+        """`freeze()`, reused until the graph changes, so repeated analytics share one
+        snapshot and its cached transpose."""
+        if self._frozen is None or self._frozen[0] != self._version:
+            self._frozen = (self._version, self.freeze())
+        return self._frozen[1]
+
+    def save(self, path: str) -> None:
+        """Writes the graph in the binary layout of `CSRGraph.save`."""
+        self.freeze().save(path)
+
+    @staticmethod
+    def load(
+        path: str, mmap: bool = True, allow_pickle: bool = False
+    ) -> CSRGraph[typing.Any]:
+        """Opens a graph written by `save` as a read-only `CSRGraph` (memory-mapped by
+        default). Use `CSRGraph.thaw` to get a mutable `AdjacencyList` back.
+
+        Files whose vertex table is a pickle are refused unless `allow_pickle=True`,
+        since loading a crafted one can run arbitrary code (see `CSRGraph.load`)."""
+        return CSRGraph.load(path, mmap=mmap, allow_pickle=allow_pickle)
+
     def __iter__(self) -> typing.Iterator[_Vertex[_T]]:
-        yield from self.adjacency_list.keys()
+        yield from self._vertex_list
 
-    def __str__(self) -> str:
-        msg = ["{\n"]
-        space = "  " * 2
-        inner_msg = []
 
-        def edges_to_str(items: list[_Edge[_T]]) -> typing.Iterator[str]:
-            return (f"{str(edge.destination)}, cost: {edge.weight}" for edge in items)
+_NO_EDGE = float("inf")
 
-        for key in self.adjacency_list:
-            new_line = f"\n{space * 2}  "
-            inner_str = f"{new_line}".join(edges_to_str(self.adjacency_list[key]))
-            inner_str += f"\n{space*2}]" if inner_str else "]"
-            if inner_str != "]":
-                inner_str = f"{new_line}{inner_str}"
-            inner_msg.append(f"{space}{str(key)}: [{inner_str}")
 
-        msg.append("\n".join(inner_msg))
-        msg.append("\n}")
-        return "".join(msg)
+class AdjacencyMatrix(_Graphable[_T]):
+    """Graph stored as a dense `V x V` weight matrix, one `array("d")` row per vertex.
+    Missing edges hold `inf`, so `weight` is O(1). Parallel edges collapse to the
+    cheapest one. Suited to dense graphs, where a row costs 8 bytes per vertex and
+    an edge list costs several Python objects per edge."""
+
+    def __init__(
+        self,
+        __items: typing.Optional[typing.Union[list[_T], typing.Iterable[_T]]] = None,
+        directed: bool = True,
+    ) -> None:
+        super().__init__(directed)
+        self.matrix: list[array[float]] = []
+
+        if __items is not None:
+            for item in __items:
+                self.create_vertex(item)
+
+    def create_vertex(self, data: _T | _Vertex[_T]) -> _Vertex[_T]:
+        if isinstance(data, _Vertex):
+            data = data._data
+
+        vertex = self._vertices.get(data)
+        if vertex is None:
+            vertex = _Vertex(data=data, index=len(self._vertex_list))
+            self._vertices[data] = vertex
+            self._vertex_list.append(vertex)
+
+            for row in self.matrix:
+                row.append(_NO_EDGE)
+            self.matrix.append(array("d", [_NO_EDGE]) * len(self._vertex_list))
+
+        return vertex
+
+    def add_directed_edge(
+        self,
+        source: _T | _Vertex[_T],
+        destination: _T | _Vertex[_T],
+        weight: int | float = 0,
+    ):
+        source = self.create_vertex(source)
+        destination = self.create_vertex(destination)
+        row = self.matrix[source.index]
+        row[destination.index] = min(row[destination.index], weight)
+
+    def add_undirected_edge(
+        self,
+        vertices: tuple[_T | _Vertex[_T], _T | _Vertex[_T]],
+        weight: float | int = 0,
+    ):
+        source, destination = vertices
+        self.add_directed_edge(source=source, destination=destination, weight=weight)
+        self.add_directed_edge(source=destination, destination=source, weight=weight)
+
+    def add(
+        self,
+        source: _T | _Vertex[_T],
+        destination: _T | _Vertex[_T],
+        weight: float = 0,
+    ) -> None:
+        match self._type:
+            case True:
+                self.add_directed_edge(
+                    source=source, destination=destination, weight=weight
+                )
+            case _:
+                self.add_undirected_edge(vertices=(source, destination), weight=weight)
+
+    def weight(
+        self, source: _T | _Vertex[_T], destination: _T | _Vertex[_T]
+    ) -> typing.Optional[int | float]:
+        source_vertex, destination_vertex = self.vertex(source), self.vertex(
+            destination
+        )
+        if source_vertex is None or destination_vertex is None:
+            return None
+
+        weight = self.matrix[source_vertex.index][destination_vertex.index]
+        return None if weight == _NO_EDGE else weight
+
+    def edges(self, source: _T | _Vertex[_T]) -> typing.Optional[list[_Edge[_T]]]:
+        vertex = self.vertex(source)
+        if vertex is None:
+            return None
+
+        row = self.matrix[vertex.index]
+        return [
+            _Edge(vertex, self._vertex_list[i], row[i])
+            for i in compress(range(len(row)), map(_NO_EDGE.__ne__, row))
+        ]
+
+    def neighbors(
+        self, sources: typing.Iterable[_T | _Vertex[_T]]
+    ) -> dict[_Vertex[_T], list[tuple[_Vertex[_T], float]]]:
+        """Bulk neighbor query: maps every source to its `(destination, weight)` pairs."""
+        result: dict[_Vertex[_T], list[tuple[_Vertex[_T], float]]] = {}
+        for source in sources:
+            vertex = self._resolve(source)
+            row = self.matrix[vertex.index]
+            result[vertex] = [
+                (self._vertex_list[i], row[i])
+                for i in compress(range(len(row)), map(_NO_EDGE.__ne__, row))
+            ]
+        return result
+
+    def _dense_search(
+        self,
+        start: _Vertex[_T],
+        end: _Vertex[_T],
+        heuristic: typing.Callable[[_T, _T], float],
+    ) -> dict[_Vertex[_T], tuple[_Vertex[_T], float]]:
+        """Array-based Dijkstra/A*: with a full row per vertex, an O(V) scan for the next
+        vertex is as cheap as relaxing its row, so no priority queue is needed."""
+        size = len(self._vertex_list)
+        distance = [_NO_EDGE] * size
+        estimate = [0.0] * size
+        predecessor = [-1] * size
+        done = bytearray(size)
+        open_set = {start.index}
+        distance[start.index] = 0.0
+
+        while open_set:
+            current = min(open_set, key=lambda i: distance[i] + estimate[i])
+            open_set.discard(current)
+            done[current] = 1
+            if current == end.index:
+                break
+
+            base = distance[current]
+            for neighbor, weight in enumerate(self.matrix[current]):
+                if weight == _NO_EDGE or done[neighbor]:
+                    continue
+                candidate = base + weight
+                if candidate < distance[neighbor]:
+                    if distance[neighbor] == _NO_EDGE:
+                        estimate[neighbor] = heuristic(
+                            self._vertex_list[neighbor]._data, end._data
+                        )
+                    distance[neighbor] = candidate
+                    predecessor[neighbor] = current
+                    open_set.add(neighbor)
+
+        return {
+            self._vertex_list[i]: (self._vertex_list[predecessor[i]], distance[i])
+            for i in range(size)
+            if predecessor[i] != -1
+        }
+
+    def dijkstra(
+        self, start: _T | _Vertex[_T], end: _T | _Vertex[_T]
+    ) -> typing.Iterator[tuple[_T, float]]:
+        return self.a_star(start, end)
+
+    def a_star(
+        self,
+        start: _T | _Vertex[_T],
+        end: _T | _Vertex[_T],
+        __heuristic: typing.Callable[[_T, _T], float] = lambda a, b: 0.0,
+    ) -> typing.Iterator[tuple[_T, float]]:
+        start_vertex, end_vertex = self.vertex(start), self.vertex(end)
+        if start_vertex is None or end_vertex is None:
+            raise ValueError(f"No path exists between {start} and {end}")
+
+        record = self._dense_search(start_vertex, end_vertex, __heuristic)
+        return self._build_path(record, start_vertex, end_vertex)
+
+    def all_pairs_shortest_paths(self) -> list[array[float]]:
+        """Floyd-Warshall over the whole matrix; entry `[i][j]` is the distance from
+        `vertex_at(i)` to `vertex_at(j)` (`inf` when unreachable).
+
+        With NumPy this is a blocked min-plus relaxation over cache-sized row tiles:
+        V=2000 takes about 10 s on one core, and time grows as V^3. The stdlib
+        fallback takes one interpreter step per cell and pivot, so it only suits a
+        few hundred vertices (V=300 takes several seconds)."""
+        if _numpy.np is not None:
+            return self._blocked_floyd_warshall(_numpy.np)
+
+        size = len(self._vertex_list)
+        distances = [array("d", row) for row in self.matrix]
+        for i in range(size):
+            distances[i][i] = min(distances[i][i], 0.0)
+
+        for k in range(size):
+            pivot = distances[k]
+            for i in range(size):
+                through = distances[i][k]
+                if through == _NO_EDGE or i == k:
+                    continue
+                distances[i] = array(
+                    "d", map(min, distances[i], map(through.__add__, pivot))
+                )
+
+        return distances
+
+    def _blocked_floyd_warshall(
+        self, np: typing.Any, block: int = 64, tile_bytes: int = 1 << 18
+    ) -> list[array[float]]:
+        size = len(self._vertex_list)
+        distances = np.empty((size, size))
+        for i, row in enumerate(self.matrix):
+            distances[i] = np.frombuffer(row, dtype=np.float64)
+        np.fill_diagonal(distances, np.minimum(distances.diagonal(), 0.0))
+
+        # Row tiles small enough to stay in cache while a whole block of pivots
+        # relaxes them.
+        tile = max(1, tile_bytes // (8 * max(size, 1)))
+        scratch = np.empty((min(tile, size), size))
+
+        for start in range(0, size, block):
+            stop = min(start + block, size)
+            # The rows and columns of this block's pivots only depend on each other,
+            # so they are finished first with plain Floyd-Warshall.
+            rows, columns = distances[start:stop], distances[:, start:stop]
+            for k in range(start, stop):
+                np.minimum(rows, rows[:, k, None] + distances[k], out=rows)
+                np.minimum(
+                    columns,
+                    distances[:, k, None] + distances[k, start:stop],
+                    out=columns,
+                )
+
+            # Every other cell takes the min-plus product of the finished panels.
+            for top in range(0, size, tile):
+                rows = distances[top : top + tile]
+                through = scratch[: len(rows)]
+                for k in range(start, stop):
+                    np.add(rows[:, k, None], distances[k], out=through)
+                    np.minimum(rows, through, out=rows)
+
+        return [array("d", row.tobytes()) for row in distances]
+
+    def minimum_spanning_tree(
+        self, algorithm: str = "prim", processes: typing.Optional[int] = None
+    ) -> AdjacencyList[_T]:
+        """Dense O(V^2) Prim by default. Other algorithms run on an `AdjacencyList` copy."""
+        if self._type:
+            raise ValueError(
+                "Cannot create Minimum Spanning Tree out of a directed graph"
+            )
+
+        if algorithm != "prim":
+            return self.to_adjacency_list().minimum_spanning_tree(algorithm, processes)
+
+        size = len(self._vertex_list)
+        assert size > 0, "No Minimum Spanning Tree for empty graph"
+
+        spanning_tree: AdjacencyList[_T] = AdjacencyList(directed=self._type)
+        cost = array("d", self.matrix[0])
+        parent = [0] * size
+        in_tree = bytearray(size)
+        in_tree[0] = 1
+        cost[0] = _NO_EDGE
+        spanning_tree.create_vertex(self._vertex_list[0])
+
+        for _ in range(size - 1):
+            current = min(range(size), key=cost.__getitem__)
+            if cost[current] == _NO_EDGE:
+                break
+
+            spanning_tree.add(
+                self._vertex_list[current],
+                self._vertex_list[parent[current]],
+                cost[current],
+            )
+            in_tree[current] = 1
+            cost[current] = _NO_EDGE
+
+            for neighbor, weight in enumerate(self.matrix[current]):
+                if not in_tree[neighbor] and weight < cost[neighbor]:
+                    cost[neighbor] = weight
+                    parent[neighbor] = current
+
+        return spanning_tree
+
+    def to_adjacency_list(self) -> AdjacencyList[_T]:
+        graph: AdjacencyList[_T] = AdjacencyList(
+            (vertex._data for vertex in self._vertex_list), directed=True
+        )
+        graph.add_edges(
+            (edge.source._data, edge.destination._data, edge.weight)
+            for vertex in self._vertex_list
+            for edge in typing.cast(list[_Edge[_T]], self.edges(vertex))
+        )
+        graph._type = self._type
+        return graph
+
+    def __iter__(self) -> typing.Iterator[_Vertex[_T]]:
+        yield from self._vertex_list
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import typing
+from array import array
+
+from ._storage import load_index, save_index
+from .csr_graph import CSRGraph
+
+_T = typing.TypeVar("_T")
+
+_MAGIC = b"DSALT\x00\x00\x00"
+_FORMAT_VERSION = 2
+
+
+class Landmarks(typing.Generic[_T]):
+    """Precomputed distances to and from a few landmark vertices (ALT).
+
+    By the triangle inequality, `d(L, t) - d(L, v)` and `d(v, L) - d(t, L)` are
+    lower bounds on `d(v, t)` for every landmark `L`. The largest of them is an
+    admissible and consistent heuristic, so an instance can be passed straight
+    to `AdjacencyList.a_star`. The tables describe the graph at build time and
+    must be rebuilt after it changes.
+    """
+
+    def __init__(
+        self,
+        vertices: list[_T],
+        landmarks: list[int],
+        forward: list[array[float]],
+        backward: list[array[float]],
+    ) -> None:
+        self.vertices = vertices
+        self.landmarks = landmarks
+        self._forward = forward
+        self._backward = backward
+        self._index: dict[_T, int] = {vertex: i for i, vertex in enumerate(vertices)}
+
+    @staticmethod
+    def build(graph: CSRGraph[_T], k: int) -> Landmarks[_T]:
+        """Picks up to `k` landmarks by farthest-point selection and runs one forward
+        (and, for directed graphs, one backward) single-source search from each."""
+        assert k > 0, "At least one landmark is required"
+
+        landmarks: list[int] = []
+        forward: list[array[float]] = []
+        backward: list[array[float]] = []
+        # Distance from the closest chosen landmark, used to pick the next one.
+        closest = [float("inf")] * len(graph)
+
+        candidate = 0
+        while len(landmarks) < min(k, len(graph)):
+            landmarks.append(candidate)
+            distances = graph._distances(candidate)
+            forward.append(array("d", distances))
+            backward.append(
+                array("d", graph._distances(candidate, reverse=True))
+                if graph.directed
+                else forward[-1]
+            )
+
+            for vertex, distance in enumerate(distances):
+                closest[vertex] = min(closest[vertex], distance)
+
+            # Prefer the farthest reachable vertex; fall back to one in a part of the
+            # graph no landmark reaches yet.
+            remaining = [v for v in range(len(graph)) if v not in landmarks]
+            if not remaining:
+                break
+            reachable = [v for v in remaining if closest[v] != float("inf")]
+            if reachable:
+                candidate = max(reachable, key=closest.__getitem__)
+            else:
+                candidate = remaining[0]
+
+        return Landmarks(list(graph.vertices), landmarks, forward, backward)
+
+    def __call__(self, vertex: _T, target: _T) -> float:
+        """Lower bound on the distance from `vertex` to `target`."""
+        v, t = self._index.get(vertex), self._index.get(target)
+        if v is None or t is None:
+            return 0.0
+
+        bound = 0.0
+        for forward, backward in zip(self._forward, self._backward):
+            from_landmark_t, from_landmark_v = forward[t], forward[v]
+            if from_landmark_t != float("inf") and from_landmark_v != float("inf"):
+                bound = max(bound, from_landmark_t - from_landmark_v)
+
+            to_landmark_v, to_landmark_t = backward[v], backward[t]
+            if to_landmark_v != float("inf") and to_landmark_t != float("inf"):
+                bound = max(bound, to_landmark_v - to_landmark_t)
+
+        return bound
+
+    def save(self, path: str) -> None:
+        """Writes the tables in the layout of `_storage.save_index`: the distance
+        tables as raw arrays, the vertices as JSON when they are plain values."""
+        symmetric = all(
+            forward is backward
+            for forward, backward in zip(self._forward, self._backward)
+        )
+        arrays = {"forward": array("d", b"".join(self._forward))}
+        if not symmetric:
+            arrays["backward"] = array("d", b"".join(self._backward))
+
+        save_index(
+            path,
+            _MAGIC,
+            {"format": _FORMAT_VERSION, "landmarks": self.landmarks},
+            list(self.vertices),
+            arrays,
+        )
+
+    @staticmethod
+    def load(path: str, allow_pickle: bool = False) -> Landmarks[typing.Any]:
+        """Reads a file written by `save`. Vertices that are not plain JSON values are
+        stored as a pickle, which could run arbitrary code when loaded; such files
+        raise `ValueError` unless `allow_pickle=True` (only for trusted files)."""
+        header, vertices, arrays = load_index(path, _MAGIC, allow_pickle)
+        if header.get("format") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported landmark format {header.get('format')!r}")
+
+        size = len(vertices)
+        bounds = [(i * size, (i + 1) * size) for i in range(len(header["landmarks"]))]
+        forward = [arrays["forward"][start:stop] for start, stop in bounds]
+        backward = forward
+        if "backward" in arrays:
+            backward = [arrays["backward"][start:stop] for start, stop in bounds]
+        return Landmarks(vertices, header["landmarks"], forward, backward)
+
+    def __len__(self) -> int:
+        return len(self.landmarks)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"landmarks={[self.vertices[i] for i in self.landmarks]!r})"
+        )
+
+
+__all__ = ["Landmarks"]
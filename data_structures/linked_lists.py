@@ -1,17 +1,99 @@
 from __future__ import annotations
 
 import typing
+from collections import deque
 
+from .cursor import ListCursor
 from .nodes import DoublyLinkedListNode as DLLNode
 from .nodes import SinglyLinkedListNode as SLLNode
+from .nodes import UnrolledLinkedListNode as ULLNode
 
 T = typing.TypeVar("T")
 
+_Node = typing.Any  # SLLNode or DLLNode; the merge sort only follows `.next`.
+
+
+def _ordering(
+    key: typing.Optional[typing.Callable[[typing.Any], typing.Any]],
+    reverse: bool,
+    *heads: _Node,
+) -> typing.Callable[[_Node, _Node], bool]:
+    """`ahead(right, left)`: whether `right` must strictly precede `left`, for nodes
+    of the chains starting at `heads`. Ties keep `left` first, which makes the merges
+    stable. A `key` is called once per node up front, not twice per comparison."""
+    keys: dict[int, typing.Any] = {}
+    if key is not None:
+        for node in heads:
+            while node is not None:
+                keys[id(node)] = key(node.value)
+                node = node.next
+
+    match (key is None, reverse):
+        case (True, False):
+            return lambda right, left: right.value < left.value
+        case (True, True):
+            return lambda right, left: left.value < right.value
+        case (False, False):
+            return lambda right, left: keys[id(right)] < keys[id(left)]
+        case _:
+            return lambda right, left: keys[id(left)] < keys[id(right)]
+
+
+def _merge_chains(
+    left: _Node, right: _Node, ahead: typing.Callable[[_Node, _Node], bool]
+) -> _Node:
+    """Stably merges two sorted, non-empty `.next` chains and returns the new head."""
+    if ahead(right, left):
+        head, right = right, right.next
+    else:
+        head, left = left, left.next
+
+    tail = head
+    while left is not None and right is not None:
+        if ahead(right, left):
+            tail.next, tail, right = right, right, right.next
+        else:
+            tail.next, tail, left = left, left, left.next
+
+    tail.next = left if left is not None else right
+    return head
+
+
+def _sort_chain(head: _Node, ahead: typing.Callable[[_Node, _Node], bool]) -> _Node:
+    """Bottom-up merge sort of a `.next` chain, without recursion. `runs[i]` holds a
+    sorted run of 2**i nodes, made of nodes that came before those of `runs[i - 1]`."""
+    runs: list[typing.Optional[_Node]] = []
+    while head is not None:
+        carry, head = head, head.next
+        carry.next = None
+
+        level = 0
+        while level < len(runs) and runs[level] is not None:
+            carry = _merge_chains(runs[level], carry, ahead)
+            runs[level] = None
+            level += 1
+
+        if level == len(runs):
+            runs.append(carry)
+        else:
+            runs[level] = carry
+
+    result = None
+    for run in runs:
+        if run is not None:
+            result = run if result is None else _merge_chains(run, result, ahead)
+    return result
+
 
 class SinglyLinkedList(typing.Generic[T]):
     def __init__(self, __items: typing.Optional[typing.Iterable[T]] = None) -> None:
         self._head: typing.Optional[SLLNode[T]] = None
         self._tail: typing.Optional[SLLNode[T]] = None
+        # Every node in order, built by the first `remove_last` and kept up to date
+        # by the operations at either end, so that stack and queue use stays O(1).
+        # Operations in the middle of the list drop it.
+        self._spine: typing.Optional[deque[SLLNode[T]]] = None
+        self._size: int = 0
 
         if __items is not None:
             for item in __items:
@@ -30,10 +112,14 @@ class SinglyLinkedList(typing.Generic[T]):
     def push(self, value: T) -> None:
         """Adds a value at the front of the list."""
         self._head = SLLNode[T](value, self._head)
+        self._size += 1
 
         if self._tail is None:
             self._tail = self._head
 
+        if self._spine is not None:
+            self._spine.appendleft(self._head)
+
     def append(self, value: T) -> None:
         """Adds a value at the end of the list."""
         if self._tail is None:
@@ -41,6 +127,10 @@ class SinglyLinkedList(typing.Generic[T]):
 
         self._tail.next = SLLNode[T](value)
         self._tail = self._tail.next
+        self._size += 1
+
+        if self._spine is not None:
+            self._spine.append(self._tail)
 
     def insert(self, after: SLLNode, value: T) -> None:
         """Adds a value after a particular list node."""
@@ -51,6 +141,8 @@ class SinglyLinkedList(typing.Generic[T]):
 
         _, next = after
         after.next = SLLNode[T](value, next)
+        self._size += 1
+        self._spine = None
 
     def pop(self) -> typing.Optional[T]:
         """Removes the value at the front of the list."""
@@ -60,33 +152,33 @@ class SinglyLinkedList(typing.Generic[T]):
         value, next = self._head
 
         self._head = next
+        self._size -= 1
 
         if self._head is None:
             self._tail = None
 
+        if self._spine is not None:
+            self._spine.popleft()
+
         return value
 
     def remove_last(self) -> typing.Optional[T]:
-        """Removes the value at the end of the list."""
+        """Removes the value at the end of the list. The first call after a change in
+        the middle of the list is O(n), the following ones are O(1)."""
         if self._tail is None:
             return None
 
         if self._tail is self._head:
             return self.pop()
 
-        before_tail: typing.Optional[SLLNode] = None
-        for node in self:
-            if node.next is self._tail:
-                before_tail = node
-                break
-
-        assert isinstance(
-            before_tail, SLLNode
-        ), "the node before tail should always be of type Node"
+        if self._spine is None:
+            self._spine = deque(self)
 
-        value, _ = self._tail
+        value, _ = self._spine.pop()
+        before_tail = self._spine[-1]
         before_tail.next = None
         self._tail = before_tail
+        self._size -= 1
         return value
 
     def remove(self, after: SLLNode[T]) -> typing.Optional[T]:
@@ -102,8 +194,102 @@ class SinglyLinkedList(typing.Generic[T]):
         value, next = after.next
 
         after.next = next
+        self._size -= 1
+        self._spine = None
         return value
 
+    def reverse(self) -> None:
+        """Reverses the list in place, in O(n) time and O(1) extra space."""
+        previous: typing.Optional[SLLNode[T]] = None
+        current = self._head
+        self._tail = current
+        while current:
+            following = current.next
+            current.next = previous
+            previous, current = current, following
+        self._head = previous
+
+        if self._spine is not None:
+            self._spine.reverse()
+
+    def extend_list(self, other: SinglyLinkedList[T]) -> None:
+        """Moves every node of `other` to the end of this list in O(1). `other` is
+        left empty."""
+        assert isinstance(other, SinglyLinkedList), "other must be a SinglyLinkedList"
+        assert other is not self, "Cannot extend a list with itself"
+
+        if other._head is None:
+            return
+
+        if self._tail is None:
+            self._head = other._head
+        else:
+            self._tail.next = other._head
+        self._tail = other._tail
+        self._size += other._size
+        self._spine = None
+        other._clear()
+
+    def splice(self, after: SLLNode[T], other: SinglyLinkedList[T]) -> None:
+        """Moves every node of `other` right after the node `after` in O(1). `other`
+        is left empty."""
+        assert isinstance(after, SLLNode), "After must be a Node"
+        assert isinstance(other, SinglyLinkedList), "other must be a SinglyLinkedList"
+        assert other is not self, "Cannot splice a list into itself"
+
+        if after is self._tail:
+            return self.extend_list(other)
+        if other._head is None or other._tail is None:
+            return
+
+        other._tail.next = after.next
+        after.next = other._head
+        self._size += other._size
+        self._spine = None
+        other._clear()
+
+    def split_after(self, node: SLLNode[T]) -> SinglyLinkedList[T]:
+        """Detaches the nodes after `node` into a new list, which is returned. The
+        relinking is O(1); counting the detached nodes is O(k)."""
+        assert isinstance(node, SLLNode), "node must be a Node"
+
+        tail: SinglyLinkedList[T] = SinglyLinkedList()
+        if node.next is None:
+            return tail
+
+        tail._head, tail._tail = node.next, self._tail
+        node.next = None
+        self._tail = node
+        tail._size = sum(1 for _ in tail)
+        self._size -= tail._size
+        self._spine = None
+        return tail
+
+    def sort(
+        self,
+        key: typing.Optional[typing.Callable[[T], typing.Any]] = None,
+        reverse: bool = False,
+    ) -> None:
+        """Stable in-place sort in O(n log n) that relinks the existing nodes
+        (bottom-up merge sort, no recursion and no copy of the values)."""
+        if self._head is None or self._head.next is None:
+            return
+
+        self._head = _sort_chain(self._head, _ordering(key, reverse, self._head))
+        tail = self._head
+        while tail.next is not None:
+            tail = tail.next
+        self._tail = tail
+        self._spine = None
+
+    def _clear(self) -> None:
+        self._head = self._tail = None
+        self._size = 0
+        self._spine = None
+
+    def __len__(self) -> int:
+        return self._size
+
     def __iter__(self) -> typing.Iterator[SLLNode[T]]:
         current = self._head
         while current:
@@ -123,19 +309,9 @@ class SinglyLinkedList(typing.Generic[T]):
         return False
 
     def __reversed__(self) -> typing.Iterator[SLLNode[T]]:
-        def _empt_itr() -> typing.Iterator[SLLNode[T]]:
-            yield from ()
-
-        def _reverse(node: SLLNode[T]) -> typing.Iterator[SLLNode[T]]:
-            if node.next is None:
-                yield node
-            else:
-                yield from _reverse(node.next)
-                yield node
-
-        if self._head is None:
-            return _empt_itr()
-        return _reverse(self._head)
+        # The nodes are only linked forwards, so they are collected first: O(n) time
+        # and memory, without recursion.
+        return reversed(list(self._spine if self._spine is not None else self))
 
     def __bool__(self) -> bool:
         if self._head is None:
@@ -147,6 +323,7 @@ class DoublyLinkedList(typing.Generic[T]):
     def __init__(self, __items: typing.Optional[typing.Iterable[T]] = None) -> None:
         self._head: typing.Optional[DLLNode[T]] = None
         self._tail: typing.Optional[DLLNode[T]] = None
+        self._size: int = 0
 
         if __items is not None:
             for item in __items:
@@ -162,9 +339,10 @@ class DoublyLinkedList(typing.Generic[T]):
         assert head is not None, "A starting node must be provided."
         print(" <-> ".join(gen(head)))
 
-    def push(self, value: T) -> None:
-        """Adds a value at the front of the list."""
+    def push(self, value: T) -> DLLNode[T]:
+        """Adds a value at the front of the list and returns its node."""
         self._head = DLLNode[T](value, self._head)
+        self._size += 1
 
         if self._head.next is not None:
             self._head.next.previous = self._head
@@ -172,15 +350,19 @@ class DoublyLinkedList(typing.Generic[T]):
         if self._tail is None:
             self._tail = self._head
 
-    def append(self, value: T) -> None:
-        """Adds a value at the end of the list."""
+        return self._head
+
+    def append(self, value: T) -> DLLNode[T]:
+        """Adds a value at the end of the list and returns its node."""
         if self._tail is None:
             return self.push(value)
 
         self._tail = DLLNode[T](value, None, self._tail)
+        self._size += 1
 
         assert isinstance(self._tail.previous, DLLNode)
         self._tail.previous.next = self._tail
+        return self._tail
 
     def insert(self, after: DLLNode[T], value: T) -> None:
         """Adds a value after a particular list node."""
@@ -193,6 +375,7 @@ class DoublyLinkedList(typing.Generic[T]):
         # assert isinstance(next, DLLNode)
         after.next = DLLNode[T](value, next, after)
         next.previous = after.next
+        self._size += 1
 
     def pop(self) -> typing.Optional[T]:
         """Removes the value at the front of the list."""
@@ -200,6 +383,7 @@ class DoublyLinkedList(typing.Generic[T]):
             return None
 
         value, next, _ = self._head
+        self._size -= 1
         if self._head is self._tail:
             self._head = None
             self._tail = None
@@ -223,6 +407,7 @@ class DoublyLinkedList(typing.Generic[T]):
 
         # assert isinstance(prev, DLLNode)
         prev.next = None
+        self._size -= 1
 
         self._tail = prev
         return value
@@ -244,8 +429,131 @@ class DoublyLinkedList(typing.Generic[T]):
 
         assert isinstance(after.next, DLLNode)
         after.next.prev = after
+        self._size -= 1
         return next.value
 
+    def unlink(self, node: DLLNode[T]) -> T:
+        """Removes `node` from the list in O(1) and returns its value. The node must
+        belong to this list."""
+        previous, following = node.previous, node.next
+
+        if previous is None:
+            self._head = following
+        else:
+            previous.next = following
+
+        if following is None:
+            self._tail = previous
+        else:
+            following.previous = previous
+
+        node.next = node.previous = None
+        self._size -= 1
+        return node.value
+
+    def move_to_front(self, node: DLLNode[T]) -> None:
+        """Moves `node`, which must belong to this list, to the front in O(1)."""
+        if node is self._head:
+            return
+
+        self.unlink(node)
+        node.next = self._head
+        if self._head is not None:
+            self._head.previous = node
+        self._head = node
+        if self._tail is None:
+            self._tail = node
+        self._size += 1
+
+    def extend_list(self, other: DoublyLinkedList[T]) -> None:
+        """Moves every node of `other` to the end of this list in O(1). `other` is
+        left empty."""
+        assert isinstance(other, DoublyLinkedList), "other must be a DoublyLinkedList"
+        assert other is not self, "Cannot extend a list with itself"
+
+        if other._head is None:
+            return
+
+        if self._tail is None:
+            self._head = other._head
+        else:
+            self._tail.next = other._head
+            other._head.previous = self._tail
+        self._tail = other._tail
+        self._size += other._size
+        other._clear()
+
+    def splice(self, after: DLLNode[T], other: DoublyLinkedList[T]) -> None:
+        """Moves every node of `other` right after the node `after` in O(1). `other`
+        is left empty."""
+        assert isinstance(after, DLLNode), "after must be of type Node"
+        assert isinstance(other, DoublyLinkedList), "other must be a DoublyLinkedList"
+        assert other is not self, "Cannot splice a list into itself"
+
+        if after is self._tail:
+            return self.extend_list(other)
+        if other._head is None or other._tail is None:
+            return
+
+        following = after.next
+        assert isinstance(following, DLLNode)
+        other._tail.next, following.previous = following, other._tail
+        after.next, other._head.previous = other._head, after
+        self._size += other._size
+        other._clear()
+
+    def split_after(self, node: DLLNode[T]) -> DoublyLinkedList[T]:
+        """Detaches the nodes after `node` into a new list, which is returned. The
+        relinking is O(1); counting the detached nodes is O(k)."""
+        assert isinstance(node, DLLNode), "node must be of type Node"
+
+        tail: DoublyLinkedList[T] = DoublyLinkedList()
+        if node.next is None:
+            return tail
+
+        tail._head, tail._tail = node.next, self._tail
+        tail._head.previous = None
+        node.next = None
+        self._tail = node
+        tail._size = sum(1 for _ in tail)
+        self._size -= tail._size
+        return tail
+
+    def sort(
+        self,
+        key: typing.Optional[typing.Callable[[T], typing.Any]] = None,
+        reverse: bool = False,
+    ) -> None:
+        """Stable in-place sort in O(n log n) that relinks the existing nodes
+        (bottom-up merge sort, no recursion and no copy of the values)."""
+        if self._head is None or self._head.next is None:
+            return
+
+        self._head = _sort_chain(self._head, _ordering(key, reverse, self._head))
+        self._relink_previous()
+
+    def cursor(
+        self, node: typing.Optional[DLLNode[T]] = None
+    ) -> ListCursor[typing.Any]:
+        """A `ListCursor` on `node`, or on the first node."""
+        return ListCursor(self, node)
+
+    def _relink_previous(self) -> None:
+        """Rebuilds the `previous` links and `_tail` from the `next` chain."""
+        previous: typing.Optional[DLLNode[T]] = None
+        current = self._head
+        while current is not None:
+            current.previous = previous
+            previous, current = current, current.next
+        self._tail = previous
+
+    def _clear(self) -> None:
+        self._head = self._tail = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
     def __iter__(self) -> typing.Iterator[DLLNode[T]]:
         current = self._head
         while current:
@@ -276,4 +584,246 @@ class DoublyLinkedList(typing.Generic[T]):
         return True
 
 
-__all__ = ["SinglyLinkedList", "DoublyLinkedList"]
+class UnrolledLinkedList(typing.Generic[T]):
+    """A doubly linked list of chunks, each holding up to `capacity` values in a
+    contiguous list. Iteration touches one node per chunk instead of one per value,
+    and a value costs a list slot instead of a node object.
+
+    A full chunk is split in half before an insertion, and a chunk that falls under
+    half full after a removal borrows from or merges with its successor. Only the
+    first and last chunks, which grow and shrink with `push`/`append` and
+    `pop`/`remove_last`, may be less than half full.
+    """
+
+    def __init__(
+        self, __items: typing.Optional[typing.Iterable[T]] = None, capacity: int = 64
+    ) -> None:
+        assert capacity >= 2, "capacity must be at least 2"
+
+        self.capacity = capacity
+        self._head: typing.Optional[ULLNode[T]] = None
+        self._tail: typing.Optional[ULLNode[T]] = None
+        self._size: int = 0
+
+        if __items is not None:
+            for item in __items:
+                self.append(item)
+
+    def _link_after(
+        self, node: typing.Optional[ULLNode[T]], chunk: ULLNode[T]
+    ) -> ULLNode[T]:
+        """Links `chunk` after `node`, or at the front when `node` is `None`."""
+        following = self._head if node is None else node.next
+        chunk.previous, chunk.next = node, following
+
+        if node is None:
+            self._head = chunk
+        else:
+            node.next = chunk
+
+        if following is None:
+            self._tail = chunk
+        else:
+            following.previous = chunk
+
+        return chunk
+
+    def _unlink(self, chunk: ULLNode[T]) -> None:
+        if chunk.previous is None:
+            self._head = chunk.next
+        else:
+            chunk.previous.next = chunk.next
+
+        if chunk.next is None:
+            self._tail = chunk.previous
+        else:
+            chunk.next.previous = chunk.previous
+
+        chunk.next = chunk.previous = None
+
+    def _split(self, chunk: ULLNode[T]) -> ULLNode[T]:
+        """Moves the upper half of `chunk` into a new chunk right after it."""
+        half = len(chunk.values) // 2
+        sibling = ULLNode[T](chunk.values[half:])
+        del chunk.values[half:]
+        return self._link_after(chunk, sibling)
+
+    def _rebalance(self, chunk: ULLNode[T]) -> None:
+        if not chunk.values:
+            return self._unlink(chunk)
+
+        following = chunk.next
+        if following is None or len(chunk.values) >= self.capacity // 2:
+            return
+
+        if len(chunk.values) + len(following.values) <= self.capacity:
+            chunk.values.extend(following.values)
+            self._unlink(following)
+        else:
+            chunk.values.append(following.values.pop(0))
+
+    def _index(self, index: int, inclusive: bool = False) -> int:
+        """Resolves a negative `index` and checks its bounds (`len` is allowed when
+        `inclusive`)."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size + inclusive:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return index
+
+    def _locate(self, index: int) -> tuple[ULLNode[T], int]:
+        """The chunk holding position `index` and the offset within it. Walks from
+        whichever end is closer."""
+        if index < self._size // 2:
+            chunk = self._head
+            assert chunk is not None
+            while index >= len(chunk.values):
+                index -= len(chunk.values)
+                chunk = chunk.next
+                assert chunk is not None
+            return chunk, index
+
+        remaining = self._size - index
+        chunk = self._tail
+        assert chunk is not None
+        while remaining > len(chunk.values):
+            remaining -= len(chunk.values)
+            chunk = chunk.previous
+            assert chunk is not None
+        return chunk, len(chunk.values) - remaining
+
+    def push(self, value: T) -> None:
+        """Adds a value at the front of the list."""
+        if self._head is None or len(self._head.values) >= self.capacity:
+            self._link_after(None, ULLNode[T]())
+
+        assert self._head is not None
+        self._head.values.insert(0, value)
+        self._size += 1
+
+    def append(self, value: T) -> None:
+        """Adds a value at the end of the list."""
+        if self._tail is None or len(self._tail.values) >= self.capacity:
+            self._link_after(self._tail, ULLNode[T]())
+
+        assert self._tail is not None
+        self._tail.values.append(value)
+        self._size += 1
+
+    def insert(self, index: int, value: T) -> None:
+        """Adds a value before position `index`, splitting its chunk when it is full."""
+        index = self._index(index, inclusive=True)
+        if index == self._size:
+            return self.append(value)
+        if index == 0:
+            return self.push(value)
+
+        chunk, offset = self._locate(index)
+        if len(chunk.values) >= self.capacity:
+            sibling = self._split(chunk)
+            if offset > len(chunk.values):
+                chunk, offset = sibling, offset - len(chunk.values)
+
+        chunk.values.insert(offset, value)
+        self._size += 1
+
+    def pop(self) -> typing.Optional[T]:
+        """Removes the value at the front of the list."""
+        if self._head is None:
+            return None
+
+        value = self._head.values.pop(0)
+        self._size -= 1
+        if not self._head.values:
+            self._unlink(self._head)
+        return value
+
+    def remove_last(self) -> typing.Optional[T]:
+        """Removes the value at the end of the list."""
+        if self._tail is None:
+            return None
+
+        value = self._tail.values.pop()
+        self._size -= 1
+        if not self._tail.values:
+            self._unlink(self._tail)
+        return value
+
+    def remove(self, index: int) -> T:
+        """Removes the value at position `index`, merging its chunk when it gets sparse."""
+        chunk, offset = self._locate(self._index(index))
+        value = chunk.values.pop(offset)
+        self._size -= 1
+        self._rebalance(chunk)
+        return value
+
+    def chunks(self) -> typing.Iterator[ULLNode[T]]:
+        current = self._head
+        while current:
+            yield current
+            current = current.next
+
+    def __getitem__(self, index: int) -> T:
+        chunk, offset = self._locate(self._index(index))
+        return chunk.values[offset]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> typing.Iterator[T]:
+        for chunk in self.chunks():
+            yield from chunk.values
+
+    def __reversed__(self) -> typing.Iterator[T]:
+        current = self._tail
+        while current:
+            yield from reversed(current.values)
+            current = current.previous
+
+    def __repr__(self) -> str:
+        return " <-> ".join(repr(chunk) for chunk in self.chunks())
+
+    def __str__(self) -> str:
+        return " <-> ".join(str(chunk) for chunk in self.chunks())
+
+    def __contains__(self, value: T) -> bool:
+        return any(value in chunk.values for chunk in self.chunks())
+
+    def __bool__(self) -> bool:
+        return self._head is not None
+
+
+_L = typing.TypeVar("_L", SinglyLinkedList[typing.Any], DoublyLinkedList[typing.Any])
+
+
+def merge_sorted(
+    a: _L,
+    b: _L,
+    key: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+    reverse: bool = False,
+) -> _L:
+    """Merges two lists of the same type, each sorted by `key` and `reverse`, into a
+    new sorted list in linear time. The nodes are relinked, not copied, so `a` and `b`
+    are left empty. On ties, nodes of `a` come first."""
+    assert type(a) is type(b), "Both lists must be of the same type"
+    assert a is not b, "Cannot merge a list with itself"
+
+    merged = type(a)()
+    if a._head is None or b._head is None:
+        merged.extend_list(a)
+        merged.extend_list(b)
+        return merged
+
+    ahead = _ordering(key, reverse, a._head, b._head)
+    merged._head = _merge_chains(a._head, b._head, ahead)
+    merged._tail = a._tail if ahead(b._tail, a._tail) else b._tail
+    merged._size = a._size + b._size
+    if isinstance(merged, DoublyLinkedList):
+        merged._relink_previous()
+
+    a._clear()
+    b._clear()
+    return merged
+
+
+__all__ = ["SinglyLinkedList", "DoublyLinkedList", "UnrolledLinkedList", "merge_sorted"]
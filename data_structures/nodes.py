@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Generic, Iterator, Optional, TypeVar, Union
+from typing import Any, Generic, Iterator, Optional, TypeVar, Union
 
 from ._protocols import CT
 
@@ -68,6 +68,21 @@ class BinarySearchTreeNode(Generic[CT]):
             return NotImplemented
 
 
+class TreapNode(BinarySearchTreeNode[CT]):
+    """A `BinarySearchTreeNode` with a random heap `priority`, used by the treap
+    mode of `BinarySearchTree`."""
+
+    def __init__(
+        self,
+        value: CT,
+        priority: float,
+        left: Optional[TreapNode[CT]] = None,
+        right: Optional[TreapNode[CT]] = None,
+    ) -> None:
+        super().__init__(value, left, right)
+        self.priority = priority
+
+
 class AVLTreeNode(Generic[CT]):
     def __init__(
         self,
@@ -237,9 +252,61 @@ class DoublyLinkedListNode(
             raise NotImplemented
 
 
+class UnrolledLinkedListNode(Generic[T]):
+    """A chunk of an `UnrolledLinkedList`: up to `capacity` values stored contiguously."""
+
+    def __init__(
+        self,
+        values: Optional[list[T]] = None,
+        next: Optional[UnrolledLinkedListNode[T]] = None,
+        previous: Optional[UnrolledLinkedListNode[T]] = None,
+    ) -> None:
+        self.values: list[T] = values if values is not None else []
+        self.next = next
+        self.previous = previous
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(
+        self,
+    ) -> Iterator[Union[list[T], Optional[UnrolledLinkedListNode[T]]]]:
+        yield from (self.values, self.next, self.previous)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.values!r})"
+
+    def __str__(self) -> str:
+        return f"{str(self.values)}"
+
+
+class SkipListNode(Generic[T]):
+    """A skip list tower: `next[level]` skips `width[level]` positions ahead.
+    `payload` holds the value mapped to `value` when the list is used as a map."""
+
+    def __init__(self, value: T, height: int, payload: Any = None) -> None:
+        self.value = value
+        self.payload = payload
+        self.next: list[Optional[SkipListNode[T]]] = [None] * height
+        self.width: list[int] = [1] * height
+
+    @property
+    def height(self) -> int:
+        return len(self.next)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.value!r}, height={self.height})"
+
+    def __str__(self) -> str:
+        return f"{str(self.value)}"
+
+
 __all__ = [
     "BinarySearchTreeNode",
+    "TreapNode",
     "AVLTreeNode",
     "SinglyLinkedListNode",
     "DoublyLinkedListNode",
+    "UnrolledLinkedListNode",
+    "SkipListNode",
 ]
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import contextlib
+import random
+import threading
+import typing
+
+from ._protocols import CT
+from .nodes import SkipListNode
+
+T = typing.TypeVar("T")
+
+_MAX_HEIGHT = 32
+
+
+class IndexableSkipList(typing.Generic[T]):
+    """A sequence stored as a skip list whose links record how many positions they
+    span. Reading, inserting and deleting at a position take expected O(log n) time,
+    `len` is O(1).
+
+    A link that ends past the last value spans up to a virtual position `len + 1`,
+    so every insertion or deletion adjusts widths the same way.
+    """
+
+    def __init__(
+        self,
+        __items: typing.Optional[typing.Iterable[T]] = None,
+        seed: typing.Optional[int] = None,
+    ) -> None:
+        self._head: SkipListNode[typing.Any] = SkipListNode(None, _MAX_HEIGHT)
+        self._height: int = 1
+        self._size: int = 0
+        self._random = random.Random(seed)
+
+        if __items is not None:
+            for item in __items:
+                self.append(item)
+
+    def _random_height(self) -> int:
+        height = 1
+        while height < _MAX_HEIGHT and self._random.random() < 0.5:
+            height += 1
+        return height
+
+    def _index(self, index: int, inclusive: bool = False) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size + inclusive:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return index
+
+    def _predecessors(
+        self, index: int
+    ) -> tuple[list[SkipListNode[typing.Any]], list[int]]:
+        """For every level, the last node before position `index` and its position
+        (the head sits at 0 and the value at `index` at `index + 1`)."""
+        update: list[SkipListNode[typing.Any]] = [self._head] * self._height
+        positions = [0] * self._height
+
+        node, position = self._head, 0
+        for level in reversed(range(self._height)):
+            following = node.next[level]
+            while following is not None and position + node.width[level] <= index:
+                position += node.width[level]
+                node, following = following, following.next[level]
+            update[level], positions[level] = node, position
+
+        return update, positions
+
+    def _node(self, index: int) -> SkipListNode[T]:
+        node, remaining = self._head, index + 1
+        for level in reversed(range(self._height)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = typing.cast(SkipListNode[T], node.next[level])
+            if remaining == 0:
+                break
+        return node
+
+    def insert_at(self, index: int, value: T) -> None:
+        """Inserts `value` before position `index` (`len` appends)."""
+        index = self._index(index, inclusive=True)
+
+        height = self._random_height()
+        if height > self._height:
+            # Fresh head levels point past the end.
+            for level in range(self._height, height):
+                self._head.next[level] = None
+                self._head.width[level] = self._size + 1
+            self._height = height
+
+        update, positions = self._predecessors(index)
+        node: SkipListNode[T] = SkipListNode(value, height)
+        for level in range(height):
+            previous = update[level]
+            skipped = index - positions[level]
+            node.next[level] = previous.next[level]
+            node.width[level] = previous.width[level] - skipped
+            previous.next[level] = node
+            previous.width[level] = skipped + 1
+
+        for level in range(height, self._height):
+            update[level].width[level] += 1
+
+        self._size += 1
+
+    def delete_at(self, index: int) -> T:
+        """Removes and returns the value at position `index`."""
+        index = self._index(index)
+
+        update, _ = self._predecessors(index)
+        node = typing.cast(SkipListNode[T], update[0].next[0])
+        for level in range(self._height):
+            previous = update[level]
+            if previous.next[level] is node:
+                previous.width[level] += node.width[level] - 1
+                previous.next[level] = node.next[level]
+            else:
+                previous.width[level] -= 1
+
+        while self._height > 1 and self._head.next[self._height - 1] is None:
+            self._height -= 1
+
+        self._size -= 1
+        return node.value
+
+    def append(self, value: T) -> None:
+        self.insert_at(self._size, value)
+
+    def __getitem__(self, index: int) -> T:
+        return self._node(self._index(index)).value
+
+    def __setitem__(self, index: int, value: T) -> None:
+        self._node(self._index(index)).value = value
+
+    def __delitem__(self, index: int) -> None:
+        self.delete_at(index)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> typing.Iterator[T]:
+        node = self._head.next[0]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+    def __contains__(self, value: T) -> bool:
+        return any(item == value for item in self)
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __str__(self) -> str:
+        return " -> ".join(str(item) for item in self)
+
+
+class SkipList(typing.Generic[CT]):
+    """An ordered set of values, optionally mapped to payloads, stored as a skip list.
+    Search, insertion and removal take expected O(log n) time. Inserting an existing
+    value replaces its payload instead of adding a duplicate.
+
+    With `concurrent=True`, writers are serialized by a lock while readers
+    (`__contains__`, `get`, iteration) take no lock at all. A writer prepares a
+    node completely before linking it, bottom level first, and unlinks from the top
+    level down, leaving the removed node's links intact. A reader therefore always
+    follows a valid chain; it may or may not observe a write that is in progress.
+    """
+
+    def __init__(
+        self,
+        __items: typing.Optional[typing.Iterable[CT]] = None,
+        concurrent: bool = False,
+        seed: typing.Optional[int] = None,
+    ) -> None:
+        self._head: SkipListNode[typing.Any] = SkipListNode(None, _MAX_HEIGHT)
+        self._height: int = 1
+        self._size: int = 0
+        self._random = random.Random(seed)
+        self._lock: typing.Optional[threading.Lock] = (
+            threading.Lock() if concurrent else None
+        )
+
+        if __items is not None:
+            for item in __items:
+                self.insert(item)
+
+    def _writing(self) -> typing.ContextManager[typing.Any]:
+        return self._lock if self._lock is not None else contextlib.nullcontext()
+
+    def _random_height(self) -> int:
+        height = 1
+        while height < _MAX_HEIGHT and self._random.random() < 0.5:
+            height += 1
+        return height
+
+    def _predecessors(self, value: CT) -> list[SkipListNode[typing.Any]]:
+        """For every level, the last node holding a value smaller than `value`."""
+        update: list[SkipListNode[typing.Any]] = [self._head] * _MAX_HEIGHT
+        node = self._head
+        for level in reversed(range(self._height)):
+            following = node.next[level]
+            while following is not None and following.value < value:
+                node, following = following, following.next[level]
+            update[level] = node
+        return update
+
+    def _lower_bound(self, value: CT) -> typing.Optional[SkipListNode[CT]]:
+        """The first node whose value is not smaller than `value`."""
+        node = self._head
+        for level in reversed(range(self._height)):
+            following = node.next[level]
+            while following is not None and following.value < value:
+                node, following = following, following.next[level]
+        return node.next[0]
+
+    def insert(self, value: CT, payload: typing.Any = None) -> None:
+        with self._writing():
+            update = self._predecessors(value)
+            existing = update[0].next[0]
+            if existing is not None and existing.value == value:
+                existing.payload = payload
+                return
+
+            height = self._random_height()
+            node: SkipListNode[CT] = SkipListNode(value, height, payload)
+            for level in range(height):
+                node.next[level] = update[level].next[level]
+            for level in range(height):
+                update[level].next[level] = node
+
+            self._height = max(self._height, height)
+            self._size += 1
+
+    def remove(self, value: CT) -> None:
+        with self._writing():
+            update = self._predecessors(value)
+            node = update[0].next[0]
+            if node is None or node.value != value:
+                return
+
+            for level in reversed(range(node.height)):
+                update[level].next[level] = node.next[level]
+
+            while self._height > 1 and self._head.next[self._height - 1] is None:
+                self._height -= 1
+            self._size -= 1
+
+    def get(self, value: CT, default: typing.Any = None) -> typing.Any:
+        """The payload stored with `value`, or `default` when it is missing."""
+        node = self._lower_bound(value)
+        if node is not None and node.value == value:
+            return node.payload
+        return default
+
+    def irange(
+        self, start: typing.Optional[CT] = None, stop: typing.Optional[CT] = None
+    ) -> typing.Iterator[CT]:
+        """Lazily yields the values `v` with `start <= v < stop`, in order. Either bound
+        may be omitted."""
+        node = self._head.next[0] if start is None else self._lower_bound(start)
+        while node is not None and (stop is None or node.value < stop):
+            yield node.value
+            node = node.next[0]
+
+    def items(self) -> typing.Iterator[tuple[CT, typing.Any]]:
+        node = self._head.next[0]
+        while node is not None:
+            yield node.value, node.payload
+            node = node.next[0]
+
+    def __getitem__(self, value: CT) -> typing.Any:
+        node = self._lower_bound(value)
+        if node is None or node.value != value:
+            raise KeyError(value)
+        return node.payload
+
+    def __setitem__(self, value: CT, payload: typing.Any) -> None:
+        self.insert(value, payload)
+
+    def __contains__(self, value: CT) -> bool:
+        node = self._lower_bound(value)
+        return node is not None and node.value == value
+
+    def __iter__(self) -> typing.Iterator[CT]:
+        return self.irange()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._head.next[0] is not None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __str__(self) -> str:
+        return " -> ".join(str(value) for value in self)
+
+
+__all__ = ["IndexableSkipList", "SkipList"]
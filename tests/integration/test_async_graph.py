@@ -0,0 +1,135 @@
+import asyncio
+import random
+import time
+import unittest
+
+from data_structures.async_graph import AsyncGraph, GraphProvider
+from data_structures.graph import AdjacencyList as Graph
+
+
+class TestAsyncGraph(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        rng = random.Random(3)
+        self.graph = Graph(directed=True)
+        for _ in range(150):
+            source, destination = rng.sample(range(40), 2)
+            self.graph.add(source, destination, rng.randint(1, 9))
+
+        self.provider = GraphProvider(self.graph, latency=0.001)
+        self.remote = AsyncGraph(self.provider)
+
+    def tearDown(self) -> None:
+        del self.graph
+        del self.provider
+        del self.remote
+
+    async def test_matches_graph(self) -> None:
+        for end in range(1, 40):
+            try:
+                expected = list(self.graph.dijkstra(0, end))
+            except ValueError:
+                with self.assertRaises(ValueError):
+                    await self.remote.dijkstra(0, end)
+                continue
+
+            path = await self.remote.dijkstra(0, end)
+            self.assertEqual(path[-1], expected[-1])
+            self.assertEqual(path[0], (0, 0))
+            path = await self.remote.a_star(0, end, lambda a, b: 0.0)
+            self.assertEqual(path[-1], expected[-1])
+
+        levels = {v._data: depth for v, depth in self.graph.bfs_levels(0).items()}
+        self.assertEqual(await self.remote.bfs_levels(0), levels)
+        self.assertEqual(
+            [vertex async for vertex in self.remote.bfs(0, max_depth=1)],
+            [v._data for v in self.graph.bfs(0, max_depth=1)],
+        )
+        # Like `AdjacencyList.dijkstra`, a vertex has no path to itself.
+        self.assertRaises(ValueError, self.graph.dijkstra, 5, 5)
+        with self.assertRaises(ValueError):
+            await self.remote.dijkstra(5, 5)
+        with self.assertRaises(ValueError):
+            await self.remote.a_star(5, 5)
+
+    async def test_cache(self) -> None:
+        tree = await self.remote.shortest_path_tree(0)
+        calls = self.provider.calls
+        self.assertEqual(await self.remote.shortest_path_tree(0), tree)
+        self.assertEqual(self.provider.calls, calls)
+        self.assertGreater(self.remote.hits, 0)
+
+        small = AsyncGraph(GraphProvider(self.graph), cache_size=2)
+        self.assertEqual(await small.shortest_path_tree(0), tree)
+        self.assertLessEqual(len(small._cache), 2)
+
+    async def test_batching(self) -> None:
+        star = Graph(directed=True)
+        star.add_edges(("hub", leaf, 1) for leaf in range(50))
+        provider = GraphProvider(star, latency=0.05)
+        remote = AsyncGraph(provider)
+
+        started = time.perf_counter()
+        self.assertEqual(len(await remote.bfs_levels("hub")), 51)
+        # Sequential fetches would take 51 round trips (over 2.5s).
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(provider.calls, 51)
+
+        started = time.perf_counter()
+        await AsyncGraph(provider).shortest_path_tree("hub")
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+    async def test_prefetch_is_bounded(self) -> None:
+        star = Graph(directed=True)
+        star.add_edges((0, leaf, 1) for leaf in range(1, 200))
+        provider = GraphProvider(star, latency=0.01)
+        remote = AsyncGraph(provider, lookahead=4)
+
+        self.assertEqual(await remote.dijkstra(0, 1), [(0, 0), (1, 1)])
+        await asyncio.sleep(0.05)
+        # Unused prefetches are cancelled when the search returns.
+        self.assertLessEqual(provider.calls, 1 + 4)
+        self.assertEqual(remote._pending, {})
+
+        # A search whose prefetch was cancelled by another one fetches it again.
+        other = asyncio.ensure_future(remote.neighbors(2))
+        await asyncio.sleep(0)
+        remote._cancel(dict(remote._pending))
+        self.assertEqual(await other, ())
+
+    async def test_prefetch_follows_queue_order(self) -> None:
+        star = Graph(directed=True)
+        star.add_edges((0, leaf, 100 - leaf) for leaf in range(1, 100))
+        star.add_edges([(99, 200, 1)])
+        fetched: list[int] = []
+
+        async def provider(vertex: int) -> list[tuple[int, float]]:
+            fetched.append(vertex)
+            await asyncio.sleep(0.01)
+            return [
+                (edge.destination._data, edge.weight) for edge in star.edges(vertex)
+            ]
+
+        remote = AsyncGraph(provider, lookahead=3)
+        self.assertEqual(await remote.dijkstra(0, 200), [(0, 0), (99, 1), (200, 2)])
+        # Only the entries dequeued next (the cheapest leaves) were prefetched.
+        self.assertLessEqual({0, 97, 98, 99}, set(fetched))
+        self.assertLessEqual(set(fetched), {0, 97, 98, 99, 200})
+
+    async def test_failed_prefetch(self) -> None:
+        calls: list[int] = []
+
+        async def provider(vertex: int) -> list[tuple[int, float]]:
+            calls.append(vertex)
+            raise ConnectionError(vertex)
+
+        remote = AsyncGraph(provider)
+        remote.prefetch([7])
+        await asyncio.sleep(0)
+        self.assertEqual(remote._pending, {})
+        with self.assertRaises(ConnectionError):
+            await remote.neighbors(7)
+        self.assertEqual(calls, [7, 7])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,90 @@
+import random
+import unittest
+from typing import Optional
+
+from data_structures.binary_search_tree import BinarySearchTree as Tree
+from data_structures.nodes import BinarySearchTreeNode, TreapNode
+
+
+class TestTreap(unittest.TestCase):
+    def in_order(self, tree: Tree) -> list:
+        return list(tree.cursor())
+
+    def depth(self, node: Optional[BinarySearchTreeNode]) -> int:
+        depth, level = 0, [node] if node is not None else []
+        while level:
+            depth += 1
+            level = [
+                child for node in level for child in (node.left, node.right) if child
+            ]
+        return depth
+
+    def assert_heap_ordered(self, node: Optional[TreapNode]) -> None:
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            for child in (node.left, node.right):
+                if child is not None:
+                    self.assertGreaterEqual(node.priority, child.priority)
+                    stack.append(child)
+
+    def test_sorted_input(self) -> None:
+        n = 20_000
+        tree = Tree(range(n), balance="treap", seed=1)
+
+        self.assertIsInstance(tree.root, TreapNode)
+        self.assertEqual(self.in_order(tree), list(range(n)))
+        self.assertLess(self.depth(tree.root), 60)
+        self.assert_heap_ordered(tree.root)
+        self.assertIn(n - 1, tree)
+        self.assertNotIn(n, tree)
+
+    def test_insert_and_remove(self) -> None:
+        rng = random.Random(5)
+        tree: Tree[int] = Tree(balance="treap", seed=5)
+        expected: list[int] = []
+
+        for _ in range(2_000):
+            value = rng.randrange(300)
+            if expected and rng.random() < 0.4:
+                value = rng.choice(expected)
+                tree.remove(value)
+                expected.remove(value)
+            else:
+                tree.insert(value)
+                expected.append(value)
+
+        self.assertEqual(self.in_order(tree), sorted(expected))
+        self.assert_heap_ordered(tree.root)
+
+        tree.remove(1_000)
+        self.assertEqual(self.in_order(tree), sorted(expected))
+
+        for value in list(expected):
+            tree.remove(value)
+        self.assertIsNone(tree.root)
+
+    def test_seed(self) -> None:
+        values = [5, 3, 8, 1, 4]
+        self.assertEqual(
+            str(Tree(values, balance="treap", seed=3)),
+            str(Tree(values, balance="treap", seed=3)),
+        )
+
+    def test_default_mode(self) -> None:
+        tree = Tree([2, 1, 3])
+        self.assertIsNone(tree.balance)
+        self.assertNotIsInstance(tree.root, TreapNode)
+
+        mapped = Tree.from_mapped_list([2, 1, 3])
+        self.assertIsNone(mapped.balance)
+        self.assertEqual(self.in_order(mapped), [1, 2, 3])
+        mapped.insert(0)
+        self.assertEqual(self.in_order(mapped), [0, 1, 2, 3])
+
+        with self.assertRaises(AssertionError):
+            Tree(balance="red-black")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
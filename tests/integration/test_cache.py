@@ -0,0 +1,98 @@
+import unittest
+
+from data_structures.cache import LFUCache, LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.evicted: list[tuple[str, int]] = []
+        self.clock = FakeClock()
+        self.cache: LRUCache[str, int] = LRUCache(
+            3,
+            ttl=10,
+            on_evict=lambda k, v: self.evicted.append((k, v)),
+            clock=self.clock,
+        )
+
+    def tearDown(self) -> None:
+        del self.cache
+
+    def test_eviction(self) -> None:
+        for i, key in enumerate("abc"):
+            self.cache.put(key, i)
+        self.assertEqual(self.cache.get("a"), 0)
+        self.cache.put("d", 3)
+
+        self.assertEqual(self.evicted, [("b", 1)])
+        self.assertEqual(list(self.cache), ["d", "a", "c"])
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get_or_put("e", lambda: 4), 4)
+        self.assertEqual(self.cache.get_or_put("e", lambda: 5), 4)
+        self.assertEqual(self.cache.pop("a"), 0)
+        self.assertEqual(len(self.cache), 2)
+
+        stats = self.cache.stats
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (2, 2, 2))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+        self.cache.resize(1)
+        self.assertEqual(list(self.cache), ["e"])
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_ttl(self) -> None:
+        self.cache.put("a", 1)
+        self.clock.now = 5
+        self.cache.put("b", 2)
+        self.clock.now = 11
+        self.assertNotIn("a", self.cache)
+        self.assertIn("b", self.cache)
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.get("b"), 2)
+
+        self.cache.put("a", 3)
+        self.clock.now = 16
+        self.assertEqual(self.cache.expire(), 1)
+        self.assertEqual(list(self.cache), ["a"])
+        self.assertEqual(self.evicted, [("a", 1), ("b", 2)])
+        self.assertEqual(self.cache.stats.expirations, 2)
+        self.assertEqual(self.cache.stats.evictions, 0)
+
+
+class TestLFUCache(unittest.TestCase):
+    def test_eviction(self) -> None:
+        evicted: list[str] = []
+        cache: LFUCache[str, int] = LFUCache(2, on_evict=lambda k, v: evicted.append(k))
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual(evicted, ["b"])
+        self.assertEqual(cache.frequency("a"), 3)
+
+        cache.get("c")
+        cache.put("d", 4)
+        self.assertEqual(evicted, ["b", "c"], "ties go to the least recently used")
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.frequency("b"), 0)
+
+        cache.pop("d")
+        cache.put("e", 5)
+        cache.put("f", 6)
+        self.assertEqual(evicted, ["b", "c", "e"])
+        self.assertEqual(sorted(cache._nodes), ["a", "f"])
+        self.assertEqual(cache.stats.evictions, 3)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
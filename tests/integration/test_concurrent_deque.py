@@ -0,0 +1,78 @@
+import queue
+import threading
+import time
+import unittest
+
+from data_structures.concurrent_deque import ConcurrentDeque
+
+
+class TestConcurrentDeque(unittest.TestCase):
+    def setUp(self) -> None:
+        self.deque: ConcurrentDeque[int] = ConcurrentDeque(range(5))
+
+    def tearDown(self) -> None:
+        del self.deque
+
+    def test_operations(self) -> None:
+        self.deque.push(-1)
+        self.deque.append(5)
+        self.assertEqual(len(self.deque), 7)
+        self.assertEqual(self.deque.pop(), -1)
+        self.assertEqual(self.deque.remove_last(), 5)
+        self.assertEqual(self.deque.drain(2), [0, 1])
+        self.assertEqual(self.deque.drain(), [2, 3, 4])
+        self.assertEqual(self.deque.drain(), [])
+
+        self.assertRaises(queue.Empty, self.deque.pop, block=False)
+        started = time.monotonic()
+        self.assertRaises(queue.Empty, self.deque.remove_last, timeout=0.05)
+        self.assertRaises(queue.Empty, self.deque.drain, block=True, timeout=0.01)
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+
+        bounded: ConcurrentDeque[int] = ConcurrentDeque([1], maxsize=1)
+        self.assertRaises(queue.Full, bounded.append, 2, block=False)
+        self.assertRaises(queue.Full, bounded.push, 2, timeout=0.01)
+
+    def test_blocking(self) -> None:
+        empty: ConcurrentDeque[str] = ConcurrentDeque()
+        threading.Timer(0.05, empty.append, args=("late",)).start()
+        self.assertEqual(empty.pop(timeout=5), "late")
+
+        bounded: ConcurrentDeque[int] = ConcurrentDeque([1], maxsize=1)
+        threading.Timer(0.05, bounded.pop).start()
+        bounded.append(2, timeout=5)
+        self.assertEqual(bounded.drain(), [2])
+
+    def test_producers_consumers(self) -> None:
+        work: ConcurrentDeque[int] = ConcurrentDeque(maxsize=64)
+        received: list[list[int]] = [[] for _ in range(4)]
+
+        def produce(offset: int) -> None:
+            for value in range(offset, offset + 2000):
+                work.append(value)
+
+        def consume(slot: int) -> None:
+            while True:
+                try:
+                    if slot % 2:
+                        received[slot].append(work.pop(timeout=0.5))
+                    else:
+                        received[slot].extend(work.drain(16, block=True, timeout=0.5))
+                except queue.Empty:
+                    return
+
+        threads = [
+            threading.Thread(target=produce, args=(i * 2000,)) for i in range(4)
+        ] + [threading.Thread(target=consume, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        values = sorted(value for chunk in received for value in chunk)
+        self.assertEqual(values, list(range(8000)))
+        self.assertEqual(len(work), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
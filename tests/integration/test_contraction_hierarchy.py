@@ -0,0 +1,91 @@
+import os
+import pickle
+import random
+import tempfile
+import unittest
+
+from data_structures.contraction_hierarchy import ContractionHierarchy
+from data_structures.graph import AdjacencyList as Graph
+
+
+class TestContractionHierarchy(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(7)
+        self.graph = Graph(directed=True)
+        self.vertices = [self.graph.create_vertex(i) for i in range(60)]
+        for _ in range(240):
+            source, destination = rng.sample(self.vertices, 2)
+            self.graph.add(source, destination, rng.randint(1, 10))
+
+        self.hierarchy = ContractionHierarchy(self.graph)
+
+    def tearDown(self) -> None:
+        del self.graph
+        del self.vertices
+        del self.hierarchy
+
+    def assertMatchesDijkstra(self, hierarchy: ContractionHierarchy) -> None:
+        for source in self.vertices[:15]:
+            for destination in self.vertices:
+                if source is destination:
+                    continue
+                try:
+                    expected = list(self.graph.dijkstra(source, destination))
+                except ValueError:
+                    self.assertRaises(
+                        ValueError, hierarchy.distance, source._data, destination._data
+                    )
+                    continue
+
+                path = list(hierarchy.shortest_path(source._data, destination._data))
+                self.assertEqual(path[0], (source._data, 0))
+                self.assertEqual(path[-1], expected[-1])
+                self.assertEqual(
+                    hierarchy.distance(source._data, destination._data),
+                    expected[-1][1],
+                )
+
+                for (u, _), (v, cost) in zip(path, path[1:]):
+                    self.assertIsNotNone(
+                        self.graph.weight(
+                            self.graph.create_vertex(u), self.graph.create_vertex(v)
+                        )
+                    )
+
+    def test_queries(self) -> None:
+        self.assertEqual(len(self.hierarchy), 60)
+        self.assertMatchesDijkstra(self.hierarchy)
+        # Like `AdjacencyList.dijkstra`, a vertex has no path to itself.
+        self.assertRaises(ValueError, self.graph.dijkstra, 3, 3)
+        self.assertRaises(ValueError, self.hierarchy.shortest_path, 3, 3)
+        self.assertRaises(ValueError, self.hierarchy.distance, 3, 3)
+        self.assertRaises(ValueError, self.hierarchy.distance, 0, "missing")
+
+    def test_save_load(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "hierarchy.ch")
+            self.hierarchy.save(path)
+            loaded = ContractionHierarchy.load(path)
+
+        self.assertEqual(loaded.rank, self.hierarchy.rank)
+        self.assertEqual(loaded._edges, self.hierarchy._edges)
+        self.assertMatchesDijkstra(loaded)
+
+        # Non-JSON vertices are pickled, and loading those has to be opted into.
+        graph = Graph(directed=True)
+        graph.add_edges(((i,), (i + 1,), 2) for i in range(5))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "hierarchy.ch")
+            ContractionHierarchy(graph).save(path)
+            self.assertRaises(ValueError, ContractionHierarchy.load, path)
+            loaded = ContractionHierarchy.load(path, allow_pickle=True)
+
+            with open(path, "wb") as file:
+                pickle.dump({"format": 1}, file)
+            self.assertRaises(ValueError, ContractionHierarchy.load, path, True)
+
+        self.assertEqual(loaded.distance((0,), (4,)), 8)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
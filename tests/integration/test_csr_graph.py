@@ -0,0 +1,189 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from data_structures.csr_graph import CSRGraph
+from data_structures.graph import AdjacencyList as Graph
+
+
+class TestCSRGraph(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "graph.bin")
+
+        self.graph = Graph(directed=True)
+        self.graph.add_edges(
+            [("a", "b", 1.5), ("a", "c", 4), ("b", "c", 2), ("c", "d", 1), ("e", "a")]
+        )
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        del self.graph
+
+    def assertSnapshotEqual(self, a: Graph, b: Graph) -> None:
+        frozen_a, frozen_b = a.freeze(), b.freeze()
+        self.assertEqual(list(frozen_a.vertices), list(frozen_b.vertices))
+        self.assertEqual(list(frozen_a.offsets), list(frozen_b.offsets))
+        self.assertEqual(list(frozen_a.targets), list(frozen_b.targets))
+        self.assertEqual(list(frozen_a.weights), list(frozen_b.weights))
+
+    def test_round_trip(self) -> None:
+        self.graph.save(self.path)
+
+        for mmap in (True, False):
+            loaded = Graph.load(self.path, mmap=mmap)
+            self.assertIsInstance(loaded, CSRGraph)
+            self.assertEqual(len(loaded), 5)
+            self.assertTrue(loaded.directed)
+            self.assertEqual(list(loaded.offsets), list(self.graph.freeze().offsets))
+            self.assertEqual(loaded.weight("a", "b"), 1.5)
+            self.assertIsNone(loaded.weight("b", "a"))
+            self.assertEqual(list(loaded), ["a", "b", "c", "d", "e"])
+            self.assertEqual(loaded.bfs_levels("a"), {"a": 0, "b": 1, "c": 1, "d": 2})
+
+    def test_thaw(self) -> None:
+        self.graph.save(self.path)
+        thawed = Graph.load(self.path).thaw()
+
+        a, d = thawed.create_vertex("a"), thawed.create_vertex("d")
+        self.assertEqual(
+            list(thawed.dijkstra(a, d)), [("a", 0), ("b", 1.5), ("c", 3.5), ("d", 4.5)]
+        )
+        self.assertSnapshotEqual(thawed, self.graph)
+
+        undirected = Graph(directed=False)
+        undirected.add_edges([(1, 2, 3)])
+        undirected.save(self.path)
+        thawed = Graph.load(self.path, mmap=False).thaw()
+        self.assertFalse(thawed._type)
+        self.assertSnapshotEqual(thawed, undirected)
+
+    def test_vertex_table(self) -> None:
+        self.graph.save(self.path)
+        with open(self.path, "rb") as file:
+            self.assertTrue(file.read().endswith(b'"a""b""c""d""e"'))
+
+        mixed = Graph(directed=True)
+        mixed.add_edges([("é", 10, 1), (10, None, 2), (None, 2.5, 3), (True, "é", 4)])
+        mixed.save(self.path)
+        for mmap in (True, False):
+            loaded = Graph.load(self.path, mmap=mmap)
+            self.assertEqual(list(loaded), ["é", 10, None, 2.5, True])
+            self.assertEqual(loaded.vertices[-1], True)
+            self.assertEqual(loaded.vertices[1:3], [10, None])
+            for i, vertex in enumerate(["é", 10, None, 2.5, True]):
+                self.assertEqual(loaded.position(vertex), i)
+            for missing in ("x", 11, [10], (10,)):
+                self.assertIsNone(loaded.position(missing))
+            self.assertEqual(loaded.neighbors(10), [None])
+            self.assertEqual(
+                loaded.dijkstra(True, 2.5),
+                [(True, 0), ("é", 4), (10, 5), (None, 7), (2.5, 10)],
+            )
+            # Lookups search the mapped table instead of building the index.
+            self.assertIsNone(loaded._index)
+
+        tuples = Graph(directed=True)
+        tuples.add_edges([((0, 0), (0, 1), 1)])
+        tuples.save(self.path)
+        self.assertRaises(ValueError, Graph.load, self.path)
+        loaded = Graph.load(self.path, allow_pickle=True)
+        self.assertEqual(list(loaded), [(0, 0), (0, 1)])
+        self.assertEqual(loaded.weight((0, 0), (0, 1)), 1)
+
+    def test_dijkstra(self) -> None:
+        frozen = self.graph.freeze()
+        self.graph.save(self.path)
+        for snapshot in (frozen, Graph.load(self.path)):
+            self.assertEqual(
+                snapshot.dijkstra("a", "d"),
+                list(self.graph.dijkstra("a", "d")),
+            )
+            self.assertEqual(
+                snapshot.dijkstra("e", "b"), [("e", 0), ("a", 0), ("b", 1.5)]
+            )
+            for start, end in (("d", "a"), ("a", "a"), ("a", "missing")):
+                self.assertRaises(ValueError, snapshot.dijkstra, start, end)
+
+    def test_invalid_file(self) -> None:
+        with open(self.path, "wb") as file:
+            file.write(b"\x00" * 64)
+        self.assertRaises(ValueError, CSRGraph.load, self.path)
+
+        self.graph.save(self.path)
+        with open(self.path, "r+b") as file:
+            file.seek(8)
+            file.write((1).to_bytes(4, "little"))
+        self.assertRaises(ValueError, CSRGraph.load, self.path)
+
+    def test_centrality(self) -> None:
+        graph = Graph(directed=True)
+        graph.add_edges([(1, 2), (2, 3), (3, 1), (4, 1), (1, 4)])
+        frozen = graph.freeze()
+
+        expected = {
+            "pagerank": [0.386941, 0.201950, 0.209158, 0.201950],
+            "degree_centrality": [4 / 3, 2 / 3, 2 / 3, 2 / 3],
+            "closeness_centrality": [0.75, 0.6, 0.5, 0.5],
+            "eigenvector_centrality": [0.637007, 0.480863, 0.362992, 0.480863],
+        }
+        for name, scores in expected.items():
+            by_data = getattr(frozen, name)()
+            by_vertex = getattr(graph, name)()
+            for vertex, score in zip(graph, scores):
+                self.assertAlmostEqual(by_data[vertex._data], score, 5, name)
+                self.assertAlmostEqual(by_vertex[vertex], score, 5, name)
+
+        self.assertAlmostEqual(sum(frozen.pagerank().values()), 1.0)
+        self.assertRaises(ValueError, frozen.pagerank, max_iter=1)
+
+    def test_centrality_backends(self) -> None:
+        rng = random.Random(4)
+        graph = Graph(directed=True)
+        graph.add_edges((rng.randrange(60), rng.randrange(60)) for _ in range(300))
+        graph.create_vertex("isolated")
+
+        names = (
+            "pagerank",
+            "degree_centrality",
+            "closeness_centrality",
+            "eigenvector_centrality",
+        )
+        with mock.patch("data_structures._numpy.np", None):
+            frozen = graph.freeze()
+            transpose = [list(part) for part in frozen._reversed()]
+            expected = {name: getattr(frozen, name)() for name in names}
+
+        frozen = graph.freeze()
+        self.assertEqual([list(part) for part in frozen._reversed()], transpose)
+        self.assertIs(frozen._reversed(), frozen._reversed())
+        for name in names:
+            scores = getattr(frozen, name)()
+            for vertex, score in expected[name].items():
+                self.assertAlmostEqual(scores[vertex], score, 6, name)
+
+        # Analytics share one snapshot until the graph changes.
+        graph.pagerank()
+        snapshot = graph._snapshot()
+        graph.closeness_centrality()
+        self.assertIs(graph._snapshot(), snapshot)
+        graph.add(0, 1)
+        self.assertIsNot(graph._snapshot(), snapshot)
+
+    def test_bfs_backends(self) -> None:
+        rng = random.Random(6)
+        graph = Graph(directed=True)
+        graph.add_edges((rng.randrange(300), rng.randrange(300)) for _ in range(700))
+        frozen = graph.freeze()
+
+        for start in (0, 17, 299):
+            for depth in (None, 0, 2):
+                with mock.patch("data_structures._numpy.np", None):
+                    expected = frozen.bfs_levels(start, depth)
+                self.assertEqual(frozen.bfs_levels(start, depth), expected)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
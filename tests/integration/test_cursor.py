@@ -0,0 +1,111 @@
+import bisect
+import random
+import unittest
+
+from data_structures.adelson_velsky_landis import AVL
+from data_structures.binary_search_tree import BinarySearchTree
+from data_structures.cursor import ListCursor, TreeCursor
+from data_structures.linked_lists import DoublyLinkedList
+
+
+class TestTreeCursor(unittest.TestCase):
+    def trees(self, values: list[int]) -> list:
+        return [AVL(values), BinarySearchTree(values)]
+
+    def test_empty(self) -> None:
+        for tree in self.trees([]):
+            cursor = tree.cursor()
+            self.assertIsInstance(cursor, TreeCursor)
+            self.assertFalse(cursor)
+            self.assertFalse(cursor.next())
+            self.assertFalse(cursor.seek(1))
+            self.assertFalse(cursor.last())
+            with self.assertRaises(IndexError):
+                cursor.value
+
+    def test_walks(self) -> None:
+        rng = random.Random(3)
+        values = [rng.randrange(200) for _ in range(300)]
+        expected = sorted(values)
+
+        for tree in self.trees(values):
+            self.assertEqual(list(tree.cursor()), expected)
+
+            cursor = tree.cursor()
+            self.assertTrue(cursor.last())
+            backwards = [cursor.value]
+            while cursor.prev():
+                backwards.append(cursor.value)
+            self.assertEqual(backwards, expected[::-1])
+
+            self.assertTrue(cursor.first())
+            self.assertFalse(cursor.prev())
+            self.assertTrue(cursor.first())
+            self.assertEqual(cursor.value, expected[0])
+
+    def test_seek(self) -> None:
+        rng = random.Random(7)
+        values = [rng.randrange(0, 1000, 3) for _ in range(400)]
+        expected = sorted(values)
+
+        for tree in self.trees(values):
+            cursor = tree.cursor()
+            keys = [rng.randrange(-10, 1010) for _ in range(500)]
+            # Random jumps, then an ascending sweep that stays close to the finger.
+            for key in keys + sorted(keys):
+                index = bisect.bisect_left(expected, key)
+                found = cursor.seek(key)
+                self.assertEqual(found, index < len(expected))
+                if found:
+                    self.assertEqual(cursor.value, expected[index])
+                    # The finger keeps working for neighbouring steps.
+                    if index + 1 < len(expected):
+                        self.assertTrue(cursor.next())
+                        self.assertEqual(cursor.value, expected[index + 1])
+                        cursor.prev()
+                else:
+                    self.assertFalse(cursor)
+
+
+class TestListCursor(unittest.TestCase):
+    def test_walks(self) -> None:
+        items = DoublyLinkedList(range(5))
+        cursor = items.cursor()
+        self.assertIsInstance(cursor, ListCursor)
+        self.assertEqual(list(cursor), [0, 1, 2, 3, 4])
+        self.assertFalse(cursor)
+
+        self.assertTrue(cursor.last())
+        self.assertTrue(cursor.prev())
+        self.assertEqual(cursor.value, 3)
+
+        node = items.append(5)
+        cursor = items.cursor(node)
+        self.assertEqual(cursor.value, 5)
+        self.assertFalse(cursor.next())
+        with self.assertRaises(IndexError):
+            cursor.value
+
+    def test_seek(self) -> None:
+        rng = random.Random(11)
+        expected = sorted(rng.randrange(100) for _ in range(150))
+        cursor = DoublyLinkedList(expected).cursor()
+
+        for key in [rng.randrange(-5, 105) for _ in range(300)]:
+            index = bisect.bisect_left(expected, key)
+            found = cursor.seek(key)
+            self.assertEqual(found, index < len(expected))
+            if found:
+                self.assertEqual(cursor.value, expected[index])
+                self.assertTrue(
+                    cursor.node is not None
+                    and (
+                        cursor.node.previous is None or cursor.node.previous.value < key
+                    )
+                )
+
+        self.assertFalse(DoublyLinkedList().cursor().seek(0))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from data_structures.dynamic_shortest_paths import DynamicShortestPaths
+from data_structures.graph import AdjacencyList as Graph
+
+
+class TestDynamicShortestPaths(unittest.TestCase):
+    def setUp(self) -> None:
+        self.graph = Graph(directed=True)
+        self.graph.add_edges([("a", "b", 4), ("b", "c", 4), ("c", "d", 4), ("x", "a")])
+        self.paths = DynamicShortestPaths(self.graph, ["a", "x"])
+
+    def tearDown(self) -> None:
+        self.paths.close()
+        del self.graph
+        del self.paths
+
+    def test_updates(self) -> None:
+        self.assertEqual(self.paths.distance("a", "d"), 12)
+        self.assertEqual(self.paths.distance("a", "x"), float("inf"))
+
+        self.graph.add("a", "c", 1)
+        self.assertEqual(self.paths.distance("a", "d"), 5)
+        self.assertEqual(self.paths.distance("x", "d"), 5)
+        self.assertEqual(
+            list(self.paths.path("a", "d")), [("a", 0), ("c", 1), ("d", 5)]
+        )
+
+        self.graph.decrease_weight("c", "d", 2)
+        self.assertEqual(self.paths.distance("a", "d"), 3)
+        self.assertEqual(self.paths.tree("x"), dict(self.graph.shortest_path_tree("x")))
+
+        self.graph.add_edges([("d", "e", 1)])
+        self.assertEqual(self.paths.distance("a", "e"), 4)
+
+        self.assertRaises(ValueError, self.graph.decrease_weight, "c", "d", 3)
+        self.assertRaises(ValueError, self.graph.decrease_weight, "d", "c", 1)
+        self.assertRaises(ValueError, self.paths.distance, "b", "d")
+
+        self.paths.close()
+        self.graph.add("a", "d", 0)
+        self.assertEqual(self.paths.distance("a", "d"), 3)
+
+    def test_matches_recomputation(self) -> None:
+        rng = random.Random(11)
+        graph = Graph(directed=True)
+        graph.add_edges(
+            (rng.randrange(40), rng.randrange(40), rng.randint(5, 20))
+            for _ in range(60)
+        )
+        paths = DynamicShortestPaths(graph, [0, 1, 2])
+
+        for _ in range(80):
+            graph.add(rng.randrange(40), rng.randrange(40), rng.randint(1, 20))
+            for source in (0, 1, 2):
+                expected = graph.shortest_path_tree(source)
+                self.assertEqual(paths.tree(source).keys(), expected.keys())
+                for target, (_, cost) in expected.items():
+                    self.assertEqual(paths.distance(source, target), cost)
+
+        paths.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
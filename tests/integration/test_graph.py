@@ -0,0 +1,446 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from data_structures import _numpy
+from data_structures.graph import AdjacencyList as Graph
+from data_structures.graph import AdjacencyMatrix as Matrix
+
+
+class TestAdjacencyList(unittest.TestCase):
+    def setUp(self) -> None:
+        self.graph = Graph(directed=False)
+        a, b, c, d, e = (self.graph.create_vertex(x) for x in "abcde")
+        self.graph.add(a, b, 4)
+        self.graph.add(a, c, 1)
+        self.graph.add(b, c, 2)
+        self.graph.add(b, d, 5)
+        self.graph.add(c, d, 8)
+        self.graph.add(d, e, 3)
+
+    def tearDown(self) -> None:
+        del self.graph
+
+    def tree_weight(self, tree: Graph) -> float:
+        return sum(edge.weight for vertex in tree for edge in tree.edges(vertex)) / 2
+
+    def test_minimum_spanning_tree(self) -> None:
+        for algorithm in ("prim", "kruskal", "boruvka"):
+            tree = self.graph.minimum_spanning_tree(algorithm=algorithm)
+            self.assertEqual(self.tree_weight(tree), 11, algorithm)
+            self.assertEqual(len(list(tree)), 5, algorithm)
+
+        tree = self.graph.minimum_spanning_tree(algorithm="boruvka", processes=2)
+        self.assertEqual(self.tree_weight(tree), 11)
+
+        self.assertRaises(ValueError, self.graph.minimum_spanning_tree, "unknown")
+        self.assertRaises(ValueError, Graph(directed=True).minimum_spanning_tree)
+
+    def test_random_spanning_tree(self) -> None:
+        rng = random.Random(4)
+        graph = Graph(directed=False)
+        edges = [
+            (rng.randrange(60), rng.randrange(60), rng.randint(1, 20))
+            for _ in range(300)
+        ]
+        graph.add_edges(edges)
+
+        # Each undirected edge is scanned once, not once per direction.
+        self.assertEqual(
+            len(graph._indexed_edges()[1]), sum(u != v for u, v, _ in edges)
+        )
+
+        weights = {
+            self.tree_weight(graph.minimum_spanning_tree(algorithm, processes))
+            for algorithm, processes in (
+                ("prim", None),
+                ("kruskal", None),
+                ("boruvka", None),
+                ("boruvka", 3),
+            )
+        }
+        self.assertEqual(len(weights), 1)
+
+    def test_spanning_forest(self) -> None:
+        f = self.graph.create_vertex("f")
+        g = self.graph.create_vertex("g")
+        self.graph.add(f, g, 7)
+
+        for algorithm in ("kruskal", "boruvka"):
+            forest = self.graph.minimum_spanning_tree(algorithm=algorithm)
+            self.assertEqual(self.tree_weight(forest), 18, algorithm)
+            self.assertEqual(forest.weight(f, g), 7)
+
+    def test_traversals(self) -> None:
+        a = self.graph.create_vertex("a")
+        data = lambda vertices: [vertex._data for vertex in vertices]
+
+        self.assertEqual(data(self.graph.bfs(a)), ["a", "b", "c", "d", "e"])
+        self.assertEqual(data(self.graph.bfs(a, max_depth=1)), ["a", "b", "c"])
+        self.assertEqual(data(self.graph.dfs(a)), ["a", "b", "c", "d", "e"])
+        self.assertEqual(data(self.graph.dfs(a, max_depth=1)), ["a", "b", "c"])
+
+        levels = {
+            vertex._data: hops for vertex, hops in self.graph.bfs_levels(a).items()
+        }
+        self.assertEqual(levels, {"a": 0, "b": 1, "c": 1, "d": 2, "e": 3})
+        self.assertEqual(self.graph.freeze().bfs_levels("a"), levels)
+        self.assertEqual(self.graph.freeze().bfs_levels("a", 2)["d"], 2)
+        self.assertNotIn("e", self.graph.freeze().bfs_levels("a", 2))
+
+        self.assertRaises(ValueError, next, self.graph.bfs(Graph().create_vertex("z")))
+
+    def test_deep_traversal(self) -> None:
+        chain = Graph(range(5000))
+        for i in range(4999):
+            chain.add(chain.create_vertex(i), chain.create_vertex(i + 1), 1)
+
+        start = chain.create_vertex(0)
+        self.assertEqual(sum(1 for _ in chain.dfs(start)), 5000)
+        self.assertEqual(chain.freeze().bfs_levels(0)[4999], 4999)
+
+    def test_freeze(self) -> None:
+        frozen = self.graph.freeze()
+
+        self.assertEqual(len(frozen), 5)
+        self.assertEqual(frozen.weight("a", "c"), 1)
+        self.assertEqual(frozen.weight("c", "a"), 1)
+        self.assertIsNone(frozen.weight("a", "e"))
+        self.assertEqual(sorted(frozen.neighbors("d")), ["b", "c", "e"])
+
+    def test_path_cache(self) -> None:
+        a, d, e = (self.graph.create_vertex(x) for x in "ade")
+        calls: list[str] = []
+        original = self.graph._visit_vertecies
+
+        def visit(*args, **kwargs):
+            calls.append("visit")
+            return original(*args, **kwargs)
+
+        self.graph._visit_vertecies = visit  # type: ignore
+        self.graph.enable_path_cache(maxsize=2)
+
+        version = self.graph.version
+        expected = [("a", 0), ("c", 1), ("b", 3), ("d", 8), ("e", 11)]
+        self.assertEqual(list(self.graph.dijkstra(a, e)), expected)
+        self.assertEqual(list(self.graph.dijkstra(a, e)), expected)
+        self.assertEqual(len(calls), 1)
+
+        self.graph.create_vertex("a")
+        self.assertEqual(self.graph.version, version)
+
+        self.graph.add(a, e, 2)
+        self.assertGreater(self.graph.version, version)
+        self.assertEqual(list(self.graph.dijkstra(a, e)), [("a", 0), ("e", 2)])
+        self.assertEqual(len(calls), 2)
+
+        self.graph.a_star(a, d)
+        self.graph.shortest_path_tree(a)
+        self.graph.dijkstra(a, e)
+        self.assertEqual(len(calls), 5, "the oldest entry should have been evicted")
+
+        tree = self.graph.shortest_path_tree(a)
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(tree[e], (a, 2))
+        self.assertNotIn(a, tree)
+
+        stats = self.graph.path_cache_stats
+        assert stats is not None
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (2, 5, 2))
+
+        self.graph.disable_path_cache()
+        self.graph.dijkstra(a, e)
+        self.assertEqual(len(calls), 6)
+        self.assertIsNone(self.graph.path_cache_stats)
+
+    def test_add_edges(self) -> None:
+        graph = Graph(directed=False)
+        a = graph.create_vertex("a")
+        version = graph.version
+
+        self.assertEqual(graph.add_edges([(a, "b", 2), ("b", "c"), ("c", "a", 5)]), 3)
+        self.assertGreater(graph.version, version)
+        self.assertEqual([vertex._data for vertex in graph], ["a", "b", "c"])
+        self.assertEqual(graph.weight(a, graph.create_vertex("b")), 2)
+        self.assertEqual(graph.weight(graph.create_vertex("c"), a), 5)
+        self.assertEqual(
+            graph.weight(graph.create_vertex("c"), graph.create_vertex("b")), 0
+        )
+
+    def test_add_edges_invalidates_path_cache(self) -> None:
+        graph = Graph()
+        graph.add_edges([("a", "b", 5), ("b", "c", 5)])
+        a, c = graph.create_vertex("a"), graph.create_vertex("c")
+        graph.enable_path_cache()
+        self.assertEqual(list(graph.dijkstra(a, c))[-1], ("c", 10))
+
+        def failing():
+            yield ("a", "c", 1)
+            raise ValueError("bad line")
+
+        self.assertRaises(ValueError, graph.add_edges, failing())
+        self.assertEqual(list(graph.dijkstra(a, c)), [("a", 0), ("c", 1)])
+
+        seen: list[list[tuple[str, float]]] = []
+        graph.subscribe(lambda source, *_: seen.append(list(graph.dijkstra(a, c))))
+        graph.add_edges([("a", "c", 0.5)])
+        self.assertEqual(seen, [[("a", 0), ("c", 0.5)]])
+
+    def test_from_edge_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "edges.csv")
+            with open(path, "w") as file:
+                file.write("# source,destination,weight\n1,2,1.5\n2,3,2\n\n3,1,4\n")
+
+            graph = Graph.from_edge_file(path, vertex_type=int, chunk_size=8)
+            self.assertEqual([vertex._data for vertex in graph], [1, 2, 3])
+            self.assertEqual(
+                list(graph.dijkstra(*map(graph.create_vertex, (1, 3)))),
+                [(1, 0), (2, 1.5), (3, 3.5)],
+            )
+
+            with open(path, "w") as file:
+                file.write("a b\nb c 2 extra\n")
+            self.assertRaises(ValueError, Graph.from_edge_file, path, delimiter=None)
+
+    def test_interning(self) -> None:
+        graph = Graph(["x"])
+        x = graph.create_vertex("x")
+        version = graph.version
+
+        self.assertIs(graph.create_vertex("x"), x)
+        self.assertIs(graph.vertex("x"), x)
+        self.assertIs(graph.vertex(Graph().create_vertex("x")), x)
+        self.assertIsNone(graph.vertex("y"))
+        self.assertEqual(graph.version, version)
+
+        graph.add("x", "y", 3)
+        y = graph.vertex("y")
+        assert y is not None
+        self.assertEqual((x.index, y.index), (0, 1))
+        self.assertIs(graph.vertex_at(1), y)
+        self.assertIs(graph.edges("x")[0].destination, y)
+        self.assertEqual(graph.weight("x", "y"), 3)
+        self.assertEqual(graph.weight(x, "y"), 3)
+        self.assertIsNone(graph.weight("y", "x"))
+        self.assertIsNone(graph.edges("z"))
+        self.assertEqual(list(graph.dijkstra("x", "y")), [("x", 0), ("y", 3)])
+        self.assertRaises(ValueError, graph.a_star, "x", "z")
+
+    def test_columnar_storage(self) -> None:
+        graph = Graph(directed=False)
+        graph.add_edges([("x", "y", 2), ("y", "z", 1.5)])
+        x, y = graph.vertex("x"), graph.vertex("y")
+
+        self.assertEqual(list(graph._targets[y.index]), [x.index, 2])
+        self.assertEqual(list(graph._weights[y.index]), [2.0, 1.5])
+
+        edge = graph.edges("x")[0]
+        self.assertEqual(tuple(edge), (x, y, 2.0))
+        self.assertIs(edge.source, x)
+        self.assertFalse(hasattr(edge, "__dict__"))
+
+        view = graph.adjacency_list
+        self.assertEqual(list(view), [x, y, graph.vertex("z")])
+        self.assertEqual(view["y"], tuple(graph.edges("y")))
+        self.assertRaises(KeyError, view.__getitem__, "missing")
+        with self.assertRaises(AttributeError):
+            view["x"].append(edge)  # type: ignore
+        with self.assertRaises(TypeError):
+            view["x"] = []  # type: ignore
+
+    def test_components(self) -> None:
+        graph = Graph(directed=True)
+        graph.add_edges(
+            [(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 4), (6, 5), (7, 8)]
+        )
+        data = lambda components: sorted(
+            sorted(vertex._data for vertex in component) for component in components
+        )
+
+        components = list(graph.strongly_connected_components())
+        self.assertEqual(data(components), [[1, 2, 3], [4, 5], [6], [7], [8]])
+        self.assertEqual(
+            [vertex._data for vertex in components[0]], [5, 4], "sinks come first"
+        )
+        self.assertEqual(
+            data(graph.connected_components()), [[1, 2, 3, 4, 5, 6], [7, 8]]
+        )
+        self.assertEqual(data(self.graph.connected_components()), [list("abcde")])
+
+        self.assertRaises(ValueError, graph.topological_order)
+        self.assertRaises(ValueError, self.graph.topological_order)
+
+        dag = Graph(directed=True)
+        dag.add_edges([("shirt", "tie"), ("tie", "jacket"), ("pants", "shoes")])
+        dag.add_edges([("pants", "belt"), ("belt", "jacket"), ("shirt", "belt")])
+        order = [vertex._data for vertex in dag.topological_order()]
+        self.assertEqual(len(order), 6)
+        for vertex in dag:
+            for edge in dag.edges(vertex):
+                self.assertLess(
+                    order.index(vertex._data), order.index(edge.destination._data)
+                )
+
+    def test_deep_components(self) -> None:
+        chain = Graph(directed=True)
+        chain.add_edges((i, i + 1) for i in range(20000))
+        chain.add(20000, 0)
+
+        self.assertEqual(
+            [len(component) for component in chain.strongly_connected_components()],
+            [20001],
+        )
+
+    def test_dag_paths(self) -> None:
+        dag = Graph(directed=True)
+        dag.add_edges(
+            [
+                ("fetch", "compile", 3),
+                ("fetch", "lint", 1),
+                ("compile", "test", 5),
+                ("lint", "test", 1),
+                ("compile", "package", 2),
+                ("test", "release", 1),
+                ("package", "release", -1),
+            ]
+        )
+
+        tree = dag.dag_shortest_paths("fetch")
+        self.assertEqual(tree[dag.vertex("test")], (dag.vertex("lint"), 2))
+        self.assertEqual(tree[dag.vertex("release")], (dag.vertex("test"), 3))
+        self.assertEqual(
+            list(dag.dag_shortest_path("fetch", "release")),
+            [("fetch", 0), ("lint", 1), ("test", 2), ("release", 3)],
+        )
+        self.assertEqual(
+            list(dag.critical_path()),
+            [("fetch", 0), ("compile", 3), ("test", 8), ("release", 9)],
+        )
+        self.assertRaises(ValueError, dag.dag_shortest_path, "release", "fetch")
+
+        negative = Graph(directed=True)
+        negative.add_edges([("a", "b", -5), ("b", "c", 3)])
+        self.assertEqual(list(negative.critical_path()), [("b", 0), ("c", 3)])
+        negative.add("x", "y", 2)
+        self.assertEqual(list(negative.critical_path()), [("b", 0), ("c", 3)])
+        negative.add("c", "d", -1)
+        self.assertEqual(list(negative.critical_path()), [("b", 0), ("c", 3)])
+
+        dag.add("release", "fetch", 1)
+        self.assertRaises(ValueError, dag.critical_path)
+        self.assertRaises(ValueError, dag.dag_shortest_paths, "fetch", False)
+        self.assertEqual(
+            dag.dag_shortest_paths("fetch"), dag.shortest_path_tree("fetch")
+        )
+
+        single = Graph(["only"])
+        self.assertEqual(list(single.critical_path()), [("only", 0)])
+
+
+class TestAdjacencyMatrix(unittest.TestCase):
+    def setUp(self) -> None:
+        self.edges = [
+            ("a", "b", 4),
+            ("a", "c", 1),
+            ("b", "c", 2),
+            ("b", "d", 5),
+            ("c", "d", 8),
+            ("d", "e", 3),
+        ]
+        self.matrix = Matrix(directed=False)
+        self.graph = Graph(directed=False)
+        for source, destination, weight in self.edges:
+            self.matrix.add(source, destination, weight)
+            self.graph.add(source, destination, weight)
+
+    def tearDown(self) -> None:
+        del self.matrix
+        del self.graph
+
+    def test_structure(self) -> None:
+        self.assertEqual([vertex._data for vertex in self.matrix], list("abcde"))
+        self.assertEqual(self.matrix.weight("a", "b"), 4)
+        self.assertEqual(self.matrix.weight("b", "a"), 4)
+        self.assertIsNone(self.matrix.weight("a", "e"))
+        self.assertIsNone(self.matrix.weight("a", "z"))
+
+        self.matrix.add("a", "b", 9)
+        self.assertEqual(self.matrix.weight("a", "b"), 4, "keeps the cheapest edge")
+
+        self.assertEqual(
+            [(edge.destination._data, edge.weight) for edge in self.matrix.edges("b")],
+            [("a", 4), ("c", 2), ("d", 5)],
+        )
+        neighbors = self.matrix.neighbors(["a", "e"])
+        self.assertEqual(
+            [
+                (vertex._data, weight)
+                for vertex, weight in neighbors[self.matrix.vertex("e")]
+            ],
+            [("d", 3)],
+        )
+        self.assertIn("e: [\n          d, cost: 3.0\n        ]", str(self.matrix))
+
+    def test_paths(self) -> None:
+        for source in "abcde":
+            for destination in "abcde":
+                if source == destination:
+                    continue
+                self.assertEqual(
+                    list(self.matrix.dijkstra(source, destination)),
+                    list(self.graph.dijkstra(source, destination)),
+                )
+
+        self.assertEqual(
+            list(self.matrix.a_star("a", "e", lambda a, b: 0.5)),
+            list(self.graph.dijkstra("a", "e")),
+        )
+
+        distances = self.matrix.all_pairs_shortest_paths()
+        for i, source in enumerate(self.matrix):
+            tree = self.graph.shortest_path_tree(source._data)
+            for j, destination in enumerate(self.matrix):
+                expected = (
+                    0 if i == j else tree[self.graph.vertex(destination._data)][1]
+                )
+                self.assertEqual(distances[i][j], expected)
+
+        directed = Matrix(directed=True)
+        directed.add("x", "y", 1)
+        self.assertEqual(directed.all_pairs_shortest_paths()[1][0], float("inf"))
+        self.assertRaises(ValueError, directed.dijkstra, "y", "x")
+
+    def test_minimum_spanning_tree(self) -> None:
+        for algorithm in ("prim", "kruskal"):
+            tree = self.matrix.minimum_spanning_tree(algorithm)
+            self.assertEqual(
+                sum(edge.weight for vertex in tree for edge in tree.edges(vertex)) / 2,
+                11,
+            )
+        self.assertRaises(ValueError, Matrix(directed=True).minimum_spanning_tree)
+
+    def test_all_pairs_backends(self) -> None:
+        rng = random.Random(2)
+        matrix = Matrix(directed=True)
+        for vertex in range(90):
+            matrix.create_vertex(vertex)
+        for _ in range(400):
+            matrix.add(rng.randrange(90), rng.randrange(90), rng.randrange(1, 20))
+
+        with mock.patch("data_structures._numpy.np", None):
+            expected = matrix.all_pairs_shortest_paths()
+        self.assertEqual(matrix.all_pairs_shortest_paths(), expected)
+
+        if _numpy.np is not None:
+            # Several pivot blocks and row tiles.
+            self.assertEqual(
+                matrix._blocked_floyd_warshall(_numpy.np, block=16, tile_bytes=4096),
+                expected,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
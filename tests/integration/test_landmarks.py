@@ -0,0 +1,88 @@
+import os
+import pickle
+import random
+import tempfile
+import unittest
+
+from data_structures.graph import AdjacencyList as Graph
+from data_structures.landmarks import Landmarks
+
+
+class TestLandmarks(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(3)
+        self.graph = Graph(directed=True)
+        self.graph.add_edges(
+            (rng.randrange(80), rng.randrange(80), rng.randint(1, 9))
+            for _ in range(320)
+        )
+        self.landmarks = self.graph.build_landmarks(4)
+
+    def tearDown(self) -> None:
+        del self.graph
+        del self.landmarks
+
+    def test_heuristic_is_a_lower_bound(self) -> None:
+        self.assertEqual(len(self.landmarks), 4)
+
+        for source in list(self.graph)[:10]:
+            tree = self.graph.shortest_path_tree(source)
+            for target, (_, cost) in tree.items():
+                self.assertLessEqual(self.landmarks(source._data, target._data), cost)
+
+        self.assertEqual(self.landmarks(0, "missing"), 0.0)
+
+    def test_a_star(self) -> None:
+        vertices = list(self.graph)
+        for source in vertices[:10]:
+            for target in vertices[::7]:
+                if source is target:
+                    continue
+                try:
+                    expected = list(self.graph.dijkstra(source, target))
+                except ValueError:
+                    continue
+                path = list(self.graph.a_star(source, target, self.landmarks))
+                self.assertEqual(path[-1][1], expected[-1][1])
+
+    def test_save_load(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "landmarks.alt")
+            self.landmarks.save(path)
+            loaded = Landmarks.load(path)
+
+        self.assertEqual(loaded.landmarks, self.landmarks.landmarks)
+        for a, b in ((0, 5), (7, 3), (40, 41)):
+            self.assertEqual(loaded(a, b), self.landmarks(a, b))
+
+        # Non-JSON vertices are pickled, and loading those has to be opted into.
+        graph = Graph(directed=False)
+        graph.add_edges(((i, "x"), (i + 1, "x"), 1) for i in range(10))
+        landmarks = graph.build_landmarks(2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "landmarks.alt")
+            landmarks.save(path)
+            self.assertRaises(ValueError, Landmarks.load, path)
+            loaded = Landmarks.load(path, allow_pickle=True)
+
+            with open(path, "wb") as file:
+                pickle.dump({"format": 1}, file)
+            self.assertRaises(ValueError, Landmarks.load, path, allow_pickle=True)
+
+        self.assertEqual(loaded((2, "x"), (7, "x")), 5)
+        self.assertEqual(loaded((7, "x"), (2, "x")), 5)
+
+    def test_undirected(self) -> None:
+        graph = Graph(directed=False)
+        graph.add_edges((i, i + 1, 1) for i in range(10))
+        landmarks = graph.build_landmarks(2)
+
+        self.assertEqual(landmarks(2, 7), 5)
+        self.assertEqual(landmarks(7, 2), 5)
+        self.assertEqual(
+            [data for data, _ in graph.a_star(2, 7, landmarks)], [2, 3, 4, 5, 6, 7]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
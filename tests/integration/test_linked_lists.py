@@ -0,0 +1,303 @@
+import random
+import unittest
+
+from data_structures.linked_lists import (
+    DoublyLinkedList,
+    SinglyLinkedList,
+    UnrolledLinkedList,
+    merge_sorted,
+)
+
+
+class TestSinglyLinkedList(unittest.TestCase):
+    def setUp(self) -> None:
+        self.list = SinglyLinkedList(range(5))
+
+    def tearDown(self) -> None:
+        del self.list
+
+    def values(self, items: SinglyLinkedList) -> list[int]:
+        return [node.value for node in items]
+
+    def test_reversed(self) -> None:
+        self.assertEqual([node.value for node in reversed(self.list)], [4, 3, 2, 1, 0])
+        self.assertEqual(list(reversed(SinglyLinkedList())), [])
+
+        long = SinglyLinkedList(range(50_000))
+        self.assertEqual(next(reversed(long)).value, 49_999)
+
+    def test_reverse(self) -> None:
+        self.list.reverse()
+        self.assertEqual(self.values(self.list), [4, 3, 2, 1, 0])
+        self.assertEqual(self.list.remove_last(), 0)
+        self.list.append(9)
+        self.assertEqual(self.values(self.list), [4, 3, 2, 1, 9])
+
+        empty: SinglyLinkedList[int] = SinglyLinkedList()
+        empty.reverse()
+        self.assertFalse(empty)
+
+    def test_remove_last(self) -> None:
+        self.assertEqual(self.list.remove_last(), 4)
+        self.list.push(-1)
+        self.list.append(7)
+        self.assertEqual(self.list.pop(), -1)
+        self.assertEqual(self.list.remove_last(), 7)
+        self.assertEqual(self.list.remove_last(), 3)
+
+        head = next(iter(self.list))
+        self.list.insert(head, 10)
+        self.assertEqual(self.list.remove(head), 10)
+        self.assertEqual(self.list.remove_last(), 2)
+        self.assertEqual(self.values(self.list), [0, 1])
+
+        self.assertEqual(self.list.remove_last(), 1)
+        self.assertEqual(self.list.remove_last(), 0)
+        self.assertIsNone(self.list.remove_last())
+        self.assertFalse(self.list)
+
+        self.list.append(5)
+        self.assertEqual(self.values(self.list), [5])
+
+    def test_len(self) -> None:
+        self.assertEqual(len(self.list), 5)
+        head = next(iter(self.list))
+        self.list.insert(head, 9)
+        self.list.push(-1)
+        self.assertEqual(len(self.list), 7)
+        self.list.remove(head)
+        self.list.remove_last()
+        self.list.pop()
+        self.assertEqual(len(self.list), 4)
+        while self.list:
+            self.list.pop()
+        self.assertEqual(len(self.list), 0)
+        self.list.pop()
+        self.assertEqual(len(self.list), 0)
+
+    def test_splice(self) -> None:
+        self.list.remove_last()
+        other = SinglyLinkedList([7, 8])
+        self.list.extend_list(other)
+        self.assertEqual(self.values(self.list), [0, 1, 2, 3, 7, 8])
+        self.assertEqual((len(self.list), len(other)), (6, 0))
+        self.assertFalse(other)
+        self.assertEqual(self.list.remove_last(), 8)
+
+        head = next(iter(self.list))
+        self.list.splice(head, SinglyLinkedList([5, 6]))
+        self.assertEqual(self.values(self.list), [0, 5, 6, 1, 2, 3, 7])
+
+        rest = self.list.split_after(head)
+        self.assertEqual(self.values(self.list), [0])
+        self.assertEqual(self.values(rest), [5, 6, 1, 2, 3, 7])
+        self.assertEqual((len(self.list), len(rest)), (1, 6))
+        self.assertEqual(rest.remove_last(), 7)
+        self.assertEqual(len(self.list.split_after(head)), 0)
+
+        empty: SinglyLinkedList[int] = SinglyLinkedList()
+        empty.extend_list(rest)
+        empty.append(9)
+        self.assertEqual(self.values(empty), [5, 6, 1, 2, 3, 9])
+        self.assertRaises(AssertionError, empty.extend_list, empty)
+
+
+class TestDoublyLinkedList(unittest.TestCase):
+    def test_len(self) -> None:
+        items = DoublyLinkedList(range(4))
+        self.assertEqual(len(items), 4)
+
+        head = next(iter(items))
+        items.insert(head, 10)
+        items.push(-1)
+        self.assertEqual(len(items), 6)
+        self.assertEqual(items.remove(head), 10)
+        self.assertIsNone(items.remove(items._tail))
+        self.assertEqual(len(items), 5)
+
+        while items:
+            items.remove_last()
+        self.assertEqual(len(items), 0)
+        self.assertIsNone(items.pop())
+        self.assertEqual(len(items), 0)
+
+    def test_node_handles(self) -> None:
+        items: DoublyLinkedList[str] = DoublyLinkedList()
+        b = items.append("b")
+        a = items.push("a")
+        c = items.append("c")
+
+        items.move_to_front(c)
+        self.assertEqual([node.value for node in items], ["c", "a", "b"])
+        self.assertEqual([node.value for node in reversed(items)], ["b", "a", "c"])
+        self.assertEqual(items.unlink(b), "b")
+        self.assertEqual(items.unlink(c), "c")
+        items.move_to_front(a)
+        self.assertEqual([node.value for node in items], ["a"])
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items.unlink(a), "a")
+        self.assertFalse(items)
+        self.assertIsNone(items._tail)
+
+    def test_splice(self) -> None:
+        items = DoublyLinkedList(range(3))
+        items.extend_list(DoublyLinkedList([3, 4]))
+        middle = items.push(-1).next
+        assert middle is not None
+        items.splice(middle, DoublyLinkedList("ab"))
+        self.assertEqual([n.value for n in items], [-1, 0, "a", "b", 1, 2, 3, 4])
+        self.assertEqual(
+            [n.value for n in reversed(items)], [4, 3, 2, 1, "b", "a", 0, -1]
+        )
+        self.assertEqual(len(items), 8)
+
+        rest = items.split_after(middle)
+        self.assertEqual([n.value for n in reversed(items)], [0, -1])
+        self.assertEqual([n.value for n in reversed(rest)], [4, 3, 2, 1, "b", "a"])
+        self.assertEqual((len(items), len(rest)), (2, 6))
+        self.assertIsNone(rest._head.previous)
+        items.splice(middle, rest)
+        self.assertEqual(len(items), 8)
+        self.assertEqual(items.remove_last(), 4)
+
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    def setUp(self) -> None:
+        self.list = UnrolledLinkedList(range(10), capacity=4)
+
+    def tearDown(self) -> None:
+        del self.list
+
+    def assertChunksValid(self, items: UnrolledLinkedList, expected: list) -> None:
+        chunks = list(items.chunks())
+        self.assertEqual(list(items), expected)
+        self.assertEqual(list(reversed(items)), expected[::-1])
+        self.assertEqual(len(items), len(expected))
+        self.assertTrue(all(0 < len(chunk) <= items.capacity for chunk in chunks))
+        for chunk in chunks[1:-1]:
+            self.assertGreaterEqual(len(chunk), items.capacity // 2)
+        for previous, chunk in zip(chunks, chunks[1:]):
+            self.assertIs(chunk.previous, previous)
+
+    def test_ends(self) -> None:
+        self.assertEqual(str(self.list), "[0, 1, 2, 3] <-> [4, 5, 6, 7] <-> [8, 9]")
+        self.list.push(-1)
+        self.assertEqual(self.list.pop(), -1)
+        self.assertEqual(self.list.remove_last(), 9)
+        self.assertEqual(self.list.pop(), 0)
+        self.assertChunksValid(self.list, list(range(1, 9)))
+        self.assertIn(5, self.list)
+        self.assertNotIn(0, self.list)
+
+        while self.list:
+            self.list.remove_last()
+        self.assertIsNone(self.list.pop())
+        self.assertIsNone(self.list.remove_last())
+        self.assertChunksValid(self.list, [])
+
+    def test_insert_remove(self) -> None:
+        self.list.insert(5, 50)
+        self.assertEqual(self.list[5], 50)
+        self.assertEqual(self.list[-1], 9)
+        self.assertEqual(self.list.remove(5), 50)
+        self.assertRaises(IndexError, self.list.insert, 11, 0)
+        self.assertRaises(IndexError, self.list.remove, 10)
+        self.assertRaises(IndexError, self.list.__getitem__, -11)
+
+        rng = random.Random(11)
+        items = UnrolledLinkedList(capacity=6)
+        expected: list[int] = []
+        for step in range(2000):
+            if expected and rng.random() < 0.45:
+                index = rng.randrange(len(expected))
+                self.assertEqual(items.remove(index), expected.pop(index))
+            else:
+                index = rng.randint(0, len(expected))
+                items.insert(index, step)
+                expected.insert(index, step)
+            if step % 50 == 0:
+                self.assertChunksValid(items, expected)
+
+        self.assertChunksValid(items, expected)
+
+
+class TestSorting(unittest.TestCase):
+    def test_sort(self) -> None:
+        rng = random.Random(9)
+        for kind in (SinglyLinkedList, DoublyLinkedList):
+            for size in (0, 1, 2, 7, 100, 1001):
+                pairs = [(rng.randrange(10), i) for i in range(size)]
+                for key, reverse in (
+                    (None, False),
+                    (None, True),
+                    (lambda p: p[0], False),
+                    (lambda p: p[0], True),
+                ):
+                    items = kind(pairs)
+                    nodes = {id(node) for node in items}
+                    items.sort(key=key, reverse=reverse)
+
+                    expected = sorted(pairs, key=key, reverse=reverse)
+                    self.assertEqual([node.value for node in items], expected)
+                    self.assertEqual({id(node) for node in items}, nodes)
+                    self.assertEqual(len(items), size)
+                    if size:
+                        self.assertEqual(items._tail.value, expected[-1])
+                    if kind is DoublyLinkedList:
+                        self.assertEqual(
+                            [node.value for node in reversed(items)], expected[::-1]
+                        )
+
+        # The key is computed once per node, not once per comparison.
+        calls: list[int] = []
+        key = lambda value: calls.append(value) or -value
+        for kind in (SinglyLinkedList, DoublyLinkedList):
+            calls.clear()
+            items = kind(range(500))
+            items.sort(key=key)
+            self.assertEqual([node.value for node in items], list(range(499, -1, -1)))
+            self.assertEqual(len(calls), 500)
+
+            calls.clear()
+            merged = merge_sorted(kind([5, 3, 1]), kind([4, 2]), key=key)
+            self.assertEqual([node.value for node in merged], [5, 4, 3, 2, 1])
+            self.assertEqual(len(calls), 5)
+
+        items = SinglyLinkedList([3, 1, 2])
+        items.remove_last()
+        items.sort()
+        items.append(0)
+        self.assertEqual(items.remove_last(), 0)
+        self.assertEqual(items.remove_last(), 3)
+
+    def test_merge_sorted(self) -> None:
+        for kind in (SinglyLinkedList, DoublyLinkedList):
+            a, b = kind([(1, "a"), (3, "a"), (5, "a")]), kind(
+                [(1, "b"), (2, "b"), (6, "b")]
+            )
+            merged = merge_sorted(a, b, key=lambda p: p[0])
+            self.assertIsInstance(merged, kind)
+            self.assertEqual(
+                [node.value for node in merged],
+                [(1, "a"), (1, "b"), (2, "b"), (3, "a"), (5, "a"), (6, "b")],
+            )
+            self.assertEqual(merged._tail.value, (6, "b"))
+            self.assertEqual((len(merged), len(a), len(b)), (6, 0, 0))
+            self.assertFalse(a)
+
+            merged = merge_sorted(kind([9, 4]), kind([8, 7, 1]), reverse=True)
+            self.assertEqual([node.value for node in merged], [9, 8, 7, 4, 1])
+            self.assertEqual(merged._tail.value, 1)
+            merged.append(0)
+            self.assertEqual(merged.remove_last(), 0)
+            self.assertEqual(merged.remove_last(), 1)
+
+            self.assertEqual([n.value for n in merge_sorted(kind(), kind([2]))], [2])
+
+        self.assertRaises(
+            AssertionError, merge_sorted, SinglyLinkedList(), DoublyLinkedList()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
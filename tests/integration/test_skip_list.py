@@ -0,0 +1,136 @@
+import random
+import threading
+import unittest
+
+from data_structures.skip_list import IndexableSkipList, SkipList
+
+
+class TestIndexableSkipList(unittest.TestCase):
+    def setUp(self) -> None:
+        self.list = IndexableSkipList("abcde", seed=1)
+
+    def tearDown(self) -> None:
+        del self.list
+
+    def test_positions(self) -> None:
+        self.assertEqual(len(self.list), 5)
+        self.assertEqual(self.list[0], "a")
+        self.assertEqual(self.list[-1], "e")
+        self.list.insert_at(2, "x")
+        self.list[0] = "A"
+        self.assertEqual(list(self.list), ["A", "b", "x", "c", "d", "e"])
+        self.assertEqual(self.list.delete_at(-1), "e")
+        del self.list[2]
+        self.assertEqual(str(self.list), "A -> b -> c -> d")
+        self.assertIn("c", self.list)
+
+        self.assertRaises(IndexError, self.list.__getitem__, 4)
+        self.assertRaises(IndexError, self.list.insert_at, 5, "z")
+        self.assertRaises(IndexError, IndexableSkipList().delete_at, 0)
+
+    def test_matches_list(self) -> None:
+        rng = random.Random(5)
+        items: IndexableSkipList[int] = IndexableSkipList(seed=5)
+        expected: list[int] = []
+        for step in range(3000):
+            if expected and rng.random() < 0.4:
+                index = rng.randrange(len(expected))
+                self.assertEqual(items.delete_at(index), expected.pop(index))
+            else:
+                index = rng.randint(0, len(expected))
+                items.insert_at(index, step)
+                expected.insert(index, step)
+
+            if expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(items[index], expected[index])
+
+        self.assertEqual(list(items), expected)
+        self.assertEqual(len(items), len(expected))
+
+
+class TestSkipList(unittest.TestCase):
+    def setUp(self) -> None:
+        self.list = SkipList([5, 1, 9, 3, 7], seed=2)
+
+    def tearDown(self) -> None:
+        del self.list
+
+    def test_ordered_set(self) -> None:
+        self.assertEqual(list(self.list), [1, 3, 5, 7, 9])
+        self.assertIn(7, self.list)
+        self.assertNotIn(4, self.list)
+
+        self.list.insert(4)
+        self.list.insert(4)
+        self.list.remove(1)
+        self.list.remove(100)
+        self.assertEqual(list(self.list), [3, 4, 5, 7, 9])
+        self.assertEqual(len(self.list), 5)
+
+        self.assertEqual(list(self.list.irange(4, 9)), [4, 5, 7])
+        self.assertEqual(list(self.list.irange(6)), [7, 9])
+        self.assertEqual(list(self.list.irange(stop=4)), [3])
+        self.assertEqual(list(self.list.irange(10)), [])
+
+    def test_map(self) -> None:
+        self.list[5] = "five"
+        self.list.insert(2, "two")
+        self.assertEqual(self.list[5], "five")
+        self.assertEqual(self.list.get(2), "two")
+        self.assertIsNone(self.list.get(3))
+        self.assertEqual(self.list.get(4, "missing"), "missing")
+        self.assertRaises(KeyError, self.list.__getitem__, 4)
+        self.assertEqual(
+            list(self.list.items())[:3], [(1, None), (2, "two"), (3, None)]
+        )
+
+        rng = random.Random(8)
+        items: SkipList[int] = SkipList(seed=8)
+        expected: set[int] = set()
+        for _ in range(3000):
+            value = rng.randrange(500)
+            if rng.random() < 0.4:
+                items.remove(value)
+                expected.discard(value)
+            else:
+                items.insert(value)
+                expected.add(value)
+        self.assertEqual(list(items), sorted(expected))
+        self.assertEqual(len(items), len(expected))
+
+    def test_concurrent_readers(self) -> None:
+        items: SkipList[int] = SkipList(range(0, 2000, 2), concurrent=True, seed=4)
+        errors: list[str] = []
+        done = threading.Event()
+
+        def read() -> None:
+            while not done.is_set():
+                values = list(items)
+                if values != sorted(values):
+                    errors.append("iteration out of order")
+                if 1000 not in items:
+                    errors.append("stable value missing")
+
+        def write() -> None:
+            for value in range(1, 2000, 2):
+                items.insert(value)
+            for value in range(1, 2000, 2):
+                items.remove(value)
+
+        readers = [threading.Thread(target=read) for _ in range(3)]
+        writers = [threading.Thread(target=write) for _ in range(2)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(list(items), list(range(0, 2000, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)